@@ -6,24 +6,119 @@ Animation engine for the Chinese Character Reading Application.
 Handles stroke animation and rendering using Make Me A Hanzi data.
 """
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal, Qt
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QBrush
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, QPointF, pyqtSignal, pyqtSlot, Qt
+from PyQt5.QtGui import QPainter, QPainterPath, QPainterPathStroker, QColor, QBrush, QTransform
 import json
 import re
 import random
 
+from core.font_glyphs import font_glyph_path
+from core.stroke_hits import StrokeHitIndex
+from core.timeline import StrokeTimeline
+from core.trace_recorder import tracer
+
+
+def parse_svg_path(path_string):
+    """Parse SVG path string into a QPainterPath with original coordinates.
+    
+    Args:
+        path_string (str): SVG path data from graphics.txt.
+        
+    Returns:
+        QPainterPath: The parsed path in glyph coordinates.
+    """
+    path = QPainterPath()
+    commands = re.findall(r'([MLQCZ])\s*([-\d.,\s]*)', path_string)
+    
+    for cmd, args_str in commands:
+        args = [float(x) for x in re.findall(r'[-+]?\d*\.\d+|\d+', args_str)]
+        if cmd == 'M' and len(args) >= 2:
+            path.moveTo(args[0], args[1])
+        elif cmd == 'L' and len(args) >= 2:
+            path.lineTo(args[0], args[1])
+        elif cmd == 'Q' and len(args) >= 4:
+            path.quadTo(args[0], args[1], args[2], args[3])
+        elif cmd == 'C' and len(args) >= 6:
+            path.cubicTo(args[0], args[1], args[2], args[3], args[4], args[5])
+        elif cmd == 'Z':
+            path.closeSubpath()
+    return path
+
+
+# 混色模式的调色板，按笔画顺序循环使用
+MIXED_PALETTE = ("#E53935", "#FB8C00", "#FDD835", "#43A047", "#1E88E5", "#3949AB", "#8E24AA")
+
+# 未写笔画（背景字）的填充
+OUTLINE_BRUSH = QBrush(QColor(210, 210, 210))
+
+# 点击笔画时重播该笔的颜色、帧间隔（毫秒）和笔锋半径（字框 1024）
+REPLAY_BRUSH = QBrush(QColor(30, 136, 229))
+REPLAY_FRAME_MS = 30
+REPLAY_RADIUS = 80
+
+# 播放时时钟最长的唤醒间隔（毫秒），用于更新进度条
+POSITION_STEP_MS = 100
+
+_palette_cache = {}
+
+
+def stroke_palette(config_manager):
+    """Get the brushes strokes are filled with.
+    
+    Stroke k uses brushes[k % len(brushes)]. The tuple is built once per
+    colour setting and shared, so painting allocates no brushes.
+    
+    Args:
+        config_manager: The configuration manager.
+        
+    Returns:
+        tuple: QBrush per palette entry, a single one unless mixed colours are on.
+    """
+    key = (config_manager.get("stroke_color", "#FF0000"),
+           bool(config_manager.get("is_mixed_color", False)))
+    brushes = _palette_cache.get(key)
+    if brushes is None:
+        colors = MIXED_PALETTE if key[1] else (key[0],)
+        brushes = tuple(QBrush(QColor(color)) for color in colors)
+        _palette_cache[key] = brushes
+    return brushes
+
+
+def glyph_transform(width, height):
+    """Map Make Me A Hanzi glyph coordinates into a width x height area.
+    
+    The glyph is centred, flipped (the data has Y pointing up) and scaled
+    to 90% of the shorter side.
+    
+    Args:
+        width (float): Width of the drawing area.
+        height (float): Height of the drawing area.
+        
+    Returns:
+        QTransform: The glyph to device transform.
+    """
+    scale = min(width, height) * 0.9  # 使用90%的窗口空间
+    transform = QTransform()
+    transform.translate(width / 2, height / 2)    # 原点移到绘制区域中心
+    transform.scale(scale / 1024, -scale / 1024)  # Y轴翻转并缩放
+    transform.translate(-512, -412)               # 中心对齐原始坐标系，根据控件微调
+    return transform
+
+
 class StrokeInfo:
     """Stores information about a character stroke."""
     
-    def __init__(self, path, visible=False):
+    def __init__(self, path, visible=False, brush=None):
         """Initialize a stroke.
         
         Args:
             path (QPainterPath): The path representing the stroke.
             visible (bool): Whether the stroke is visible.
+            brush (QBrush, optional): Fill of the stroke, set by the engine.
         """
         self.path = path
         self.visible = visible
+        self.brush = brush
 
 
 class AnimationEngine(QObject):
@@ -35,26 +130,51 @@ class AnimationEngine(QObject):
     animation_completed = pyqtSignal()
     # Signal emitted when a new stroke is shown (for pronunciation)
     stroke_added = pyqtSignal()
+    # Signal emitted with (elapsed, duration) in ms while the timeline moves
+    position_changed = pyqtSignal(int, int)
 
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, loader=None):
         """Initialize the animation engine.
         
         Args:
             config_manager: The configuration manager.
+            loader (CharacterLoader, optional): Loads stroke geometry in the
+                background. Without it strokes are loaded synchronously.
         """
         super().__init__()
         self.config_manager = config_manager
+        self.loader = loader
+        if loader is not None:
+            loader.geometry_ready.connect(self.on_geometry_ready)
         self.current_character = ""
+        self.is_loading = False  # 等待后台加载笔画数据
+        self.stroke_types = None  # StrokeTypeIndex，有则混色按笔画类型着色
+        self.tracing = False  # 描红练习：不自动播放，由 reveal_stroke() 逐笔显示
         self.strokes = []
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_next_stroke)
-        self.display_timer = QTimer()
-        self.display_timer.timeout.connect(self.start_stroke_animation)
-        
-        self.animation_count = 0
-        self.target_animation_count = self.config_manager.get("animation_count", 3)
-        self.is_animating = False
+        
+        # 动画状态完全由时间轴上的已播放时间决定，单个时钟驱动
+        self.timeline = StrokeTimeline(0, 1000, 0, 1)
+        self.elapsed_base = 0  # 暂停或跳转时记录的已播放时间（毫秒）
+        self.stopwatch = QElapsedTimer()  # 播放中时计时，暂停时无效
+        self.shown_state = None  # 上次应用的 (repeat, visible)
+        self.clock = QTimer()
+        self.clock.setSingleShot(True)
+        self.clock.timeout.connect(self.apply_time)
         self.background_path = QPainterPath()  # 添加背景路径存储
+        self.hit_index = StrokeHitIndex([])  # 点击命中笔画，随汉字构建
+        self.font_glyph = None  # 无笔画数据时用字体字形显示
+        
+        # 重播单个笔画：沿中线逐帧扩大的裁剪区域
+        self.replay_index = -1
+        self.replay_points = []
+        self.replay_step = 0
+        self.replay_timer = QTimer()
+        self.replay_timer.timeout.connect(self.advance_replay)
+        
+        # 笔画颜色在设置汉字时分配，设置变化时重新分配
+        self.palette = stroke_palette(config_manager)
+        self.config_manager.config_updated.connect(self.update_palette)
+        self.config_manager.config_updated.connect(self.update_font_glyph)
 
     def set_character(self, character):
         """Set the current character for animation.
@@ -62,55 +182,200 @@ class AnimationEngine(QObject):
         Args:
             character (str): The character to animate.
         """
-        self.current_character = character
-        self.reset_animation()
-        self.prepare_strokes()
+        with tracer.span("set_character", char=character):
+            self.current_character = character
+            self.reset_animation()
+            self.stop_replay()
+            self.hit_index = StrokeHitIndex([])
+            self.font_glyph = None
+            
+            if self.loader is not None:
+                # 不阻塞界面：数据到达前不显示旧字的笔画
+                self.strokes = []
+                self.background_path = QPainterPath()
+                self.is_loading = True
+                self.animation_updated.emit()
+                self.loader.request(character)
+                return
+            
+            self.prepare_strokes()
+        
+        self.show_strokes()
+    
+    @pyqtSlot(str, object)
+    def on_geometry_ready(self, character, paths):
+        """Start animating once the loader delivered the stroke geometry.
+        
+        Args:
+            character (str): The loaded character.
+            paths (list): QPainterPath per stroke.
+        """
+        if character != self.current_character:
+            return
+        self.is_loading = False
+        self.strokes = [StrokeInfo(path, False) for path in paths]
+        if not self.strokes:
+            print(f"No stroke data available for '{character}', showing the font glyph")
+        self.show_strokes()
+    
+    def assign_colors(self):
+        """Give every stroke its brush from the current palette.
         
+        With mixed colours and a stroke type index, strokes of the same
+        type share a colour; otherwise colours follow the stroke order.
+        """
+        keys = range(len(self.strokes))
+        if self.stroke_types is not None and len(self.palette) > 1:
+            codes = self.stroke_types.codes_of(self.current_character)
+            if len(codes) == len(self.strokes):
+                keys = codes.tolist()
+        for key, stroke in zip(keys, self.strokes):
+            stroke.brush = self.palette[key % len(self.palette)]
+    
+    def update_palette(self):
+        """Re-assign stroke brushes when the colour settings changed."""
+        palette = stroke_palette(self.config_manager)
+        if palette is self.palette:
+            return
+        self.palette = palette
+        self.assign_colors()
+        self.animation_updated.emit()
+    
+    def update_font_glyph(self):
+        """Use the font outline for a character without stroke data.
+        
+        Also called when the settings change, so a font switch shows at once.
+        """
+        if self.strokes or self.is_loading or not self.current_character:
+            return
+        glyph = font_glyph_path(self.config_manager.get("font_family", "SimHei"),
+                                self.current_character)
+        if glyph is not self.font_glyph:
+            self.font_glyph = glyph
+            self.animation_updated.emit()
+    
+    @property
+    def is_animating(self):
+        """Whether the timeline is playing."""
+        return self.stopwatch.isValid()
+    
+    @property
+    def is_paused(self):
+        """Whether the timeline is paused before its end."""
+        return not self.stopwatch.isValid() and 0 < self.elapsed() < self.timeline.duration
+    
+    def elapsed(self):
+        """Get the current position on the timeline in milliseconds."""
+        if self.stopwatch.isValid():
+            return self.elapsed_base + self.stopwatch.elapsed()
+        return self.elapsed_base
+    
+    def show_strokes(self):
+        """Build the background from the prepared strokes and start animating."""
+        self.assign_colors()
         # 构建背景路径
         self.background_path = QPainterPath()
         for stroke in self.strokes:
             self.background_path.addPath(stroke.path)
         # 填充背景路径为浅灰色
         self.background_path.setFillRule(Qt.WindingFill)
+        self.hit_index = StrokeHitIndex([stroke.path for stroke in self.strokes])
+        self.font_glyph = None
+        self.update_font_glyph()
         
-        self.animation_count = 0
-        
-        self.start_stroke_animation()
+        if not self.tracing:
+            self.start_stroke_animation()
         # Signal to update the display
         self.animation_updated.emit()
+    
+    def set_tracing(self, enabled):
+        """Switch between automatic animation and tracing practice.
+        
+        Args:
+            enabled (bool): True to stop the animation and show only the
+                outline, so that strokes appear as they are traced.
+        """
+        self.tracing = enabled
+        self.reset_animation()
+        if not enabled and self.strokes:
+            self.start_stroke_animation()
+        self.animation_updated.emit()
+    
+    def reveal_stroke(self, index):
+        """Show one stroke, used when it was traced correctly.
+        
+        Args:
+            index (int): Stroke index.
+        """
+        if 0 <= index < len(self.strokes):
+            self.strokes[index].visible = True
+            self.animation_updated.emit()
 
+    def stroke_at(self, x, y):
+        """Find the stroke at a point.
+        
+        Args:
+            x (float): X in glyph coordinates.
+            y (float): Y in glyph coordinates.
+            
+        Returns:
+            int: Stroke index, or -1 if no stroke is there.
+        """
+        return self.hit_index.stroke_at(x, y)
+    
+    def replay_stroke(self, index):
+        """Write one stroke again along its median, over the running animation.
+        
+        Args:
+            index (int): Stroke index.
+        """
+        from core.medians import resample  # NumPy 只在用到时加载
+        
+        data = self.load_hanzi_data(self.current_character) or {}
+        medians = data.get('medians') or []
+        if not 0 <= index < min(len(medians), len(self.strokes)):
+            return
+        self.replay_index = index
+        self.replay_points = [tuple(point) for point in resample(medians[index]).tolist()]
+        self.replay_step = 0
+        self.replay_timer.start(REPLAY_FRAME_MS)
+        self.animation_updated.emit()
+    
+    def advance_replay(self):
+        """Extend the replayed stroke by one median point, then hold it briefly."""
+        self.replay_step += 1
+        if self.replay_step > len(self.replay_points) + 1000 // REPLAY_FRAME_MS:
+            self.stop_replay()
+        self.animation_updated.emit()
+    
+    def stop_replay(self):
+        """Remove the replayed stroke."""
+        self.replay_timer.stop()
+        self.replay_index = -1
+        self.replay_points = []
+    
     def load_hanzi_data(self, character):
         """Load stroke data from graphics.txt for a given character."""
-        try:
-            with open('assets/graphics.txt', 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = json.loads(line.strip())
-                    if data.get('character') == character:
-                        return data
-            print(f"No data found for character '{character}' in graphics.txt")
-            return None
-        except Exception as e:
-            print(f"Error loading graphics.txt: {e}")
-            return None
+        with tracer.span("load_hanzi_data", char=character):
+            if self.loader is not None:
+                return self.loader.hanzi_data.get_graphics(character)
+            
+            graphics_path = self.config_manager.get("graphics_path", "assets/graphics.txt")
+            try:
+                with open(graphics_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        data = json.loads(line.strip())
+                        if data.get('character') == character:
+                            return data
+                print(f"No data found for character '{character}' in graphics.txt")
+                return None
+            except Exception as e:
+                print(f"Error loading graphics.txt: {e}")
+                return None
 
     def parse_svg_path(self, path_string):
         """Parse SVG path string into a QPainterPath with original coordinates."""
-        path = QPainterPath()
-        commands = re.findall(r'([MLQCZ])\s*([-\d.,\s]*)', path_string)
-        
-        for cmd, args_str in commands:
-            args = [float(x) for x in re.findall(r'[-+]?\d*\.\d+|\d+', args_str)]
-            if cmd == 'M' and len(args) >= 2:
-                path.moveTo(args[0], args[1])
-            elif cmd == 'L' and len(args) >= 2:
-                path.lineTo(args[0], args[1])
-            elif cmd == 'Q' and len(args) >= 4:
-                path.quadTo(args[0], args[1], args[2], args[3])
-            elif cmd == 'C' and len(args) >= 6:
-                path.cubicTo(args[0], args[1], args[2], args[3], args[4], args[5])
-            elif cmd == 'Z':
-                path.closeSubpath()
-        return path
+        return parse_svg_path(path_string)
 
     def prepare_strokes(self):
         """Prepare stroke paths for the current character using Make Me A Hanzi data."""
@@ -121,74 +386,124 @@ class AnimationEngine(QObject):
         
         hanzi_data = self.load_hanzi_data(self.current_character)
         if not hanzi_data or 'strokes' not in hanzi_data:
-            print(f"No stroke data available for '{self.current_character}'")
+            print(f"No stroke data available for '{self.current_character}', showing the font glyph")
             return
         
-        for stroke in hanzi_data['strokes']:
-            path = self.parse_svg_path(stroke)
-            if not path.isEmpty():
-                self.strokes.append(StrokeInfo(path, False))
+        with tracer.span("prepare_strokes", strokes=len(hanzi_data['strokes'])):
+            for stroke in hanzi_data['strokes']:
+                path = self.parse_svg_path(stroke)
+                if not path.isEmpty():
+                    self.strokes.append(StrokeInfo(path, False))
         
         print(f"Prepared {len(self.strokes)} strokes for '{self.current_character}'")
 
     def reset_animation(self):
-        """Reset the animation state."""
-        self.animation_timer.stop()
-        self.display_timer.stop()
-        self.is_animating = False
+        """Stop the animation and hide all strokes."""
+        self.clock.stop()
+        self.stopwatch.invalidate()
+        self.elapsed_base = 0
+        self.shown_state = None
         
         # Reset all strokes to invisible
         for stroke in self.strokes:
             stroke.visible = False
+        self.position_changed.emit(0, self.timeline.duration)
 
     def start_stroke_animation(self):
-        """Start the stroke animation sequence."""
-        self.is_animating = True
-        self.display_timer.stop()
-        
-        # Increment animation count
-        self.animation_count += 1
-        
-        if self.animation_count > self.target_animation_count:
-            # Animation sequence complete
-            self.animation_completed.emit()
-            return  # 结束动画，不再重置笔画可见性
+        """Play the current character from the start.
         
-        # Reset all strokes to invisible
-        for stroke in self.strokes:
-            stroke.visible = False
-        
-        # Start animation timer
-        interval = self.config_manager.get("animation_interval", 1000)
-        self.animation_timer.start(interval)
+        The timeline is rebuilt from the current settings, so changed
+        intervals and repeat counts apply from the next character on.
+        """
+        self.timeline = StrokeTimeline(
+            len(self.strokes),
+            self.config_manager.get("animation_interval", 1000),
+            self.config_manager.get("display_time", 3000),
+            self.config_manager.get("animation_count", 3))
+        self.reset_animation()
+        self.resume()
+
+    def pause(self):
+        """Freeze the animation at the current position."""
+        if self.stopwatch.isValid():
+            self.elapsed_base = self.elapsed()
+            self.stopwatch.invalidate()
+            self.clock.stop()
+            self.position_changed.emit(self.elapsed_base, self.timeline.duration)
+
+    def resume(self):
+        """Continue the animation from the current position."""
+        if self.tracing or self.stopwatch.isValid() or self.elapsed_base >= self.timeline.duration:
+            return
+        self.stopwatch.start()
+        self.apply_time()
+
+    def toggle_pause(self):
+        """Pause a playing animation, resume a paused one or replay a finished one."""
+        if self.stopwatch.isValid():
+            self.pause()
+        elif self.elapsed_base >= self.timeline.duration:
+            self.start_stroke_animation()
+        else:
+            self.resume()
+
+    def seek(self, elapsed):
+        """Jump to a position; a playing animation keeps playing from there.
         
-        # Signal to update the display
-        self.animation_updated.emit()
+        Args:
+            elapsed (int): Milliseconds since the start of the timeline.
+        """
+        playing = self.stopwatch.isValid()
+        self.elapsed_base = min(max(0, int(elapsed)), self.timeline.duration)
+        if playing:
+            self.stopwatch.start()
+        self.apply_time(seeking=True)
 
-    def animate_next_stroke(self):
+    def step(self, delta):
+        """Pause and move by whole strokes within the current repeat.
+        
+        Args:
+            delta (int): Strokes to move, negative to step back.
         """
-            Animate the next stroke in sequence.
-            connected with timer, after time out, execute automatically.
+        self.pause()
+        repeat, visible = self.timeline.state(self.elapsed())
+        if repeat >= self.timeline.repeats:
+            repeat, visible = self.timeline.repeats - 1, self.timeline.strokes
+        elif visible == 0 and self.elapsed() % self.timeline.cycle >= self.timeline.writing:
+            visible = self.timeline.strokes  # 停留阶段按写完计算
+        self.seek(self.timeline.stroke_time(repeat, visible + delta))
+
+    def apply_time(self, seeking=False):
+        """Show the state of the current position and schedule the next change.
+        
+        Args:
+            seeking (bool): True when the position was set by the user;
+                no stroke_added or completion signals are sent then.
         """
-        # Find the next invisible stroke
-        for stroke in self.strokes:
-            if not stroke.visible:
-                stroke.visible = True
+        elapsed = self.elapsed()
+        state = self.timeline.state(elapsed)
+        if state != self.shown_state:
+            previous = self.shown_state
+            self.shown_state = state
+            for number, stroke in enumerate(self.strokes):
+                stroke.visible = number < state[1]
+            if not seeking and state[1] > 0 and (previous is None or state[1] > previous[1]):
                 self.stroke_added.emit()
-                self.animation_updated.emit()
-                return
+            self.animation_updated.emit()
         
-        # All strokes are visible, end of sequence
-        self.animation_timer.stop()
+        self.position_changed.emit(min(elapsed, self.timeline.duration), self.timeline.duration)
         
-        self.is_animating = False
-        # Start next animation round after a delay
-        for stroke in self.strokes:
-            stroke.visible = False  # 这里可以选择重置可见性，True则保持为笔画着色
-        
-        # Set the aftertaste time after all strokes are displayed, 
-        # and then re-display this/next the Chinese character animation.
-        self.display_timer.start(self.config_manager.get("display_time", 3000))
+        if not self.stopwatch.isValid():
+            return
+        next_change = self.timeline.next_change(elapsed)
+        if next_change is None:
+            # Animation sequence complete
+            self.elapsed_base = self.timeline.duration
+            self.stopwatch.invalidate()
+            self.animation_completed.emit()
+            return
+        # 进度条需要平滑移动，最长 POSITION_STEP_MS 唤醒一次
+        self.clock.start(max(1, min(next_change - elapsed, POSITION_STEP_MS)))
 
     def render(self, painter, rect):
         """Render the current animation state.
@@ -198,32 +513,41 @@ class AnimationEngine(QObject):
             rect (QRect): The rectangle to render in.
         """
         if not self.strokes:
+            if self.font_glyph is not None:
+                # 无笔画数据：静态显示字体字形
+                painter.save()
+                painter.setWorldTransform(glyph_transform(rect.width(), rect.height()), True)
+                painter.fillPath(self.font_glyph, self.palette[0])
+                painter.restore()
             return
         
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
         
         # ==== 核心坐标系调整 ====
-        scale = min(rect.width(), rect.height()) * 0.9  # 使用90%的窗口空间
-        offset_x = rect.width() / 2
-        offset_y = rect.height() / 2
-        
-        # 坐标系变换
-        painter.translate(offset_x, offset_y)          # 原点移到绘制区域中心
-        painter.scale(scale / 1024, -scale / 1024)    # Y轴翻转并缩放
-        painter.translate(-512, -412)                # 中心对齐原始坐标系，根据控件微调
+        painter.setWorldTransform(glyph_transform(rect.width(), rect.height()), True)
         
         # 填充背景路径为浅灰色
-        painter.fillPath(self.background_path, QColor(210, 210, 210))  # 浅灰色填充
-        
-        # 设置绘制样式
-        stroke_color = QColor(self.config_manager.get_stroke_color())
-        brush = QBrush(stroke_color)  # 创建填充笔刷
-        painter.setBrush(brush)  # 设置填充笔刷
+        painter.fillPath(self.background_path, OUTLINE_BRUSH)
         
-        # 绘制可见笔画
+        # 绘制可见笔画，笔刷已在设置汉字时分配
         for stroke in self.strokes:
             if stroke.visible:
-                painter.drawPath(stroke.path)  # 使用填充笔刷绘制路径
+                painter.setBrush(stroke.brush)
+                painter.drawPath(stroke.path)
+        
+        if 0 <= self.replay_index < len(self.strokes):
+            # 已写到的那段中线加粗后作为裁剪区域
+            points = self.replay_points[:self.replay_step + 1]
+            written = QPainterPath(QPointF(*points[0]))
+            for x, y in points[1:]:
+                written.lineTo(x, y)
+            stroker = QPainterPathStroker()
+            stroker.setWidth(2 * REPLAY_RADIUS)
+            stroker.setCapStyle(Qt.RoundCap)
+            clip = stroker.createStroke(written)
+            clip.addEllipse(QPointF(*points[0]), REPLAY_RADIUS, REPLAY_RADIUS)
+            painter.setClipPath(clip)
+            painter.fillPath(self.strokes[self.replay_index].path, REPLAY_BRUSH)
         
         painter.restore()
\ No newline at end of file
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Auto-play for the Chinese Character Reading Application.
+Advances through the characters on its own, keeping the next few ready so
+that unattended classroom display has no loading gaps.
+"""
+
+from PyQt5.QtCore import QObject
+
+
+class AutoPlayer(QObject):
+    """Playlist over the current browsing order with a prefetch pipeline.
+
+    The playlist follows the order of the character manager (original,
+    shuffled or filtered) and wraps around at the end. The next `depth`
+    characters always have their stroke geometry in the loader cache, and
+    the speech backend is created before the first pronunciation. Word
+    pictures are prefetched by the main window like in manual browsing.
+    """
+
+    def __init__(self, character_manager, character_loader, speech_engine, depth=3):
+        """Initialize the auto-player.
+
+        Args:
+            character_manager (CharacterManager): Source of the order.
+            character_loader (CharacterLoader): Geometry cache to fill.
+            speech_engine (SpeechEngine): Speech backend to warm up.
+            depth (int): Number of characters kept ready ahead.
+        """
+        super().__init__()
+        self.character_manager = character_manager
+        self.character_loader = character_loader
+        self.speech_engine = speech_engine
+        self.depth = depth
+        self.enabled = False
+
+    def playlist(self):
+        """Get the characters that play next.
+
+        Returns:
+            list: Up to depth characters in playing order, wrapping around.
+        """
+        return self.character_manager.get_upcoming_characters(self.depth, wrap=True)
+
+    def refill(self):
+        """Make sure the next characters are ready; does nothing when disabled."""
+        if not self.enabled:
+            return
+        self.character_loader.prefetch(self.playlist())
+        self.speech_engine.warm_up()
+
+    def advance(self):
+        """Move to the next character of the playlist.
+
+        Returns:
+            str: The new current character, empty if there are none.
+        """
+        return self.character_manager.next_character(wrap=True)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bulk importer for the Chinese Character Reading Application.
+Streams characters from text or YAML lists and adds them to the library
+in a single write.
+"""
+
+import os
+import yaml
+
+from core.character_manager import is_chinese_character
+
+
+class ImportResult:
+    """Outcome of a bulk import."""
+
+    def __init__(self):
+        """Initialize an empty result."""
+        self.added = {}          # group -> list of new characters
+        self.duplicates = []     # already in the library or repeated in the list
+        self.missing_strokes = []  # no entry in graphics.txt
+        self.invalid = []        # not a Chinese character
+
+    def added_count(self):
+        """Get the number of characters added.
+
+        Returns:
+            int: Number of new characters.
+        """
+        return sum(len(chars) for chars in self.added.values())
+
+    def summary(self):
+        """Get a one-line, human readable summary.
+
+        Returns:
+            str: The summary.
+        """
+        text = (f"Added {self.added_count()} characters, "
+                f"skipped {len(self.duplicates)} duplicates")
+        if self.missing_strokes:
+            text += f", {len(self.missing_strokes)} without stroke data"
+        if self.invalid:
+            text += f", {len(self.invalid)} invalid entries"
+        return text + "."
+
+
+def _iter_text_list(path, group_name):
+    """Yield (character, group) pairs from a plain text list.
+
+    Every Chinese character in the file is an entry. A line of the form
+    "[分组名]" switches the group for the lines that follow, and lines
+    starting with '#' are comments.
+    """
+    group = group_name
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('[') and line.endswith(']'):
+                group = line[1:-1].strip() or group_name
+                continue
+            for char in line:
+                if not char.isspace():
+                    yield char, group
+
+
+def _iter_yaml_list(path, group_name):
+    """Yield (character, group) pairs from a YAML list.
+
+    Accepts the characters.yaml layout ({'groups': [...]}), a mapping of
+    group name to characters, or a flat list of characters; anything else
+    raises ValueError with a readable message.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or []
+
+    def entries(items, group):
+        if items is None:
+            return
+        if isinstance(items, str):
+            items = [items]
+        elif not isinstance(items, list):
+            raise ValueError(f"{path}: characters of group '{group}' must be "
+                             f"a list or a string, not {type(items).__name__}")
+        for item in items:
+            if isinstance(item, dict):
+                item = item.get('character', '')
+            for char in str(item).strip():
+                yield char, group
+
+    if isinstance(data, dict) and 'groups' in data:
+        groups = data['groups'] or []
+        if not isinstance(groups, list):
+            raise ValueError(f"{path}: 'groups' must be a list")
+        for group in groups:
+            if not isinstance(group, dict):
+                raise ValueError(f"{path}: every group must be a mapping with "
+                                 f"'name' and 'characters', got {group!r}")
+            yield from entries(group.get('characters'), group.get('name') or group_name)
+    elif isinstance(data, dict):
+        for name, items in data.items():
+            yield from entries(items, str(name))
+    elif isinstance(data, (list, str)):
+        yield from entries(data, group_name)
+    else:
+        raise ValueError(f"{path}: expected a list of characters or a mapping "
+                         f"of groups, not {type(data).__name__}")
+
+
+def iter_import_list(path, group_name="基础汉字"):
+    """Stream (character, group) pairs from a character list file.
+
+    Args:
+        path (str): A .txt or .yaml/.yml file.
+        group_name (str): Group for entries that do not name their own.
+
+    Returns:
+        iterator: (character, group) pairs in file order.
+    """
+    if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+        return _iter_yaml_list(path, group_name)
+    return _iter_text_list(path, group_name)
+
+
+def import_characters(character_manager, path, group_name="基础汉字",
+                      require_strokes=True):
+    """Import a character list into the library with one YAML write.
+
+    Args:
+        character_manager: The character manager.
+        path (str): The list file.
+        group_name (str): Default group for the new characters.
+        require_strokes (bool): Skip characters without stroke data.
+
+    Returns:
+        ImportResult: What was added and what was skipped.
+    """
+    result = ImportResult()
+    index = character_manager.index
+    hanzi_data = index.hanzi_data
+    seen = set()
+
+    for char, group in iter_import_list(path, group_name):
+        if not is_chinese_character(char):
+            result.invalid.append(char)
+            continue
+        if char in seen or char in index:
+            result.duplicates.append(char)
+            continue
+        seen.add(char)
+
+        if require_strokes and hanzi_data is not None and not hanzi_data.has_strokes(char):
+            result.missing_strokes.append(char)
+            continue
+
+        result.added.setdefault(group, []).append(char)
+
+    if result.added:
+        character_manager.add_characters(result.added)
+    return result
@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Character index for the Chinese Character Reading Application.
+Precomputed inverted indexes (group, stroke count, radical, pinyin prefix)
+over the character library, maintained incrementally.
+"""
+
+import unicodedata
+
+
+def normalize_pinyin(pinyin):
+    """Normalize a pinyin syllable for prefix lookup.
+
+    Tone marks and tone digits are removed and 'ü' is written as 'v',
+    so "lǜ", "lv4" and "LV" all become "lv".
+
+    Args:
+        pinyin (str): The pinyin syllable.
+
+    Returns:
+        str: The normalized, lower-case syllable.
+    """
+    text = unicodedata.normalize('NFD', pinyin.strip().lower())
+    text = text.replace('u\u0308', 'v').replace('u:', 'v')
+    return ''.join(c for c in text if 'a' <= c <= 'z')
+
+
+class PinyinTrie:
+    """Prefix tree mapping normalized pinyin to characters."""
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self.root = {}
+
+    def insert(self, key, character):
+        """Add a character under a pinyin key.
+
+        Args:
+            key (str): Normalized pinyin.
+            character (str): The character.
+        """
+        node = self.root
+        for c in key:
+            node = node.setdefault(c, {})
+        # 终止节点用空字符串键保存字符集合（保持插入顺序）
+        node.setdefault('', {})[character] = None
+
+    def remove(self, key, character):
+        """Remove a character from a pinyin key.
+
+        Args:
+            key (str): Normalized pinyin.
+            character (str): The character.
+        """
+        path = []
+        node = self.root
+        for c in key:
+            if c not in node:
+                return
+            path.append((node, c))
+            node = node[c]
+
+        chars = node.get('')
+        if chars is None:
+            return
+        chars.pop(character, None)
+        if chars:
+            return
+
+        # 清理空分支
+        del node['']
+        for parent, c in reversed(path):
+            if parent[c]:
+                break
+            del parent[c]
+
+    def find_prefix(self, prefix):
+        """Find all characters whose pinyin starts with a prefix.
+
+        Args:
+            prefix (str): Normalized pinyin prefix.
+
+        Returns:
+            list: Matching characters, exact matches first.
+        """
+        node = self.root
+        for c in prefix:
+            node = node.get(c)
+            if node is None:
+                return []
+
+        result = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key in sorted(current, reverse=True):
+                if key == '':
+                    result.update(current[''])
+                else:
+                    stack.append(current[key])
+        return list(result)
+
+
+class CharacterIndex:
+    """Inverted indexes over the character library.
+
+    Buckets keep characters in library order, and every index can be
+    updated one character at a time when the library changes. The group
+    index is built right away; the stroke count, radical and pinyin
+    indexes need a lookup in the stroke and dictionary data for every
+    character, so they are built on their first query.
+    """
+
+    def __init__(self, hanzi_data=None):
+        """Initialize the index.
+
+        Args:
+            hanzi_data (HanziDataStore, optional): Source of stroke counts,
+                radicals and pinyin. Only the group index is built without it.
+        """
+        self.hanzi_data = hanzi_data
+        self.clear()
+
+    def clear(self):
+        """Remove all entries."""
+        self._groups = {}        # group -> {char: None}
+        self._stroke_counts = {}  # count -> {char: None}
+        self._radicals = {}      # radical -> {char: None}
+        self._pinyin = PinyinTrie()
+        self._entries = {}       # char -> group
+        self._metadata = {}      # char -> (stroke_count, radical, pinyins)
+        self._metadata_ready = False
+
+    def build(self, characters, character_data):
+        """Rebuild all indexes from the library.
+
+        Only the group index is filled here; see _ensure_metadata().
+
+        Args:
+            characters (list): Characters in library order.
+            character_data (dict): Character info keyed by character.
+        """
+        self.clear()
+        for char in characters:
+            self.add(char, character_data.get(char, {}))
+
+    def _lookup_metadata(self, character):
+        """Get stroke count, radical and pinyin of a character.
+
+        Returns:
+            tuple: (stroke_count, radical, list of normalized pinyin).
+        """
+        if self.hanzi_data is None:
+            return 0, '', []
+
+        stroke_count = self.hanzi_data.stroke_count(character)
+        entry = self.hanzi_data.get_dictionary(character) or {}
+        radical = entry.get('radical', '')
+        pinyins = []
+        for pinyin in entry.get('pinyin', []):
+            key = normalize_pinyin(pinyin)
+            if key and key not in pinyins:
+                pinyins.append(key)
+        return stroke_count, radical, pinyins
+
+    def _add_metadata(self, character):
+        """Look up a character and add it to the metadata indexes."""
+        stroke_count, radical, pinyins = self._lookup_metadata(character)
+        if stroke_count:
+            self._stroke_counts.setdefault(stroke_count, {})[character] = None
+        if radical:
+            self._radicals.setdefault(radical, {})[character] = None
+        for key in pinyins:
+            self._pinyin.insert(key, character)
+        self._metadata[character] = (stroke_count, radical, pinyins)
+
+    def _ensure_metadata(self):
+        """Build the stroke count, radical and pinyin indexes on first use.
+
+        Looking up every character scans graphics.txt and dictionary.txt,
+        so this is deferred from build() (called at startup) to the first
+        filter, search or sort that needs it.
+        """
+        if self._metadata_ready:
+            return
+        self._metadata_ready = True
+        for char in self._entries:
+            self._add_metadata(char)
+
+    def add(self, character, info):
+        """Add a character to all indexes.
+
+        Args:
+            character (str): The character.
+            info (dict): Character info with a 'group' key.
+        """
+        if character in self._entries:
+            self.remove(character)
+
+        group = info.get('group', '')
+        self._groups.setdefault(group, {})[character] = None
+        self._entries[character] = group
+        # 元数据索引尚未建立时留待 _ensure_metadata() 一并查询
+        if self._metadata_ready:
+            self._add_metadata(character)
+
+    def remove(self, character):
+        """Remove a character from all indexes.
+
+        Args:
+            character (str): The character.
+        """
+        group = self._entries.pop(character, None)
+        if group is None:
+            return
+
+        stroke_count, radical, pinyins = self._metadata.pop(character, (0, '', []))
+        for buckets, key in ((self._groups, group),
+                             (self._stroke_counts, stroke_count),
+                             (self._radicals, radical)):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.pop(character, None)
+                if not bucket:
+                    del buckets[key]
+        for key in pinyins:
+            self._pinyin.remove(key, character)
+
+    def update(self, character, info):
+        """Re-index a character whose info changed.
+
+        Args:
+            character (str): The character.
+            info (dict): The new character info.
+        """
+        if self._entries.get(character) == info.get('group', ''):
+            return  # 元数据只依赖分组与字本身，无需重建
+        self.add(character, info)
+
+    def __contains__(self, character):
+        return character in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def groups(self):
+        """Get group names in library order.
+
+        Returns:
+            list: Group names.
+        """
+        return list(self._groups)
+
+    def by_group(self, group):
+        """Get the characters of a group.
+
+        Args:
+            group (str): Group name.
+
+        Returns:
+            list: Characters in library order.
+        """
+        return list(self._groups.get(group, ()))
+
+    def stroke_counts(self):
+        """Get all stroke counts present in the library.
+
+        Returns:
+            list: Sorted stroke counts.
+        """
+        self._ensure_metadata()
+        return sorted(self._stroke_counts)
+
+    def by_stroke_count(self, count):
+        """Get the characters with a given number of strokes.
+
+        Args:
+            count (int): Stroke count.
+
+        Returns:
+            list: Characters in library order.
+        """
+        self._ensure_metadata()
+        return list(self._stroke_counts.get(count, ()))
+
+    def radicals(self):
+        """Get all radicals present in the library.
+
+        Returns:
+            list: Radicals in first-seen order.
+        """
+        self._ensure_metadata()
+        return list(self._radicals)
+
+    def by_radical(self, radical):
+        """Get the characters with a given radical.
+
+        Args:
+            radical (str): The radical.
+
+        Returns:
+            list: Characters in library order.
+        """
+        self._ensure_metadata()
+        return list(self._radicals.get(radical, ()))
+
+    def by_pinyin_prefix(self, prefix):
+        """Get the characters whose pinyin starts with a prefix.
+
+        Args:
+            prefix (str): Pinyin prefix, tone marks optional.
+
+        Returns:
+            list: Matching characters.
+        """
+        key = normalize_pinyin(prefix)
+        if not key:
+            return []
+        self._ensure_metadata()
+        return self._pinyin.find_prefix(key)
+
+    def get_stroke_count(self, character):
+        """Get the indexed stroke count of a character (0 if unknown)."""
+        self._ensure_metadata()
+        entry = self._metadata.get(character)
+        return entry[0] if entry else 0
+
+    def get_pinyin(self, character):
+        """Get the indexed normalized pinyin of a character."""
+        self._ensure_metadata()
+        entry = self._metadata.get(character)
+        return list(entry[2]) if entry else []
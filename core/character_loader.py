@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Character loader for the Chinese Character Reading Application.
+Reads and parses stroke geometry on a worker thread, cancels requests that
+became stale, and keeps the parsed paths in a small LRU cache.
+"""
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.animation_engine import parse_svg_path
+from core.trace_recorder import tracer
+
+# 预取任务的请求 id：结果只进缓存，不发出 geometry_ready
+PREFETCH_REQUEST = -1
+
+
+def load_stroke_paths(hanzi_data, character):
+    """Read and parse the stroke outlines of a character.
+
+    Args:
+        hanzi_data (HanziDataStore): Stroke data source.
+        character (str): The character.
+
+    Returns:
+        list: QPainterPath per stroke, empty if there is no stroke data.
+    """
+    data = hanzi_data.get_graphics(character)
+    if not data or 'strokes' not in data:
+        return []
+    paths = [parse_svg_path(stroke) for stroke in data['strokes']]
+    return [path for path in paths if not path.isEmpty()]
+
+
+class _GeometryLoadSignals(QObject):
+    """Signals of a geometry load task (QRunnable is not a QObject)."""
+
+    # request id, character, list of QPainterPath (None if skipped as stale)
+    loaded = pyqtSignal(int, str, object)
+
+
+class _GeometryLoadTask(QRunnable):
+    """Load the stroke geometry of one character off the GUI thread."""
+
+    def __init__(self, loader, request_id, character):
+        """Initialize the task.
+
+        Args:
+            loader (CharacterLoader): The loader that owns the request.
+            request_id (int): Id of the request.
+            character (str): The character to load.
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # 保留引用以便 tryTake() 取消
+        self.loader = loader
+        self.request_id = request_id
+        self.character = character
+        self.signals = loader._signals
+
+    def run(self):
+        """Load the geometry (runs on a pool thread)."""
+        if self.request_id not in (PREFETCH_REQUEST, self.loader.current_request):
+            # 排队期间已被新的请求取代；仍需通知 GUI 线程释放任务引用
+            self.signals.loaded.emit(self.request_id, self.character, None)
+            return
+        with tracer.span("load geometry", char=self.character):
+            paths = load_stroke_paths(self.loader.hanzi_data, self.character)
+        # 信号跨线程，以队列连接方式回到 GUI 线程
+        self.signals.loaded.emit(self.request_id, self.character, paths)
+
+
+class CharacterLoader(QObject):
+    """Asynchronous loader of character stroke geometry.
+
+    Only the latest request is delivered: request() cancels queued tasks of
+    earlier requests and results of stale tasks that already ran are dropped.
+    prefetch() fills the cache at a lower priority than requests.
+    """
+
+    # Emitted with the character and its stroke paths for the latest request
+    geometry_ready = pyqtSignal(str, object)
+    # Emitted with the character and its stroke paths whenever a background
+    # load (request or prefetch) put them into the cache
+    geometry_cached = pyqtSignal(str, object)
+
+    def __init__(self, hanzi_data, cache_size=64):
+        """Initialize the loader.
+
+        Args:
+            hanzi_data (HanziDataStore): Stroke data source (thread safe).
+            cache_size (int): Number of parsed characters kept.
+        """
+        super().__init__()
+        self.hanzi_data = hanzi_data
+        self.cache_size = cache_size
+        self.current_request = 0
+
+        self._geometry = OrderedDict()  # character -> list of QPainterPath
+        self._tasks = []
+        self._prefetching = {}  # character -> queued prefetch task
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _GeometryLoadSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def cached(self, character):
+        """Get parsed geometry without loading.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            list: Stroke paths, or None if not cached.
+        """
+        paths = self._geometry.get(character)
+        if paths is not None:
+            self._geometry.move_to_end(character)
+        return paths
+
+    def request(self, character):
+        """Load a character's geometry, cancelling earlier requests.
+
+        geometry_ready is emitted once the geometry is available, which may
+        happen before this method returns when it is cached.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            int: Id of the request.
+        """
+        self.cancel()
+        request_id = self.current_request
+
+        paths = self.cached(character)
+        if paths is not None:
+            self.geometry_ready.emit(character, paths)
+            return request_id
+
+        task = _GeometryLoadTask(self, request_id, character)
+        self._tasks.append(task)
+        self._pool.start(task, 1)  # 优先于预取
+        return request_id
+
+    def prefetch(self, characters):
+        """Load characters into the cache in the background.
+
+        Args:
+            characters (iterable): Characters likely to be requested soon.
+        """
+        for character in characters:
+            if character in self._geometry or character in self._prefetching:
+                continue
+            task = _GeometryLoadTask(self, PREFETCH_REQUEST, character)
+            self._prefetching[character] = task
+            self._pool.start(task, 0)
+
+    def cancel(self):
+        """Cancel all outstanding requests.
+
+        Tasks that already started cannot be taken back from the pool; they
+        stay referenced until _on_loaded() hears from them, since the pool
+        does not own tasks with auto-delete off.
+        """
+        self.current_request += 1
+        self._tasks = [task for task in self._tasks if not self._pool.tryTake(task)]
+
+    def shutdown(self):
+        """Drop queued loads and wait for the running one (before exit).
+
+        Pool threads must not report to the signal object while Python
+        tears it down at interpreter exit.
+        """
+        self.cancel()
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._tasks = []
+        self._prefetching.clear()
+
+    def load(self, character):
+        """Load a character's geometry synchronously, using the cache.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            list: Stroke paths.
+        """
+        paths = self.cached(character)
+        if paths is None:
+            paths = load_stroke_paths(self.hanzi_data, character)
+            self._store(character, paths)
+        return paths
+
+    def _store(self, character, paths):
+        self._geometry[character] = paths
+        self._geometry.move_to_end(character)
+        while len(self._geometry) > self.cache_size:
+            self._geometry.popitem(last=False)
+
+    def _on_loaded(self, request_id, character, paths):
+        """Cache a result and deliver it if still current (GUI thread)."""
+        if request_id == PREFETCH_REQUEST:
+            self._prefetching.pop(character, None)
+        else:
+            self._tasks = [task for task in self._tasks if task.request_id != request_id]
+        if paths is None:
+            return
+        self._store(character, paths)
+        self.geometry_cached.emit(character, paths)
+        if request_id == self.current_request:
+            self.geometry_ready.emit(character, paths)
@@ -10,21 +10,80 @@ import os
 import random
 import yaml
 
+from core.character_index import CharacterIndex
+
+# CJK 统一汉字：基本区及扩展A-E区
+CJK_RANGES = (
+    (0x4E00, 0x9FFF),    # CJK Unified Ideographs (Basic)
+    (0x3400, 0x4DBF),    # Extension A
+    (0x20000, 0x2A6DF),  # Extension B
+    (0x2A700, 0x2B73F),  # Extension C
+    (0x2B740, 0x2B81F),  # Extension D
+    (0x2B820, 0x2CEAF),  # Extension E
+)
+
+
+def is_chinese_character(char):
+    """Check if a character is a Chinese character.
+    
+    Args:
+        char (str): The character to check.
+        
+    Returns:
+        bool: True if it's a Chinese character.
+    """
+    if not char or len(char) != 1:
+        return False
+    
+    code_point = ord(char)
+    return any(low <= code_point <= high for low, high in CJK_RANGES)
+
+
+class LibraryDiff:
+    """字库文件变化：新增、删除和内容变化的汉字"""
+    
+    def __init__(self, added=None, removed=None, changed=None):
+        """Initialize the diff.
+        
+        Args:
+            added (list): 新增的汉字
+            removed (list): 删除的汉字
+            changed (list): 分组或组词变化的汉字
+        """
+        self.added = added or []
+        self.removed = removed or []
+        self.changed = changed or []
+    
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+    
+    def __repr__(self):
+        return (f"LibraryDiff(added={self.added}, removed={self.removed}, "
+                f"changed={self.changed})")
+
+
 class CharacterManager:
     """Manages Chinese character data for the application."""
     
-    def __init__(self, character_file="characters.yaml"):
+    def __init__(self, character_file="characters.yaml", hanzi_data=None, autoload=True):
         """Initialize the character manager.
         
         Args:
             character_file (str): Path to the character file.
+            hanzi_data (HanziDataStore, optional): Stroke and dictionary data
+                used to build the stroke count, radical and pinyin indexes.
+            autoload (bool): Load the character file now. Pass False to defer
+                loading and call load_characters() later.
         """
         self.character_file = character_file
+        self.index = CharacterIndex(hanzi_data)
         self.characters = []
         self.character_data = {}  # 新增属性
         self.current_index = 0
         self.original_characters = []  # 保存原始顺序
-        self.load_characters()
+        self.filter_query = None  # 当前筛选条件，字库变化时重新查询
+        if autoload:
+            self.load_characters()
     
     def load_characters(self):
         """Load characters from the YAML character file."""
@@ -49,19 +108,10 @@ class CharacterManager:
                 data = yaml.safe_load(f)
                 
             # 提取所有字符并保持原始顺序
-            self.characters = []
-            self.character_data = {}  # 新增数据结构存储完整信息
-            for group in data['groups']:
-                for char_info in group['characters']:
-                    char = char_info['character']
-                    if char not in self.character_data:
-                        self.characters.append(char)
-                        self.character_data[char] = {
-                            'group': group['name'],
-                            'words': char_info['words']
-                        }
+            self.characters, self.character_data = self._parse_library(data)
             
             self.original_characters = self.characters.copy()
+            self.index.build(self.characters, self.character_data)
             
         except (IOError, yaml.YAMLError) as e:
             print(f"Error loading character file: {str(e)}")
@@ -70,6 +120,86 @@ class CharacterManager:
         
         self.current_index = 0
     
+    def _parse_library(self, data):
+        """从YAML数据中提取汉字列表及完整信息
+        
+        Args:
+            data (dict): characters.yaml 的内容
+            
+        Returns:
+            tuple: (按原始顺序排列的汉字列表, 汉字 -> 信息字典)
+        """
+        characters = []
+        character_data = {}
+        for group in data['groups']:
+            for char_info in group['characters']:
+                char = char_info['character']
+                if char not in character_data:
+                    characters.append(char)
+                    character_data[char] = {
+                        'group': group['name'],
+                        'words': char_info.get('words') or []
+                    }
+        return characters, character_data
+    
+    def reload_changes(self):
+        """重新读取字库文件，只把增、删、改的条目应用到内存
+        
+        当前汉字保持不变（被删除时停在原位置附近）。
+        
+        Returns:
+            LibraryDiff: 变化内容，读取失败时返回None
+        """
+        try:
+            with open(self.character_file, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {'groups': []}
+            characters, character_data = self._parse_library(data)
+        except (IOError, yaml.YAMLError, KeyError, TypeError) as e:
+            print(f"Error reloading character file: {str(e)}")
+            return None
+        
+        diff = LibraryDiff(
+            added=[c for c in characters if c not in self.character_data],
+            removed=[c for c in self.character_data if c not in character_data],
+            changed=[c for c in characters
+                     if c in self.character_data and self.character_data[c] != character_data[c]]
+        )
+        reordered = characters != self.original_characters
+        if not diff and not reordered:
+            return diff
+        
+        current = self.get_current_character()
+        
+        for char in diff.removed:
+            del self.character_data[char]
+            self.index.remove(char)
+        for char in diff.added:
+            self.character_data[char] = character_data[char]
+            self.index.add(char, character_data[char])
+        for char in diff.changed:
+            self.character_data[char] = character_data[char]
+            self.index.update(char, character_data[char])
+        
+        # 学习模式（未筛选）直接采用文件中的新顺序；
+        # 打乱或筛选后的列表只去掉已删除的字，新增的字经过当前筛选条件后追加到末尾
+        if self.characters == self.original_characters and self.filter_query is None:
+            self.characters = characters.copy()
+        else:
+            removed = set(diff.removed)
+            added = diff.added
+            if self.filter_query is not None:
+                wanted = set(self.filter_query())
+                added = [c for c in added if c in wanted]
+            self.characters = [c for c in self.characters if c not in removed] + added
+        self.original_characters = characters
+        
+        if current in self.character_data and current in self.characters:
+            self.current_index = self.characters.index(current)
+        else:
+            self.current_index = min(self.current_index, max(len(self.characters) - 1, 0))
+        
+        return diff
+    
     def save_characters(self):
         """Save characters to the character file."""
         try:
@@ -90,9 +220,13 @@ class CharacterManager:
         
         return self.characters[self.current_index]
     
-    def next_character(self):
+    def next_character(self, wrap=False):
         """Move to the next character and return it.
         
+        Args:
+            wrap (bool): Go back to the first character after the last one
+                instead of staying on it.
+        
         Returns:
             str: The next character or empty string if no characters.
         """
@@ -101,6 +235,8 @@ class CharacterManager:
         
         if self.current_index < len(self.characters) - 1:
             self.current_index += 1
+        elif wrap:
+            self.current_index = 0
         return self.get_current_character()
     
     def previous_character(self):
@@ -148,10 +284,13 @@ class CharacterManager:
         
         # 更新内存数据
         self.characters.append(character)
+        if self.original_characters is not self.characters:
+            self.original_characters.append(character)
         self.character_data[character] = {
             'group': group_name,
             'words': []
         }
+        self.index.add(character, self.character_data[character])
         
         # 保存到YAML文件
         with open(self.character_file, 'w', encoding='utf-8') as f:
@@ -159,6 +298,117 @@ class CharacterManager:
         
         return True
     
+    def remove_character(self, character):
+        """从字库中删除汉字
+        
+        Args:
+            character (str): 要删除的汉字
+            
+        Returns:
+            bool: 删除成功返回True，汉字不存在返回False
+        """
+        if character not in self.character_data:
+            return False
+        
+        with open(self.character_file, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {'groups': []}
+        
+        for group in data['groups']:
+            group['characters'] = [c for c in group['characters']
+                                   if c['character'] != character]
+        
+        # 更新内存数据，保持当前汉字不变
+        current = self.get_current_character()
+        for chars in (self.characters, self.original_characters):
+            if character in chars:
+                chars.remove(character)
+        del self.character_data[character]
+        self.index.remove(character)
+        if current != character and current in self.characters:
+            self.current_index = self.characters.index(current)
+        else:
+            self.current_index = min(self.current_index,
+                                     max(len(self.characters) - 1, 0))
+        
+        with open(self.character_file, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+        
+        return True
+    
+    def jump_to_character(self, character):
+        """跳转到指定汉字
+        
+        Args:
+            character (str): 目标汉字
+            
+        Returns:
+            bool: 汉字存在于当前列表中返回True
+        """
+        try:
+            self.current_index = self.characters.index(character)
+        except ValueError:
+            return False
+        return True
+    
+    def add_characters(self, characters_by_group):
+        """批量添加汉字，整个批次只读写一次YAML文件
+        
+        Args:
+            characters_by_group (dict): 分组名称 -> 汉字列表
+            
+        Returns:
+            int: 实际添加的汉字数量（已存在的汉字会被跳过）
+        """
+        with open(self.character_file, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {'groups': []}
+        
+        added = 0
+        for group_name, characters in characters_by_group.items():
+            target_group = next((g for g in data['groups'] if g['name'] == group_name), None)
+            
+            for character in characters:
+                if not character or character in self.character_data:
+                    continue
+                
+                if target_group is None:
+                    target_group = {'name': group_name, 'characters': []}
+                    data['groups'].append(target_group)
+                target_group['characters'].append({'character': character, 'words': []})
+                
+                # 更新内存数据
+                self.characters.append(character)
+                if self.original_characters is not self.characters:
+                    self.original_characters.append(character)
+                self.character_data[character] = {
+                    'group': group_name,
+                    'words': []
+                }
+                self.index.add(character, self.character_data[character])
+                added += 1
+        
+        if added:
+            with open(self.character_file, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+        
+        return added
+    
+    def get_upcoming_characters(self, count, wrap=False):
+        """获取当前汉字之后的若干个汉字（用于预加载）
+        
+        Args:
+            count (int): 数量
+            wrap (bool): 到末尾后从头继续（不含当前汉字），与 next_character(wrap=True) 一致
+            
+        Returns:
+            list: 按浏览顺序排列的汉字
+        """
+        start = self.current_index + 1
+        if not wrap:
+            return self.characters[start:start + count]
+        count = min(count, max(len(self.characters) - 1, 0))
+        return [self.characters[(start + step) % len(self.characters)]
+                for step in range(count)]
+    
     def get_character_count(self):
         """Get the total number of characters.
         
@@ -192,10 +442,24 @@ class CharacterManager:
         self.current_index = 0  # 重置索引
 
     def restore_order(self):
-        """恢复字符列表原始顺序（学习模式）"""
+        """恢复字符列表原始顺序（学习模式），同时取消筛选"""
+        self.filter_query = None
         self.characters = self.original_characters.copy()
         self.current_index = 0  # 重置索引
 
+    def filter_characters(self, characters, query=None):
+        """只浏览指定的汉字子集（保持原始顺序）
+        
+        Args:
+            characters (iterable): 要保留的汉字，通常来自 self.index 的查询结果
+            query (callable, optional): 重新得到筛选结果的查询；字库文件
+                新增汉字时用它判断新字是否属于当前筛选
+        """
+        self.filter_query = query
+        wanted = set(characters)
+        self.characters = [c for c in self.original_characters if c in wanted]
+        self.current_index = 0  # 重置索引
+
     def get_current_character_info(self):
         """获取当前字符的完整信息"""
         char = self.get_current_character()
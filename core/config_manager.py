@@ -23,6 +23,20 @@ class ConfigManager(QObject):
         "animation_interval": 1000, # Default animation interval in ms
         "display_time": 3000,       # Time to display character before animation (ms)
         "auto_pronounce": True,     # Auto-pronounce new characters
+        "graphics_path": "assets/graphics.txt",      # Make Me A Hanzi stroke data
+        "dictionary_path": "assets/dictionary.txt",  # Make Me A Hanzi dictionary
+        "image_root": "assets",     # Directory word image paths are relative to
+        "image_cache_mb": 64,       # Memory budget of decoded word images
+        "prefetch_count": 3,        # Upcoming characters to prefetch
+        "autoplay": False,          # Start in auto-play (kiosk) mode
+        "watch_library": True,      # Apply external edits of characters.yaml
+        "stall_watchdog": False,    # Log main-thread stalls with stack samples
+        "stall_threshold_ms": 50,   # Block time that counts as a stall
+        "stall_log": "logs/stall.log",  # Rotating stall log
+        "trace_buffer_size": 10000, # Trace events kept for export
+        "stroke_types_path": "assets/stroke_types.npz",  # Stroke type index (--build-stroke-types)
+        "handwriting_index_path": "assets/handwriting.npz",  # Draw-to-search index (--build-handwriting-index)
+        "navigation_settle_ms": 150,  # Key-repeat pause before a character is fully loaded
         "background_brightness": 100,  # Default background brightness
         "window_state": "maximized"  # Default window state
     }
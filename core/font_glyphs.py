@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Font glyph outlines for the Chinese Character Reading Application.
+Turns characters without stroke data into QPainterPaths in the same glyph
+coordinates as graphics.txt, using the configured font.
+"""
+
+from collections import OrderedDict
+
+from PyQt5.QtGui import QFont, QPainterPath, QTransform
+
+# 字形高度（字框 1024，与 Make Me A Hanzi 字形大小一致）
+GLYPH_SIZE = 900
+# 字框中心（Y 轴向上）
+GLYPH_CENTER = (512, 388)
+CACHE_SIZE = 256
+
+_glyph_cache = OrderedDict()
+
+
+def font_glyph_path(font_family, character):
+    """Get the outline of a character drawn with a font.
+
+    The outline is centred in the 1024 glyph box with Y pointing up, so
+    it is drawn with glyph_transform() exactly like stroke data. Paths
+    are cached per (font, character).
+
+    Args:
+        font_family (str): Font family name.
+        character (str): The character.
+
+    Returns:
+        QPainterPath: The outline, empty if the font has no such glyph.
+    """
+    key = (font_family, character)
+    path = _glyph_cache.get(key)
+    if path is not None:
+        _glyph_cache.move_to_end(key)
+        return path
+
+    font = QFont(font_family)
+    font.setPixelSize(GLYPH_SIZE)
+    text_path = QPainterPath()
+    text_path.addText(0, 0, font, character)
+
+    # 按字形包围盒居中并翻转 Y 轴
+    bounds = text_path.boundingRect()
+    transform = QTransform()
+    transform.translate(*GLYPH_CENTER)
+    transform.scale(1, -1)
+    transform.translate(-bounds.center().x(), -bounds.center().y())
+    path = transform.map(text_path)
+    path.setFillRule(text_path.fillRule())
+
+    _glyph_cache[key] = path
+    while len(_glyph_cache) > CACHE_SIZE:
+        _glyph_cache.popitem(last=False)
+    return path
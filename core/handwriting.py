@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Handwriting lookup for the Chinese Character Reading Application.
+Finds the characters of graphics.txt closest to a hand-drawn one by
+comparing normalised, resampled stroke medians.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from core.medians import resample
+
+# 每笔取样点数（检索特征较粗，比描红匹配少）
+FEATURE_SAMPLES = 8
+
+
+def features(strokes, samples=FEATURE_SAMPLES):
+    """Turn the strokes of a character into one feature vector.
+
+    Every stroke is resampled to the same number of points and the whole
+    character is moved and scaled into a unit square, so position, size
+    and drawing speed do not matter, while stroke order and direction do.
+
+    Args:
+        strokes (list): (x, y) point lists in stroke order, with Y pointing up.
+        samples (int): Points per stroke.
+
+    Returns:
+        numpy.ndarray: float32 vector of len(strokes) * samples * 2 values.
+    """
+    if not strokes:
+        return np.zeros(0, dtype=np.float32)
+    points = np.stack([resample(stroke, samples) for stroke in strokes])
+    low, high = points.reshape(-1, 2).min(axis=0), points.reshape(-1, 2).max(axis=0)
+    points = (points - (low + high) / 2) / max(float((high - low).max()), 1e-6)
+    return points.reshape(-1).astype(np.float32)
+
+
+class HandwritingIndex:
+    """Feature vectors of all characters, bucketed by stroke count.
+
+    A query is only compared with the characters that have the same number
+    of strokes, as one matrix operation over that bucket.
+    """
+
+    def __init__(self, buckets=None):
+        """Initialize the index.
+
+        Args:
+            buckets (dict): Stroke count -> (characters list, features array
+                of shape (n, count * FEATURE_SAMPLES * 2)).
+        """
+        self.buckets = buckets or {}
+
+    @classmethod
+    def build(cls, graphics_path="assets/graphics.txt"):
+        """Compute the features of every character in graphics.txt.
+
+        Args:
+            graphics_path (str): Path to the Make Me A Hanzi graphics.txt.
+
+        Returns:
+            HandwritingIndex: The index.
+        """
+        grouped = {}
+        with open(graphics_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                medians = record.get('medians') or []
+                if medians:
+                    characters, vectors = grouped.setdefault(len(medians), ([], []))
+                    characters.append(record['character'])
+                    vectors.append(features(medians))
+        return cls({count: (characters, np.stack(vectors))
+                    for count, (characters, vectors) in grouped.items()})
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save().
+
+        Args:
+            path (str): The .npz file.
+
+        Returns:
+            HandwritingIndex: The index.
+        """
+        buckets = {}
+        with np.load(path) as data:
+            for count in data['counts'].tolist():
+                buckets[count] = (data[f'characters_{count}'].tolist(), data[f'features_{count}'])
+        return cls(buckets)
+
+    def save(self, path):
+        """Write the index as a compressed .npz file.
+
+        Args:
+            path (str): Target file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        arrays = {'counts': np.array(sorted(self.buckets), dtype=np.int32)}
+        for count, (characters, vectors) in self.buckets.items():
+            arrays[f'characters_{count}'] = np.array(characters)
+            arrays[f'features_{count}'] = vectors
+        np.savez_compressed(path, **arrays)
+
+    def __len__(self):
+        return sum(len(characters) for characters, _ in self.buckets.values())
+
+    def search(self, strokes, k=8):
+        """Find the characters closest to a drawing.
+
+        Args:
+            strokes (list): Drawn (x, y) point lists in stroke order, Y up.
+            k (int): Number of candidates.
+
+        Returns:
+            list: Up to k characters, best match first.
+        """
+        bucket = self.buckets.get(len(strokes))
+        if bucket is None:
+            return []
+        characters, vectors = bucket
+        query = features(strokes)
+        difference = vectors - query
+        distances = np.einsum('ij,ij->i', difference, difference)
+        k = min(k, len(characters))
+        best = np.argpartition(distances, k - 1)[:k]
+        return [characters[number] for number in best[np.argsort(distances[best])]]
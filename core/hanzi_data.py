@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Hanzi data store for the Chinese Character Reading Application.
+Provides indexed, cached access to the Make Me A Hanzi data files
+(graphics.txt for stroke data, dictionary.txt for pinyin/radical metadata).
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# 只匹配行首的 character 字段，避免对整行做 JSON 解析
+_CHARACTER_RE = re.compile(rb'"character"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+class HanziDataStore:
+    """Offset-indexed access to graphics.txt and dictionary.txt.
+
+    The first lookup scans each file once and records the byte offset of
+    every character's line. Later lookups seek straight to that line and
+    parse only the requested record. Parsed records are held in a small
+    LRU cache. All public methods are thread-safe.
+    """
+
+    def __init__(self, graphics_path="assets/graphics.txt",
+                 dictionary_path="assets/dictionary.txt", cache_size=256):
+        """Initialize the data store.
+
+        Args:
+            graphics_path (str): Path to the Make Me A Hanzi graphics.txt.
+            dictionary_path (str): Path to the Make Me A Hanzi dictionary.txt.
+            cache_size (int): Number of parsed records kept per file.
+        """
+        self.graphics_path = graphics_path
+        self.dictionary_path = dictionary_path
+        self.cache_size = cache_size
+
+        self._lock = threading.RLock()
+        self._offsets = {}   # path -> {character: offset}
+        self._records = {}   # path -> OrderedDict(character -> record)
+
+        # 缓存命中统计
+        self.hits = 0
+        self.misses = 0
+
+    def _build_offsets(self, path):
+        """Scan a data file once and record the line offset of each character.
+
+        Args:
+            path (str): Path to the data file.
+
+        Returns:
+            dict: Mapping of character to byte offset.
+        """
+        offsets = {}
+        if not os.path.exists(path):
+            return offsets
+
+        try:
+            with open(path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    match = _CHARACTER_RE.search(line, 0, 64)
+                    if match:
+                        raw = match.group(1).decode('utf-8')
+                        char = json.loads(f'"{raw}"') if '\\' in raw else raw
+                        offsets.setdefault(char, offset)
+                    offset += len(line)
+        except IOError as e:
+            print(f"Error indexing {path}: {e}")
+
+        return offsets
+
+    def _get_offsets(self, path):
+        """Get the offset index of a data file, building it on first use."""
+        with self._lock:
+            offsets = self._offsets.get(path)
+            if offsets is None:
+                offsets = self._build_offsets(path)
+                self._offsets[path] = offsets
+                self._records[path] = OrderedDict()
+            return offsets
+
+    def _get_record(self, path, character):
+        """Get the parsed record of a character from a data file.
+
+        Args:
+            path (str): Path to the data file.
+            character (str): The character to look up.
+
+        Returns:
+            dict: The parsed record, or None if not found.
+        """
+        offsets = self._get_offsets(path)
+        offset = offsets.get(character)
+        if offset is None:
+            return None
+
+        with self._lock:
+            records = self._records[path]
+            record = records.get(character)
+            if record is not None:
+                records.move_to_end(character)
+                self.hits += 1
+                return record
+            self.misses += 1
+
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                record = json.loads(f.readline().decode('utf-8'))
+        except (IOError, ValueError) as e:
+            print(f"Error reading '{character}' from {path}: {e}")
+            return None
+
+        with self._lock:
+            records[character] = record
+            while len(records) > self.cache_size:
+                records.popitem(last=False)
+        return record
+
+    def get_graphics(self, character):
+        """Get the graphics.txt record (strokes and medians) of a character.
+
+        Args:
+            character (str): The character to look up.
+
+        Returns:
+            dict: The record, or None if the character has no stroke data.
+        """
+        return self._get_record(self.graphics_path, character)
+
+    def get_dictionary(self, character):
+        """Get the dictionary.txt record (pinyin, radical...) of a character.
+
+        Args:
+            character (str): The character to look up.
+
+        Returns:
+            dict: The record, or None if not available.
+        """
+        return self._get_record(self.dictionary_path, character)
+
+    def has_strokes(self, character):
+        """Check whether stroke data exists for a character.
+
+        Args:
+            character (str): The character to check.
+
+        Returns:
+            bool: True if graphics.txt contains the character.
+        """
+        return character in self._get_offsets(self.graphics_path)
+
+    def stroke_count(self, character):
+        """Get the number of strokes of a character.
+
+        Args:
+            character (str): The character to look up.
+
+        Returns:
+            int: Number of strokes, or 0 if no stroke data.
+        """
+        record = self.get_graphics(character)
+        if not record:
+            return 0
+        return len(record.get('strokes', []))
+
+    def stroke_characters(self):
+        """Get all characters that have stroke data.
+
+        Returns:
+            list: Characters in graphics.txt file order.
+        """
+        return list(self._get_offsets(self.graphics_path))
+
+    def get_hit_rate(self):
+        """Get the record cache hit rate.
+
+        Returns:
+            float: Hit rate in [0, 1], 0 if nothing was looked up yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
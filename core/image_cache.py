@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Word image cache for the Chinese Character Reading Application.
+Decodes the images referenced by characters.yaml on a worker thread and
+keeps the scaled results in a byte-budgeted LRU cache.
+"""
+
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+class _ImageLoadSignals(QObject):
+    """Signals of an image load task (QRunnable is not a QObject)."""
+
+    # path, cache generation, image (null if the file could not be decoded)
+    loaded = pyqtSignal(str, int, QImage)
+
+
+class _ImageLoadTask(QRunnable):
+    """Decode and scale one image off the GUI thread."""
+
+    def __init__(self, path, file_path, size, generation, signals):
+        """Initialize the task.
+
+        Args:
+            path (str): Image path as written in characters.yaml (cache key).
+            file_path (str): Resolved path on disk.
+            size (QSize): Display size to scale to.
+            generation (int): Cache generation the request belongs to.
+            signals (_ImageLoadSignals): Where to report the result.
+        """
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.file_path = file_path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        """Load the image (runs on a pool thread)."""
+        image = QImage(self.file_path)
+        if not image.isNull():
+            # 只缩放一次，显示时直接使用
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.path, self.generation, image)
+
+
+class ImageCache(QObject):
+    """Asynchronous, byte-budgeted LRU cache of scaled word images."""
+
+    # Emitted with the image path when a requested image becomes available
+    image_ready = pyqtSignal(str)
+
+    def __init__(self, image_root="assets", max_bytes=64 * 1024 * 1024,
+                 display_size=QSize(240, 180)):
+        """Initialize the image cache.
+
+        Args:
+            image_root (str): Directory that image paths are relative to.
+            max_bytes (int): Memory budget of the decoded images.
+            display_size (QSize): Size images are scaled to.
+        """
+        super().__init__()
+        self.image_root = image_root
+        self.max_bytes = max_bytes
+        self.display_size = QSize(display_size)
+
+        self._images = OrderedDict()  # path -> QImage
+        self._bytes = 0
+        self._pending = set()
+        self._missing = set()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._signals = _ImageLoadSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def resolve_path(self, path):
+        """Resolve an image path from characters.yaml to a file on disk.
+
+        Args:
+            path (str): The image path, e.g. "images/sun.png".
+
+        Returns:
+            str: The resolved path, or None if the file does not exist.
+        """
+        for candidate in (path, os.path.join(self.image_root, path)):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def get(self, path):
+        """Get a decoded image without blocking.
+
+        On a miss the image is scheduled for loading and image_ready is
+        emitted once it is available.
+
+        Args:
+            path (str): The image path.
+
+        Returns:
+            QImage: The scaled image, or None if not loaded (yet).
+        """
+        image = self._images.get(path)
+        if image is not None:
+            self._images.move_to_end(path)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        self._load(path)
+        return None
+
+    def prefetch(self, paths):
+        """Schedule images for loading so later get() calls hit the cache.
+
+        Args:
+            paths (iterable): Image paths.
+        """
+        for path in paths:
+            if path not in self._images:
+                self._load(path)
+
+    def set_display_size(self, size):
+        """Change the size images are scaled to, dropping cached images.
+
+        Args:
+            size (QSize): The new display size.
+        """
+        if size == self.display_size:
+            return
+        self.display_size = QSize(size)
+        self.clear()
+
+    def clear(self):
+        """Drop all cached images."""
+        self._images.clear()
+        self._bytes = 0
+        self._pending.clear()
+        self._missing.clear()
+        self._generation += 1
+
+    def get_hit_rate(self):
+        """Get the cache hit rate.
+
+        Returns:
+            float: Hit rate in [0, 1], 0 if nothing was requested yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _load(self, path):
+        """Start loading an image on the thread pool."""
+        if not path or path in self._pending or path in self._missing:
+            return
+
+        file_path = self.resolve_path(path)
+        if file_path is None:
+            self._missing.add(path)
+            return
+
+        self._pending.add(path)
+        self._pool.start(_ImageLoadTask(path, file_path, self.display_size,
+                                        self._generation, self._signals))
+
+    def _on_loaded(self, path, generation, image):
+        """Store a decoded image (runs on the GUI thread)."""
+        if generation != self._generation:
+            return  # 解码期间缓存被清空（如显示尺寸变化），丢弃旧结果
+        self._pending.discard(path)
+        if image.isNull():
+            print(f"Error loading word image: {path}")
+            self._missing.add(path)
+            return
+
+        old = self._images.pop(path, None)
+        if old is not None:
+            self._bytes -= old.byteCount()
+        self._images[path] = image
+        self._bytes += image.byteCount()
+
+        while self._bytes > self.max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self._bytes -= evicted.byteCount()
+
+        self.image_ready.emit(path)
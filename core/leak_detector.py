@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Leak detector for the Chinese Character Reading Application.
+Takes tracemalloc snapshots and Qt object counts every N navigations and
+reports growth by allocation site.
+"""
+
+import gc
+import logging
+import os
+import time
+import tracemalloc
+from logging.handlers import RotatingFileHandler
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtWidgets import QApplication
+
+# 重点关注的类型：每次 set_character 都会新建
+WATCHED_TYPES = ("QPainterPath", "StrokeInfo", "QImage", "QPixmap", "QTimer", "QWidget")
+
+
+def count_objects(type_names=WATCHED_TYPES):
+    """Count live Python wrappers of the watched types.
+
+    Args:
+        type_names (tuple): Class names to count (subclasses included).
+
+    Returns:
+        dict: Class name -> number of live objects.
+    """
+    counts = dict.fromkeys(type_names, 0)
+    for obj in gc.get_objects():
+        for cls in type(obj).__mro__:
+            name = cls.__name__
+            if name in counts:
+                counts[name] += 1
+                break
+    return counts
+
+
+def count_qt_objects():
+    """Count Qt objects reachable from the application.
+
+    Returns:
+        dict: 'widgets' (all QWidgets) and 'children' (QObject tree under
+        the application and its top-level widgets).
+    """
+    app = QApplication.instance()
+    if app is None:
+        return {'widgets': 0, 'children': 0}
+
+    children = len(app.findChildren(QObject))
+    for widget in app.topLevelWidgets():
+        children += 1 + len(widget.findChildren(QObject))
+    return {'widgets': len(app.allWidgets()), 'children': children}
+
+
+class LeakDetector:
+    """Periodic memory snapshots for long running sessions.
+
+    The first check after start() becomes the baseline. Every later check
+    reports the allocation sites that grew most since the baseline and
+    since the previous check, together with object counts.
+    """
+
+    def __init__(self, every=100, top=10, frames=8, log_file="logs/leak.log"):
+        """Initialize the detector.
+
+        Args:
+            every (int): Navigations between snapshots.
+            top (int): Number of allocation sites reported.
+            frames (int): Traceback depth stored by tracemalloc.
+            log_file (str): Path of the rotating report log.
+        """
+        self.every = max(1, every)
+        self.top = top
+        self.frames = frames
+        self.navigations = 0
+
+        self.baseline = None
+        self.previous = None
+        self.baseline_counts = None
+        self.reports = []  # (navigations, traced bytes, object counts)
+
+        self.logger = logging.getLogger("leak_detector")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            log_dir = os.path.dirname(log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            handler = RotatingFileHandler(log_file, maxBytes=4 * 1024 * 1024,
+                                          backupCount=3, encoding='utf-8')
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.logger.addHandler(handler)
+            self.logger.addHandler(logging.StreamHandler())
+
+    def start(self):
+        """Start tracing allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.logger.info(f"Leak detection on: snapshot every {self.every} navigations")
+
+    def stop(self):
+        """Stop tracing allocations."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def on_navigation(self):
+        """Count a navigation and take a snapshot every N navigations."""
+        self.navigations += 1
+        if self.navigations % self.every == 0:
+            self.check()
+
+    def _snapshot(self):
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+            # 检测器自己保留的快照和报告不算应用的增长
+            tracemalloc.Filter(False, __file__, all_frames=True),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        counts = count_objects()
+        counts.update(count_qt_objects())
+        return snapshot, counts
+
+    def _format_growth(self, snapshot, reference, title):
+        lines = [title]
+        stats = snapshot.compare_to(reference, 'traceback')
+        growing = [s for s in stats if s.size_diff > 0][:self.top]
+        if not growing:
+            lines.append("  (no growth)")
+        for stat in growing:
+            # traceback 从最早的调用排到分配点
+            frames = list(stat.traceback)[::-1]
+            lines.append(f"  +{stat.size_diff / 1024:.1f} KiB "
+                         f"(+{stat.count_diff} blocks) {frames[0].filename}:{frames[0].lineno}")
+            for caller in frames[1:4]:
+                lines.append(f"      from {caller.filename}:{caller.lineno}")
+        return lines
+
+    def check(self):
+        """Take a snapshot now and log the growth.
+
+        Returns:
+            dict: Object counts of this snapshot.
+        """
+        if not tracemalloc.is_tracing():
+            self.start()
+
+        started = time.perf_counter()
+        snapshot, counts = self._snapshot()
+        traced, _peak = tracemalloc.get_traced_memory()
+        self.reports.append((self.navigations, traced, counts))
+
+        if self.baseline is None:
+            self.baseline = snapshot
+            self.baseline_counts = counts
+            self.previous = snapshot
+            self.logger.info(f"[{self.navigations} nav] baseline: "
+                             f"{traced / 1024:.0f} KiB traced, objects {counts}")
+            return counts
+
+        count_diff = {name: counts[name] - self.baseline_counts.get(name, 0)
+                      for name in counts}
+        lines = [f"[{self.navigations} nav] {traced / 1024:.0f} KiB traced, "
+                 f"objects {counts}, since baseline {count_diff}"]
+        lines += self._format_growth(snapshot, self.previous, "  growth since last check:")
+        lines += self._format_growth(snapshot, self.baseline, "  growth since baseline:")
+        lines.append(f"  (snapshot took {(time.perf_counter() - started) * 1000:.0f} ms)")
+        self.logger.info("\n".join(lines))
+
+        self.previous = snapshot
+        return counts
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Library watcher for the Chinese Character Reading Application.
+Watches characters.yaml for external edits and applies them incrementally.
+"""
+
+import os
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class LibraryWatcher(QObject):
+    """Watches the character file and applies changes without a reload."""
+
+    # Emitted with a LibraryDiff after external changes were applied
+    library_changed = pyqtSignal(object)
+
+    def __init__(self, character_manager, delay=300):
+        """Initialize the watcher.
+
+        Args:
+            character_manager: The character manager to update.
+            delay (int): Quiet period in ms before a change is applied, so
+                that an editor's several writes are handled once.
+        """
+        super().__init__()
+        self.character_manager = character_manager
+        self.path = os.path.abspath(character_manager.character_file)
+
+        self._stamp = self._file_stamp()
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(delay)
+        self._debounce_timer.timeout.connect(self.check_for_changes)
+
+        # 只监视字库文件本身：监视整个项目目录会被日志、缓存等无关写入频繁唤醒。
+        # 编辑器常以“写临时文件再改名”的方式保存，原文件被替换后监视会失效，
+        # 由 _rewatch() 重新加入
+        self._watcher = QFileSystemWatcher(self)
+        self._rewatch()
+        self._watcher.fileChanged.connect(self._schedule_check)
+
+    def _rewatch(self):
+        """Watch the character file again if it was replaced.
+
+        Returns:
+            bool: True if the file is being watched.
+        """
+        if self.path in self._watcher.files():
+            return True
+        if not os.path.exists(self.path):
+            return False
+        return self._watcher.addPath(self.path)
+
+    def _file_stamp(self):
+        """Get (mtime, size) of the character file, or None if missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _schedule_check(self, _path=""):
+        """Restart the quiet period after a file system notification."""
+        self._rewatch()
+        self._debounce_timer.start()
+
+    def check_for_changes(self):
+        """Apply the file's changes if it was modified since the last check."""
+        if not self._rewatch():
+            # 改名保存的中途文件可能暂时不存在，稍后再试
+            self._debounce_timer.start()
+            return
+
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return
+        self._stamp = stamp
+
+        diff = self.character_manager.reload_changes()
+        if diff:
+            print(f"Character library updated: {diff}")
+            self.library_changed.emit(diff)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke median helpers for the Chinese Character Reading Application.
+Resamples the Make Me A Hanzi stroke medians (centre lines) to a fixed
+number of evenly spaced points as NumPy arrays.
+"""
+
+import numpy as np
+
+# 每笔重采样的点数
+SAMPLES = 16
+
+
+def resample(points, samples=SAMPLES):
+    """Resample a polyline to evenly spaced points along its length.
+
+    Args:
+        points (sequence): (x, y) pairs, at least one.
+        samples (int): Number of output points.
+
+    Returns:
+        numpy.ndarray: float32 array of shape (samples, 2).
+    """
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    if len(points) == 1:
+        return np.repeat(points, samples, axis=0)
+
+    steps = np.hypot(*np.diff(points, axis=0).T)
+    distance = np.concatenate(([0.0], np.cumsum(steps)))
+    if distance[-1] == 0:
+        return np.repeat(points[:1], samples, axis=0)
+
+    targets = np.linspace(0.0, distance[-1], samples)
+    return np.stack((np.interp(targets, distance, points[:, 0]),
+                     np.interp(targets, distance, points[:, 1])), axis=1).astype(np.float32)
+
+
+def resample_all(medians, samples=SAMPLES):
+    """Resample all strokes of a character.
+
+    Args:
+        medians (list): The 'medians' list of a graphics.txt record.
+        samples (int): Points per stroke.
+
+    Returns:
+        numpy.ndarray: float32 array of shape (strokes, samples, 2).
+    """
+    if not medians:
+        return np.zeros((0, samples, 2), dtype=np.float32)
+    return np.stack([resample(median, samples) for median in medians])
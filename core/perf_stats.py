@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Performance statistics for the Chinese Character Reading Application.
+Live frame rate, paint time, load time and speech latency figures for the
+performance overlay.
+"""
+
+import time
+from collections import deque
+
+
+class PerfStats:
+    """Collects live performance figures while attached.
+
+    Instrumentation is installed by shadowing methods on the instances
+    (e.g. animation_engine.render) with timing wrappers, and removed again
+    on detach. While detached the hot paths run the original methods with
+    no extra code at all.
+    """
+
+    def __init__(self, window=120):
+        """Initialize the statistics.
+
+        Args:
+            window (int): Number of recent paints kept for averages.
+        """
+        self.paint_times = deque(maxlen=window)   # seconds
+        self.frame_stamps = deque(maxlen=window)  # perf_counter() at paint end
+        self.last_paint = 0.0
+        self.last_load = 0.0
+        self.last_speech_latency = None
+        self.cache_sources = {}  # name -> callable returning hit rate
+
+        self._speech_requested = None
+        self._load_requested = None
+        self._wrapped = []  # (object, attribute name)
+        self._speech = None
+        self._loader = None
+
+    # ---- instrumentation --------------------------------------------------
+
+    def _wrap(self, obj, name, callback):
+        """Shadow obj.name with a wrapper passing the call duration to callback."""
+        original = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                callback(time.perf_counter() - start)
+
+        setattr(obj, name, timed)
+        self._wrapped.append((obj, name))
+
+    def attach(self, animation_engine, speech_engine=None):
+        """Start measuring the given components.
+
+        Args:
+            animation_engine (AnimationEngine): Measured for paint and load time.
+            speech_engine (SpeechEngine, optional): Measured for time-to-speech.
+        """
+        if self._wrapped:
+            return
+        self._wrap(animation_engine, 'render', self.record_paint)
+        if animation_engine.loader is None:
+            self._wrap(animation_engine, 'set_character', self.record_load)
+        else:
+            # 后台加载时，加载耗时从请求算到笔画数据送达
+            original_set = animation_engine.set_character
+
+            def set_character(character):
+                self._load_requested = time.perf_counter()
+                return original_set(character)
+
+            animation_engine.set_character = set_character
+            self._wrapped.append((animation_engine, 'set_character'))
+            self._loader = animation_engine.loader
+            self._loader.geometry_ready.connect(self._on_geometry_ready)
+
+        if speech_engine is not None:
+            original = speech_engine.pronounce
+
+            def pronounce(text):
+                self._speech_requested = time.perf_counter()
+                self._hook_speech(speech_engine)
+                result = original(text)
+                # 语音引擎在第一次朗读时才创建，不为测量而提前创建
+                self._hook_speech(speech_engine)
+                return result
+
+            speech_engine.pronounce = pronounce
+            self._wrapped.append((speech_engine, 'pronounce'))
+            self._hook_speech(speech_engine)
+
+    def _hook_speech(self, speech_engine):
+        """Follow the speech state once the engine has created its backend."""
+        if self._speech is None and speech_engine.speech is not None:
+            self._speech = speech_engine.speech
+            self._speech.stateChanged.connect(self._on_speech_state)
+
+    def detach(self):
+        """Remove all instrumentation."""
+        for obj, name in self._wrapped:
+            # 删除实例属性后恢复为类上定义的原方法
+            delattr(obj, name)
+        self._wrapped = []
+
+        if self._speech is not None:
+            self._speech.stateChanged.disconnect(self._on_speech_state)
+            self._speech = None
+        if self._loader is not None:
+            self._loader.geometry_ready.disconnect(self._on_geometry_ready)
+            self._loader = None
+
+    def is_attached(self):
+        """Whether instrumentation is installed."""
+        return bool(self._wrapped)
+
+    # ---- recording --------------------------------------------------------
+
+    def record_paint(self, duration):
+        """Record one AnimationEngine.render call.
+
+        Args:
+            duration (float): Paint time in seconds.
+        """
+        self.last_paint = duration
+        self.paint_times.append(duration)
+        self.frame_stamps.append(time.perf_counter())
+
+    def record_load(self, duration):
+        """Record one AnimationEngine.set_character call.
+
+        Args:
+            duration (float): Load time in seconds.
+        """
+        self.last_load = duration
+
+    def _on_geometry_ready(self, character, paths):
+        """Measure the delay from set_character() to the stroke data arriving."""
+        if self._load_requested is not None:
+            self.record_load(time.perf_counter() - self._load_requested)
+            self._load_requested = None
+
+    def _on_speech_state(self, state):
+        """Measure the delay from pronounce() to audible speech."""
+        if self._speech_requested is not None and state == self._speech.Speaking:
+            self.last_speech_latency = time.perf_counter() - self._speech_requested
+            self._speech_requested = None
+
+    # ---- figures ----------------------------------------------------------
+
+    def fps(self):
+        """Get the number of paints during the last second."""
+        now = time.perf_counter()
+        return sum(1 for stamp in self.frame_stamps if now - stamp <= 1.0)
+
+    def average_paint(self):
+        """Get the average paint time in seconds over the recent window."""
+        if not self.paint_times:
+            return 0.0
+        return sum(self.paint_times) / len(self.paint_times)
+
+    def summary(self):
+        """Get a one-line text for the overlay.
+
+        Returns:
+            str: The current figures.
+        """
+        parts = [
+            f"FPS {self.fps()}",
+            f"paint {self.last_paint * 1000:.1f}/{self.average_paint() * 1000:.1f} ms",
+            f"load {self.last_load * 1000:.1f} ms",
+        ]
+        for name, hit_rate in self.cache_sources.items():
+            parts.append(f"{name} hit {hit_rate() * 100:.0f}%")
+        if self.last_speech_latency is not None:
+            parts.append(f"speech {self.last_speech_latency * 1000:.0f} ms")
+        return " | ".join(parts)
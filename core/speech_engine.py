@@ -7,10 +7,15 @@ Handles text-to-speech functionality.
 """
 
 from PyQt5.QtCore import QObject, QLocale
-from PyQt5.QtTextToSpeech import QTextToSpeech
+
+from core.trace_recorder import tracer
 
 class SpeechEngine(QObject):
-    """Manages text-to-speech functionality."""
+    """Manages text-to-speech functionality.
+    
+    The QtTextToSpeech backend is imported and created on first use, since
+    loading the platform speech plug-in is one of the slowest startup steps.
+    """
     
     def __init__(self, config_manager):
         """Initialize the speech engine.
@@ -21,9 +26,32 @@ class SpeechEngine(QObject):
         super().__init__()
         self.config_manager = config_manager
         
-        # Initialize text-to-speech engine
-        self.speech = QTextToSpeech()
-        self.setup_speech()
+        # Text-to-speech engine, created by ensure_speech()
+        self.speech = None
+        self.volume = 1.0
+    
+    def ensure_speech(self):
+        """Create the text-to-speech engine if it does not exist yet.
+        
+        Returns:
+            QTextToSpeech: The speech engine.
+        """
+        if self.speech is None:
+            from PyQt5.QtTextToSpeech import QTextToSpeech
+            self.speech = QTextToSpeech()
+            self.setup_speech()
+        return self.speech
+    
+    def warm_up(self):
+        """Create the speech backend ahead of the first pronunciation.
+        
+        QtTextToSpeech cannot synthesise text in advance, so warming up
+        means loading the platform plug-in and choosing the voice before
+        they are needed.
+        """
+        if self.speech is None and self.config_manager.get("auto_pronounce", True):
+            with tracer.span("warm up speech"):
+                self.ensure_speech()
     
     def setup_speech(self):
         """Set up the speech engine with available voices."""
@@ -49,7 +77,7 @@ class SpeechEngine(QObject):
         self.speech.setRate(0.0)  # Normal rate
         
         # Set volume
-        self.speech.setVolume(1.0)  # Maximum volume
+        self.speech.setVolume(self.volume)  # Maximum volume unless muted
     
     def pronounce(self, text):
         """Pronounce the given text.
@@ -61,7 +89,8 @@ class SpeechEngine(QObject):
             return
             
         if text and not self.is_speaking():
-            self.speech.say(text)
+            with tracer.span("pronounce", text=text):
+                self.ensure_speech().say(text)
     
     def stop(self):
         """Stop the current pronunciation."""
@@ -74,12 +103,18 @@ class SpeechEngine(QObject):
         Returns:
             bool: True if speaking, False otherwise.
         """
-        return self.speech.state() == QTextToSpeech.Speaking
+        if self.speech is None:
+            return False
+        return self.speech.state() == self.speech.Speaking
 
     def mute(self):
         """Mute the speech engine."""
-        self.speech.setVolume(0.0)
+        self.volume = 0.0
+        if self.speech is not None:
+            self.speech.setVolume(self.volume)
 
     def unmute(self):
         """Unmute the speech engine."""
-        self.speech.setVolume(1.0)
+        self.volume = 1.0
+        if self.speech is not None:
+            self.speech.setVolume(self.volume)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stall watchdog for the Chinese Character Reading Application.
+Detects when the Qt event loop is blocked and logs where the main thread
+was stuck.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import RotatingFileHandler
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+class StallWatchdog(QObject):
+    """Opt-in watchdog for the GUI thread.
+
+    A QTimer on the GUI thread records a heartbeat. A background thread
+    checks the heartbeat; when it is older than the threshold the GUI
+    thread's Python stack is sampled with sys._current_frames(). Once the
+    event loop runs again, the stall duration and the sampled stacks are
+    written to a rotating log file.
+    """
+
+    MAX_SAMPLES = 5
+
+    def __init__(self, threshold_ms=50, log_file="logs/stall.log",
+                 max_bytes=1024 * 1024, backup_count=3):
+        """Initialize the watchdog.
+
+        Args:
+            threshold_ms (int): Block time that counts as a stall.
+            log_file (str): Path of the rotating log file.
+            max_bytes (int): Size at which the log file is rotated.
+            backup_count (int): Number of rotated files to keep.
+        """
+        super().__init__()
+        self.threshold = threshold_ms / 1000
+        self.stall_count = 0
+
+        self.logger = logging.getLogger("stall_watchdog")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            log_dir = os.path.dirname(log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            handler = RotatingFileHandler(log_file, maxBytes=max_bytes,
+                                          backupCount=backup_count, encoding='utf-8')
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.logger.addHandler(handler)
+
+        # 心跳间隔取阈值的四分之一，检测误差不超过阈值的 25%
+        self.interval = max(threshold_ms // 4, 5)
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.setInterval(self.interval)
+        self._heartbeat_timer.timeout.connect(self._beat)
+
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._samples = []
+        self._stall_start = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start watching. Must be called from the GUI thread."""
+        if self._thread is not None:
+            return
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._heartbeat_timer.start()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+        print(f"Stall watchdog started (threshold {self.threshold * 1000:.0f} ms)")
+
+    def stop(self):
+        """Stop watching."""
+        self._heartbeat_timer.stop()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _beat(self):
+        """Record a heartbeat (GUI thread) and report a finished stall."""
+        with self._lock:
+            now = time.perf_counter()
+            self._last_beat = now
+            if self._stall_start is None:
+                return
+            duration = now - self._stall_start
+            samples = self._samples
+            self._samples = []
+            self._stall_start = None
+        self._report(duration, samples)
+
+    def _watch(self):
+        """Background loop sampling the GUI thread while it is blocked."""
+        poll = self.interval / 1000
+        while not self._stop_event.wait(poll):
+            with self._lock:
+                blocked = time.perf_counter() - self._last_beat - poll
+                if blocked < self.threshold:
+                    continue
+
+                if self._stall_start is None:
+                    self._stall_start = self._last_beat + poll
+                # 长时间阻塞时每隔一个阈值再采样一次，便于看出卡在哪一段
+                if len(self._samples) < self.MAX_SAMPLES and \
+                        blocked >= self.threshold * (len(self._samples) + 1):
+                    frame = sys._current_frames().get(self._main_thread_id)
+                    if frame is not None:
+                        self._samples.append((blocked, traceback.format_stack(frame)))
+
+    def _report(self, duration, samples):
+        """Log a finished stall with its stack samples.
+
+        Args:
+            duration (float): Stall duration in seconds.
+            samples (list): (blocked seconds, formatted stack) pairs.
+        """
+        self.stall_count += 1
+
+        lines = [f"Main thread stalled for {duration * 1000:.1f} ms"]
+        previous = None
+        for blocked, stack in samples:
+            if stack == previous:
+                lines.append(f"  sample at {blocked * 1000:.0f} ms: same stack")
+                continue
+            lines.append(f"  sample at {blocked * 1000:.0f} ms:")
+            lines.extend("    " + line.rstrip().replace("\n", "\n    ") for line in stack)
+            previous = stack
+        self.logger.info("\n".join(lines))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Startup profiler for the Chinese Character Reading Application.
+Records an import and construction timeline when started with
+--profile-startup.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder, Loader
+
+
+class _TimedLoader(Loader):
+    """Loader proxy measuring how long a module takes to execute."""
+
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self.profiler.span(f"import {module.__name__}", kind="import"):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path finder wrapping every loader with a _TimedLoader."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self._finding = set()
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                        spec.loader = _TimedLoader(spec.loader, self.profiler)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+
+class StartupProfiler:
+    """Collects timestamps and nested spans from process start."""
+
+    def __init__(self):
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self.start_time = time.perf_counter()
+        self.events = []   # (start ms, duration ms or None, depth, label, kind)
+        self._depth = 0
+        self._import_timer = None
+
+    def enable(self, track_imports=True):
+        """Start recording.
+
+        Args:
+            track_imports (bool): Also time every module import from now on.
+        """
+        self.enabled = True
+        if track_imports and self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def _now(self):
+        return (time.perf_counter() - self.start_time) * 1000
+
+    def mark(self, label):
+        """Record a point in time.
+
+        Args:
+            label (str): What happened.
+        """
+        if self.enabled:
+            self.events.append((self._now(), None, self._depth, label, "mark"))
+
+    @contextmanager
+    def span(self, label, kind="span"):
+        """Record how long a block takes.
+
+        Args:
+            label (str): What the block does.
+            kind (str): "span" or "import".
+        """
+        if not self.enabled:
+            yield
+            return
+
+        event = [self._now(), 0.0, self._depth, label, kind]
+        self.events.append(event)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            event[1] = self._now() - event[0]
+
+    def report(self, min_import_ms=2.0):
+        """Print the timeline and stop tracking imports.
+
+        Args:
+            min_import_ms (float): Imports faster than this are omitted.
+        """
+        if not self.enabled:
+            return
+
+        if self._import_timer is not None:
+            sys.meta_path.remove(self._import_timer)
+            self._import_timer = None
+
+        print("==== Startup timeline (ms since launch) ====")
+        for start, duration, depth, label, kind in self.events:
+            if kind == "import" and duration < min_import_ms:
+                continue
+            indent = "  " * depth
+            if duration is None:
+                print(f"{start:9.1f}            {indent}* {label}")
+            else:
+                print(f"{start:9.1f} {duration:8.1f}ms {indent}{label}")
+        print("============================================")
+        self.enabled = False
+
+
+# 全局实例：各模块直接调用 profiler.mark()/profiler.span()，未启用时开销可忽略
+profiler = StartupProfiler()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke order exporter for the Chinese Character Reading Application.
+Renders stroke-order animations offscreen and writes them as GIF, APNG or
+PNG frame sequences, spread over a process pool.
+"""
+
+import os
+import shutil
+import time
+from multiprocessing import Pool
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+from core.animation_engine import glyph_transform
+from core.character_loader import load_stroke_paths
+from core.hanzi_data import HanziDataStore
+
+FORMATS = ("gif", "apng", "png")
+
+# 工作进程内的状态，由 _init_worker 设置
+_worker_data = None
+_worker_options = None
+
+
+def render_frames(paths, size, stroke_color="#FF0000"):
+    """Render the stroke order of a character as cumulative frames.
+
+    Frame 0 shows only the grey outline, frame k the first k strokes.
+
+    Args:
+        paths (list): QPainterPath per stroke, in glyph coordinates.
+        size (int): Width and height of the frames in pixels.
+        stroke_color (str): Colour of the drawn strokes.
+
+    Returns:
+        list: len(paths) + 1 QImages.
+    """
+    transform = glyph_transform(size, size)
+    color = QColor(stroke_color)
+
+    frame = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    frame.fill(Qt.white)
+    painter = QPainter(frame)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setWorldTransform(transform)
+    painter.setPen(Qt.NoPen)
+    for path in paths:
+        painter.fillPath(path, QColor(210, 210, 210))
+    painter.end()
+
+    # 每一帧在上一帧的基础上只多画一笔
+    frames = [frame]
+    for path in paths:
+        frame = frame.copy()
+        painter = QPainter(frame)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setWorldTransform(transform)
+        painter.fillPath(path, color)
+        painter.end()
+        frames.append(frame)
+    return frames
+
+
+def _to_pil(image):
+    """Convert a QImage to an RGB Pillow image."""
+    from PIL import Image
+
+    image = image.convertToFormat(QImage.Format_RGBA8888)
+    bits = image.constBits()
+    bits.setsize(image.byteCount())
+    return Image.frombuffer("RGBA", (image.width(), image.height()), bytes(bits),
+                            "raw", "RGBA", image.bytesPerLine(), 1).convert("RGB")
+
+
+def output_path(out_dir, character, fmt):
+    """Get where the export of a character is written.
+
+    Args:
+        out_dir (str): Output directory.
+        character (str): The character.
+        fmt (str): One of FORMATS.
+
+    Returns:
+        str: A .gif or .png file, or a directory of frames for "png".
+    """
+    if fmt == "png":
+        return os.path.join(out_dir, character)
+    return os.path.join(out_dir, f"{character}.{'gif' if fmt == 'gif' else 'png'}")
+
+
+def save_frames(frames, path, fmt, interval=500, hold=1500):
+    """Write rendered frames, replacing path atomically.
+
+    The output is first written under a temporary name, so an interrupted
+    export never leaves a truncated file behind.
+
+    Args:
+        frames (list): QImages from render_frames().
+        path (str): Target from output_path().
+        fmt (str): One of FORMATS.
+        interval (int): Milliseconds per stroke.
+        hold (int): Milliseconds the finished character is shown.
+    """
+    temp_path = f"{path}.part"
+    if fmt == "png":
+        shutil.rmtree(temp_path, ignore_errors=True)
+        os.makedirs(temp_path)
+        for number, frame in enumerate(frames):
+            frame.save(os.path.join(temp_path, f"{number:02d}.png"), "PNG")
+        os.replace(temp_path, path)
+        return
+
+    images = [_to_pil(frame) for frame in frames]
+    durations = [interval] * (len(images) - 1) + [hold]
+    images[0].save(temp_path, format="GIF" if fmt == "gif" else "PNG",
+                   save_all=True, append_images=images[1:],
+                   duration=durations, loop=0)
+    os.replace(temp_path, path)
+
+
+def _init_worker(graphics_path, options):
+    """Set up a pool process (each keeps its own data store)."""
+    global _worker_data, _worker_options
+    _worker_data = HanziDataStore(graphics_path)
+    _worker_options = options
+
+
+def _export_one(character):
+    """Render and save one character in a pool process.
+
+    Returns:
+        tuple: (character, exported, error message or None); characters
+            without stroke data are neither exported nor errors.
+    """
+    options = _worker_options
+    try:
+        paths = load_stroke_paths(_worker_data, character)
+        if not paths:
+            return character, False, None
+        frames = render_frames(paths, options['size'], options['stroke_color'])
+        save_frames(frames, output_path(options['out_dir'], character, options['fmt']),
+                    options['fmt'], options['interval'], options['hold'])
+        return character, True, None
+    except Exception as e:
+        return character, False, str(e)
+
+
+def export_animations(characters, out_dir, graphics_path="assets/graphics.txt", fmt="gif",
+                      size=256, stroke_color="#FF0000", interval=500, hold=1500,
+                      jobs=None, overwrite=False, progress=print):
+    """Export stroke-order animations of many characters.
+
+    Characters whose output already exists are skipped unless overwrite is
+    set, so an interrupted export continues where it stopped. Characters
+    without stroke data are skipped as well.
+
+    Args:
+        characters (iterable): Characters to export.
+        out_dir (str): Output directory.
+        graphics_path (str): Path to graphics.txt.
+        fmt (str): "gif", "apng" or "png" (one directory of frames per character).
+        size (int): Frame size in pixels.
+        stroke_color (str): Colour of the drawn strokes.
+        interval (int): Milliseconds per stroke.
+        hold (int): Milliseconds the finished character is shown.
+        jobs (int, optional): Number of processes, default one per CPU.
+        overwrite (bool): Re-export characters that already have output.
+        progress (callable): Called with progress messages.
+
+    Returns:
+        tuple: (exported count, skipped count, {character: error}).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt != "png":
+        import PIL  # noqa: F401  GIF/APNG 需要 Pillow，在启动进程池前检查
+
+    os.makedirs(out_dir, exist_ok=True)
+    characters = list(dict.fromkeys(characters))
+    todo = [char for char in characters
+            if overwrite or not os.path.exists(output_path(out_dir, char, fmt))]
+    skipped = len(characters) - len(todo)
+    if skipped:
+        progress(f"Skipping {skipped} characters exported earlier")
+
+    options = {
+        'out_dir': out_dir, 'fmt': fmt, 'size': size, 'stroke_color': stroke_color,
+        'interval': interval, 'hold': hold,
+    }
+    errors = {}
+    exported = 0
+    started = time.perf_counter()
+    with Pool(jobs, initializer=_init_worker, initargs=(graphics_path, options)) as pool:
+        done = 0
+        for character, ok, error in pool.imap_unordered(_export_one, todo, chunksize=16):
+            done += 1
+            if ok:
+                exported += 1
+            elif error:
+                errors[character] = error
+            else:
+                skipped += 1
+            if done % 500 == 0 or done == len(todo):
+                progress(f"{done}/{len(todo)} characters "
+                         f"({time.perf_counter() - started:.0f} s)")
+
+    return exported, skipped, errors
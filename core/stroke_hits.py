@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke hit testing for the Chinese Character Reading Application.
+Finds the stroke under a click in glyph coordinates.
+"""
+
+from PyQt5.QtCore import QPointF, QRectF
+
+# 点击落在笔画外这么近（字框 1024）仍算点中
+HIT_MARGIN = 24
+
+
+class StrokeHitIndex:
+    """Bounding boxes and paths of one character's strokes.
+
+    The margin-grown bounding boxes are computed once per character, so a
+    hit test is a cheap box check that usually leaves one or two strokes
+    for the exact path test.
+    """
+
+    def __init__(self, paths, margin=HIT_MARGIN):
+        """Build the index.
+
+        Args:
+            paths (list): QPainterPath per stroke, in glyph coordinates.
+            margin (float): Distance outside a stroke that still counts.
+        """
+        self.paths = list(paths)
+        self.margin = margin
+        self.bounds = [path.boundingRect().adjusted(-margin, -margin, margin, margin)
+                       for path in self.paths]
+
+    def stroke_at(self, x, y):
+        """Find the stroke at a point.
+
+        Later strokes are drawn on top, so they win where strokes overlap.
+        A point just outside the strokes still picks one that is within
+        the margin.
+
+        Args:
+            x (float): X in glyph coordinates.
+            y (float): Y in glyph coordinates.
+
+        Returns:
+            int: Stroke index, or -1 if no stroke is there.
+        """
+        point = QPointF(x, y)
+        candidates = [index for index in range(len(self.bounds) - 1, -1, -1)
+                      if self.bounds[index].contains(point)]
+
+        for index in candidates:
+            if self.paths[index].contains(point):
+                return index
+
+        area = QRectF(x - self.margin, y - self.margin, 2 * self.margin, 2 * self.margin)
+        for index in candidates:
+            if self.paths[index].intersects(area):
+                return index
+        return -1
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke order tiles for the Chinese Character Reading Application.
+Renders one tile per cumulative stroke from graphics.txt and caches the
+resulting strip on disk under a hash of its content.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+from core.animation_engine import glyph_transform, parse_svg_path
+
+# 渲染方式变化时加一，使旧缓存失效
+TILE_VERSION = 1
+
+
+def render_tile(paths, count, size, stroke_color="#FF0000"):
+    """Render the character with its first count strokes drawn.
+
+    Args:
+        paths (list): QPainterPath per stroke, in glyph coordinates.
+        count (int): Number of strokes drawn in colour.
+        size (int): Width and height of the tile in pixels.
+        stroke_color (str): Colour of the drawn strokes.
+
+    Returns:
+        QImage: The tile.
+    """
+    tile = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    tile.fill(Qt.white)
+    painter = QPainter(tile)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setWorldTransform(glyph_transform(size, size))
+    for number, path in enumerate(paths):
+        painter.fillPath(path, QColor(stroke_color) if number < count else QColor(210, 210, 210))
+    painter.end()
+    return tile
+
+
+class StrokeTileCache:
+    """Disk cache of stroke order strips.
+
+    A strip is a single row of tiles, tile k showing the first k + 1
+    strokes. The file name is a hash of the stroke data and rendering
+    options, so edits of graphics.txt never serve an outdated strip.
+    """
+
+    def __init__(self, hanzi_data, cache_dir="cache/stroke_tiles", tile_size=128,
+                 stroke_color="#FF0000", max_workers=4):
+        """Initialize the tile cache.
+
+        Args:
+            hanzi_data (HanziDataStore): Stroke data source.
+            cache_dir (str): Directory of the cached strips.
+            tile_size (int): Width and height of one tile in pixels.
+            stroke_color (str): Colour of the drawn strokes.
+            max_workers (int): Threads rendering the tiles of one strip.
+        """
+        self.hanzi_data = hanzi_data
+        self.cache_dir = cache_dir
+        self.tile_size = tile_size
+        self.stroke_color = stroke_color
+        self.max_workers = max_workers
+
+    def _strip_key(self, strokes):
+        content = json.dumps([TILE_VERSION, self.tile_size, self.stroke_color, strokes])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def strip_path(self, character):
+        """Get the cached strip of a character, rendering it if needed.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            str: Path of the strip PNG, or None if there is no stroke data.
+        """
+        data = self.hanzi_data.get_graphics(character)
+        if not data or not data.get('strokes'):
+            return None
+
+        path = os.path.join(self.cache_dir, f"{self._strip_key(data['strokes'])}.png")
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            strip = self.render_strip(data['strokes'])
+            temp_path = f"{path}.{os.getpid()}.part"
+            strip.save(temp_path, "PNG")
+            os.replace(temp_path, path)
+        return path
+
+    def render_strip(self, strokes):
+        """Render the tiles of all strokes side by side.
+
+        Args:
+            strokes (list): SVG path strings from graphics.txt.
+
+        Returns:
+            QImage: The strip, len(strokes) tiles wide.
+        """
+        paths = [parse_svg_path(stroke) for stroke in strokes]
+        size = self.tile_size
+
+        # 各张图互不相干，QPainter 在 QImage 上绘制可并行
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            tiles = list(pool.map(
+                lambda count: render_tile(paths, count, size, self.stroke_color),
+                range(1, len(paths) + 1)))
+
+        strip = QImage(size * len(tiles), size, QImage.Format_ARGB32_Premultiplied)
+        painter = QPainter(strip)
+        for number, tile in enumerate(tiles):
+            painter.drawImage(number * size, 0, tile)
+        painter.end()
+        return strip
+
+    def get_tiles(self, character):
+        """Get the stroke order tiles of a character.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            list: QImage per stroke, empty if there is no stroke data.
+        """
+        path = self.strip_path(character)
+        if path is None:
+            return []
+        strip = QImage(path)
+        size = strip.height()
+        return [strip.copy(QRect(x, 0, size, size)) for x in range(0, strip.width(), size)]
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke type index for the Chinese Character Reading Application.
+Classifies every stroke of graphics.txt as 横/竖/撇/捺/点/提/折... from
+its median, and stores the result as a compact index file.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from core.medians import resample, SAMPLES
+
+# 笔画类型，索引即类型编码
+STROKE_TYPES = (
+    "横", "竖", "撇", "捺", "点", "提",
+    "横折", "横撇", "横钩", "竖折", "竖提", "竖钩", "撇折", "撇点", "斜钩", "折",
+)
+TYPE_CODES = {name: code for code, name in enumerate(STROKE_TYPES)}
+
+# 方向（Y 轴向上，单位：度）
+_RIGHT, _UP_RIGHT, _DOWN, _DOWN_LEFT, _DOWN_RIGHT, _OTHER = range(6)
+
+DOT_LENGTH = 180      # 短于此长度的直笔视为点（字框为 1024）
+BEND_DEVIATION = 0.1  # 偏离首尾连线超过笔长的该比例视为折笔
+HOOK_FRACTION = 0.3   # 折后部分短于笔长的该比例视为钩
+
+
+def _directions(vectors):
+    """Bin vectors of shape (..., 2) into the direction constants."""
+    angle = np.degrees(np.arctan2(vectors[..., 1], vectors[..., 0]))
+    return np.select(
+        [(angle >= -20) & (angle <= 20),
+         (angle > 20) & (angle < 80),
+         (angle >= -110) & (angle <= -70),
+         (angle < -110) & (angle >= -175),
+         (angle < -20) & (angle > -70)],
+        [_RIGHT, _UP_RIGHT, _DOWN, _DOWN_LEFT, _DOWN_RIGHT],
+        _OTHER)
+
+
+def classify(points):
+    """Classify resampled stroke medians.
+
+    Each stroke is split at the point farthest from its start-end chord.
+    Strokes that stay close to the chord are classified by the chord's
+    direction and length. Bent strokes are classified by the directions
+    of the two parts and by how long the second part is.
+
+    Args:
+        points (numpy.ndarray): Array of shape (strokes, SAMPLES, 2).
+
+    Returns:
+        numpy.ndarray: uint8 type codes, one per stroke.
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.uint8)
+
+    start, end = points[:, 0], points[:, -1]
+    chord = end - start
+    length = np.hypot(*np.diff(points, axis=1).transpose(2, 0, 1)).sum(axis=1)
+    chord_length = np.maximum(np.hypot(chord[:, 0], chord[:, 1]), 1e-6)
+
+    # 各点到首尾连线的距离，取最远点为折点
+    relative = points - start[:, None, :]
+    deviation = np.abs(relative[..., 0] * chord[:, None, 1]
+                       - relative[..., 1] * chord[:, None, 0]) / chord_length[:, None]
+    corner_index = deviation.argmax(axis=1)
+    corner = points[np.arange(len(points)), corner_index]
+    bent = deviation.max(axis=1) > BEND_DEVIATION * np.maximum(length, 1e-6)
+
+    straight_dir = _directions(chord)
+    first_dir = _directions(corner - start)
+    second_dir = _directions(end - corner)
+    second = np.hypot(*(end - corner).T)
+    hook = second < HOOK_FRACTION * np.maximum(length, 1e-6)
+
+    straight = np.select(
+        [(length < DOT_LENGTH) & np.isin(straight_dir, (_DOWN_RIGHT, _DOWN_LEFT, _DOWN)),
+         straight_dir == _RIGHT,
+         straight_dir == _UP_RIGHT,
+         straight_dir == _DOWN,
+         straight_dir == _DOWN_LEFT,
+         straight_dir == _DOWN_RIGHT],
+        [TYPE_CODES["点"], TYPE_CODES["横"], TYPE_CODES["提"], TYPE_CODES["竖"],
+         TYPE_CODES["撇"], TYPE_CODES["捺"]],
+        TYPE_CODES["点"])
+
+    compound = np.select(
+        [(first_dir == _RIGHT) & (second_dir == _DOWN),
+         (first_dir == _RIGHT) & (second_dir == _DOWN_LEFT) & hook,
+         (first_dir == _RIGHT) & (second_dir == _DOWN_LEFT),
+         (first_dir == _DOWN) & (second_dir == _RIGHT),
+         (first_dir == _DOWN) & (second_dir == _UP_RIGHT),
+         (first_dir == _DOWN) & hook,
+         (first_dir == _DOWN_LEFT) & np.isin(second_dir, (_RIGHT, _UP_RIGHT)),
+         (first_dir == _DOWN_LEFT) & (second_dir == _DOWN_RIGHT),
+         (first_dir == _DOWN_RIGHT) & hook],
+        [TYPE_CODES["横折"], TYPE_CODES["横钩"], TYPE_CODES["横撇"], TYPE_CODES["竖折"],
+         TYPE_CODES["竖提"], TYPE_CODES["竖钩"], TYPE_CODES["撇折"], TYPE_CODES["撇点"],
+         TYPE_CODES["斜钩"]],
+        TYPE_CODES["折"])
+
+    return np.where(bent, compound, straight).astype(np.uint8)
+
+
+class StrokeTypeIndex:
+    """Stroke types of all characters.
+
+    Stored as three arrays: the characters, the offset of each character's
+    first stroke and one uint8 type code per stroke. Lookups are a slice;
+    "characters containing a type" is a single vectorised scan.
+    """
+
+    def __init__(self, characters=(), offsets=None, codes=None):
+        """Initialize the index.
+
+        Args:
+            characters (sequence): Characters in index order.
+            offsets (numpy.ndarray): int32, len(characters) + 1 stroke offsets.
+            codes (numpy.ndarray): uint8 type code per stroke.
+        """
+        self.characters = list(characters)
+        self.offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int32)
+        self.codes = codes if codes is not None else np.zeros(0, dtype=np.uint8)
+        self._positions = {char: number for number, char in enumerate(self.characters)}
+
+    @classmethod
+    def build(cls, graphics_path="assets/graphics.txt"):
+        """Classify every stroke in graphics.txt.
+
+        Args:
+            graphics_path (str): Path to the Make Me A Hanzi graphics.txt.
+
+        Returns:
+            StrokeTypeIndex: The index.
+        """
+        characters, counts, samples = [], [], []
+        with open(graphics_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                medians = record.get('medians') or []
+                characters.append(record['character'])
+                counts.append(len(medians))
+                samples.extend(resample(median, SAMPLES) for median in medians)
+
+        points = np.stack(samples) if samples else np.zeros((0, SAMPLES, 2), np.float32)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        return cls(characters, offsets, classify(points))
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save().
+
+        Args:
+            path (str): The .npz file.
+
+        Returns:
+            StrokeTypeIndex: The index.
+        """
+        with np.load(path) as data:
+            return cls(data['characters'].tolist(), data['offsets'], data['codes'])
+
+    def save(self, path):
+        """Write the index as a compressed .npz file.
+
+        Args:
+            path (str): Target file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(path, characters=np.array(self.characters),
+                            offsets=self.offsets, codes=self.codes)
+
+    def __contains__(self, character):
+        return character in self._positions
+
+    def __len__(self):
+        return len(self.characters)
+
+    def codes_of(self, character):
+        """Get the type codes of a character's strokes.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            numpy.ndarray: uint8 codes in stroke order, empty if unknown.
+        """
+        number = self._positions.get(character)
+        if number is None:
+            return self.codes[:0]
+        return self.codes[self.offsets[number]:self.offsets[number + 1]]
+
+    def types_of(self, character):
+        """Get the type names of a character's strokes.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            list: Names from STROKE_TYPES in stroke order.
+        """
+        return [STROKE_TYPES[code] for code in self.codes_of(character)]
+
+    def characters_with(self, stroke_type):
+        """Get all characters containing a stroke type.
+
+        Args:
+            stroke_type (str): A name from STROKE_TYPES, e.g. "竖钩".
+
+        Returns:
+            list: Characters in index order.
+        """
+        code = TYPE_CODES.get(stroke_type)
+        if code is None:
+            return []
+        strokes = np.flatnonzero(self.codes == code)
+        owners = np.unique(np.searchsorted(self.offsets, strokes, side='right') - 1)
+        return [self.characters[number] for number in owners]
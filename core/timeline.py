@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stroke animation timeline for the Chinese Character Reading Application.
+Describes the whole animation of a character as a function of elapsed time.
+"""
+
+
+class StrokeTimeline:
+    """Which strokes are shown at any moment of the animation.
+
+    Every repeat writes the strokes one per interval, shows the finished
+    character for one more interval and then only the outline for the hold
+    time. All queries are plain arithmetic on the elapsed time, so pausing,
+    seeking and stepping never replay earlier strokes.
+    """
+
+    def __init__(self, strokes, interval, hold, repeats):
+        """Initialize the timeline.
+
+        Args:
+            strokes (int): Number of strokes.
+            interval (int): Milliseconds between strokes.
+            hold (int): Milliseconds the outline is shown after each repeat.
+            repeats (int): How often the character is written.
+        """
+        self.strokes = strokes
+        self.interval = max(1, interval)
+        self.hold = max(0, hold)
+        self.repeats = max(1, repeats)
+        self.writing = (strokes + 1) * self.interval  # 书写及完整字停留一拍
+        self.cycle = self.writing + self.hold
+        self.duration = self.repeats * self.cycle
+
+    def state(self, elapsed):
+        """Get the animation state at a point in time.
+
+        Args:
+            elapsed (int): Milliseconds since the start.
+
+        Returns:
+            tuple: (repeat, visible strokes); repeat equals repeats once finished.
+        """
+        if elapsed >= self.duration:
+            return self.repeats, 0
+        repeat, offset = divmod(max(0, elapsed), self.cycle)
+        if offset >= self.writing:
+            return repeat, 0
+        return repeat, offset // self.interval
+
+    def visible_strokes(self, elapsed):
+        """Get the number of strokes shown at a point in time."""
+        return self.state(elapsed)[1]
+
+    def next_change(self, elapsed):
+        """Get when the state changes next.
+
+        Args:
+            elapsed (int): Milliseconds since the start.
+
+        Returns:
+            int: Time of the next change, or None once finished.
+        """
+        if elapsed >= self.duration:
+            return None
+        repeat, offset = divmod(max(0, elapsed), self.cycle)
+        if offset >= self.writing:
+            return (repeat + 1) * self.cycle
+        return repeat * self.cycle + (offset // self.interval + 1) * self.interval
+
+    def stroke_time(self, repeat, visible):
+        """Get the moment a repeat shows a number of strokes.
+
+        Args:
+            repeat (int): Repeat index.
+            visible (int): Number of visible strokes, 0 to strokes.
+
+        Returns:
+            int: Milliseconds since the start.
+        """
+        repeat = min(max(0, repeat), self.repeats - 1)
+        visible = min(max(0, visible), self.strokes)
+        return repeat * self.cycle + visible * self.interval
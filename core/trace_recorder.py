@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Trace recorder for the Chinese Character Reading Application.
+Records timing spans of the navigation path into a ring buffer and exports
+them as JSONL or Chrome trace_event JSON (viewable in Perfetto).
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class _NullSpan:
+    """Span used while recording is off; does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """A timed block recorded as a Chrome trace 'complete' event."""
+
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.recorder._record({
+            'name': self.name,
+            'cat': 'app',
+            'ph': 'X',
+            'ts': self.recorder._micros(self.start),
+            'dur': round((end - self.start) * 1e6, 1),
+            'pid': self.recorder.pid,
+            'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+class TraceRecorder:
+    """Ring buffer of trace events.
+
+    While disabled, span() returns a shared no-op context manager, so the
+    instrumented code pays one attribute check per span.
+    """
+
+    def __init__(self, capacity=10000):
+        """Initialize a disabled recorder.
+
+        Args:
+            capacity (int): Maximum number of events kept.
+        """
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+        self.pid = os.getpid()
+        self.navigation_id = 0
+        self.first_paint_pending = False
+        self._origin = time.perf_counter()
+
+    def set_enabled(self, enabled):
+        """Start or stop recording.
+
+        Args:
+            enabled (bool): Whether to record.
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.first_paint_pending = False
+
+    def set_capacity(self, capacity):
+        """Change the ring buffer size, keeping the newest events.
+
+        Args:
+            capacity (int): Maximum number of events kept.
+        """
+        self.events = deque(self.events, maxlen=capacity)
+
+    def clear(self):
+        """Drop all recorded events."""
+        self.events.clear()
+
+    def _micros(self, stamp):
+        return round((stamp - self._origin) * 1e6, 1)
+
+    def _record(self, event):
+        self.events.append(event)
+
+    def span(self, name, **args):
+        """Time a block of code.
+
+        Args:
+            name (str): Span name.
+            **args: Extra values shown with the span.
+
+        Returns:
+            A context manager.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        args.setdefault('nav', self.navigation_id)
+        return _Span(self, name, args)
+
+    def instant(self, name, **args):
+        """Record a point in time.
+
+        Args:
+            name (str): Event name.
+            **args: Extra values shown with the event.
+        """
+        if not self.enabled:
+            return
+        args.setdefault('nav', self.navigation_id)
+        self._record({
+            'name': name,
+            'cat': 'app',
+            'ph': 'i',
+            's': 't',
+            'ts': self._micros(time.perf_counter()),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    def begin_navigation(self, name, **args):
+        """Start the root span of a navigation (key press, click...).
+
+        The following spans carry the same 'nav' id, and the next paint of
+        the character canvas is recorded as 'first paint'.
+
+        Args:
+            name (str): Span name, e.g. "show_next_character".
+            **args: Extra values shown with the span.
+
+        Returns:
+            A context manager.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        self.navigation_id += 1
+        self.first_paint_pending = True
+        return self.span(name, **args)
+
+    def export_jsonl(self, path):
+        """Write the events as JSON lines.
+
+        Args:
+            path (str): Output file.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in list(self.events):
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def export_chrome_trace(self, path):
+        """Write the events as Chrome trace_event JSON.
+
+        Args:
+            path (str): Output file, open it in https://ui.perfetto.dev.
+        """
+        events = list(self.events)
+        events.append({
+            'name': 'thread_name', 'ph': 'M', 'pid': self.pid,
+            'tid': threading.main_thread().ident, 'args': {'name': 'GUI thread'},
+        })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'},
+                      f, ensure_ascii=False)
+
+    def export(self, path):
+        """Export by file extension: .jsonl for JSON lines, otherwise Chrome JSON.
+
+        Args:
+            path (str): Output file.
+        """
+        if path.lower().endswith('.jsonl'):
+            self.export_jsonl(path)
+        else:
+            self.export_chrome_trace(path)
+
+
+# 全局实例：未启用时 span() 只做一次属性判断
+tracer = TraceRecorder()
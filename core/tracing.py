@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tracing practice for the Chinese Character Reading Application.
+Checks strokes traced with the mouse or a touchscreen against the stroke
+medians of Make Me A Hanzi using dynamic time warping.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.medians import resample, resample_all, SAMPLES
+from core.trace_recorder import tracer
+
+# 平均偏差小于该值（字框 1024）算写对
+MATCH_TOLERANCE = 110
+
+
+def dtw_distance(a, b):
+    """Dynamic time warping distance between two resampled polylines.
+
+    The cost matrix is filled one anti-diagonal at a time, each diagonal
+    being a single vectorised step.
+
+    Args:
+        a (numpy.ndarray): Array of shape (n, 2).
+        b (numpy.ndarray): Array of shape (m, 2).
+
+    Returns:
+        float: Average point distance along the best alignment.
+    """
+    n, m = len(a), len(b)
+    cost = np.hypot(a[:, None, 0] - b[None, :, 0], a[:, None, 1] - b[None, :, 1])
+    total = np.full((n + 1, m + 1), np.inf)
+    total[0, 0] = 0.0
+    for diagonal in range(2, n + m + 1):
+        i = np.arange(max(1, diagonal - m), min(n, diagonal - 1) + 1)
+        j = diagonal - i
+        best = np.minimum(np.minimum(total[i - 1, j], total[i, j - 1]), total[i - 1, j - 1])
+        total[i, j] = cost[i - 1, j - 1] + best
+    return float(total[n, m]) / (n + m)
+
+
+class StrokeMatcher:
+    """Resampled medians per character, cached for matching."""
+
+    def __init__(self, hanzi_data, cache_size=32):
+        """Initialize the matcher.
+
+        Args:
+            hanzi_data (HanziDataStore): Stroke data source.
+            cache_size (int): Number of characters kept.
+        """
+        self.hanzi_data = hanzi_data
+        self.cache_size = cache_size
+        self._medians = OrderedDict()  # character -> (strokes, SAMPLES, 2)
+
+    def medians(self, character):
+        """Get the resampled medians of a character.
+
+        Args:
+            character (str): The character.
+
+        Returns:
+            numpy.ndarray: Array of shape (strokes, SAMPLES, 2), in glyph coordinates.
+        """
+        medians = self._medians.get(character)
+        if medians is None:
+            record = self.hanzi_data.get_graphics(character) or {}
+            medians = resample_all(record.get('medians') or [])
+            self._medians[character] = medians
+            while len(self._medians) > self.cache_size:
+                self._medians.popitem(last=False)
+        else:
+            self._medians.move_to_end(character)
+        return medians
+
+    def distance(self, character, stroke, points):
+        """Compare a traced stroke with the expected one.
+
+        Args:
+            character (str): The character.
+            stroke (int): Index of the expected stroke.
+            points (sequence): Traced (x, y) points in glyph coordinates.
+
+        Returns:
+            float: Average deviation in glyph units, infinite for a stroke
+            traced in the wrong direction.
+        """
+        traced = resample(points, SAMPLES)
+        median = self.medians(character)[stroke]
+        # 起点和终点对调更近，说明笔顺方向写反了
+        forward = np.hypot(*(traced[[0, -1]] - median[[0, -1]]).T).sum()
+        backward = np.hypot(*(traced[[0, -1]] - median[[-1, 0]]).T).sum()
+        if backward < forward:
+            return float('inf')
+        return dtw_distance(traced, median)
+
+
+class TracingSession(QObject):
+    """Stroke-by-stroke tracing of one character."""
+
+    # Emitted with the stroke index when a traced stroke is accepted
+    stroke_matched = pyqtSignal(int)
+    # Emitted with the stroke index when a traced stroke is rejected
+    stroke_missed = pyqtSignal(int)
+    # Emitted when all strokes have been traced
+    completed = pyqtSignal()
+
+    def __init__(self, matcher, tolerance=MATCH_TOLERANCE):
+        """Initialize the session.
+
+        Args:
+            matcher (StrokeMatcher): Source of the expected strokes.
+            tolerance (float): Largest accepted average deviation.
+        """
+        super().__init__()
+        self.matcher = matcher
+        self.tolerance = tolerance
+        self.character = ""
+        self.next_stroke = 0
+        self.stroke_total = 0
+        self.last_distance = None
+
+    def begin(self, character):
+        """Start tracing a character from its first stroke.
+
+        Args:
+            character (str): The character.
+        """
+        self.character = character
+        self.next_stroke = 0
+        self.stroke_total = len(self.matcher.medians(character)) if character else 0
+        self.last_distance = None
+
+    def is_complete(self):
+        """Whether all strokes were traced."""
+        return self.next_stroke >= self.stroke_total
+
+    def expected_start(self):
+        """Get where the next stroke starts, to show as a hint.
+
+        Returns:
+            tuple: (x, y) in glyph coordinates, or None when complete.
+        """
+        if self.is_complete():
+            return None
+        x, y = self.matcher.medians(self.character)[self.next_stroke][0]
+        return float(x), float(y)
+
+    def on_track(self, point):
+        """Check whether a point of an unfinished trace is near the next stroke.
+
+        Cheap enough to run on every mouse move: one vectorised distance
+        to the resampled median.
+
+        Args:
+            point (tuple): (x, y) in glyph coordinates.
+
+        Returns:
+            bool: True if the point is within twice the tolerance of the stroke.
+        """
+        if self.is_complete():
+            return False
+        median = self.matcher.medians(self.character)[self.next_stroke]
+        gaps = np.hypot(median[:, 0] - point[0], median[:, 1] - point[1])
+        return bool(gaps.min() <= 2 * self.tolerance)
+
+    def submit(self, points):
+        """Check a traced stroke.
+
+        Args:
+            points (sequence): Traced (x, y) points in glyph coordinates.
+
+        Returns:
+            bool: Whether the stroke was accepted.
+        """
+        if self.is_complete() or len(points) < 2:
+            return False
+
+        stroke = self.next_stroke
+        with tracer.span("match stroke", stroke=stroke):
+            self.last_distance = self.matcher.distance(self.character, stroke, points)
+
+        if self.last_distance > self.tolerance:
+            self.stroke_missed.emit(stroke)
+            return False
+
+        self.next_stroke += 1
+        self.stroke_matched.emit(stroke)
+        if self.is_complete():
+            self.completed.emit()
+        return True
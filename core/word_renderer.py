@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Word renderer for the Chinese Character Reading Application.
+Lays out the characters of a 组词 entry side by side and animates their
+strokes one character after the other.
+"""
+
+from PyQt5.QtCore import QObject, QTimer, QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath, QTransform
+
+from core.animation_engine import stroke_palette, OUTLINE_BRUSH
+from core.font_glyphs import font_glyph_path
+
+
+def glyph_bounds(paths):
+    """Get the bounding box of a glyph's strokes.
+
+    Args:
+        paths (list): QPainterPath per stroke, in glyph coordinates.
+
+    Returns:
+        QRectF: The united bounds, empty if there are no strokes.
+    """
+    bounds = QRectF()
+    for path in paths:
+        bounds = bounds.united(path.boundingRect())
+    return bounds
+
+
+class WordRenderer(QObject):
+    """Renders and animates a multi-character word.
+
+    All characters share one scale so their strokes keep the same weight.
+    The scale and each glyph's position come from the real stroke bounds,
+    so narrow or short glyphs are centred in their slot rather than placed
+    by the fixed em-box offset used for single characters.
+    """
+
+    # Signal emitted when the drawing changes
+    animation_updated = pyqtSignal()
+    # Signal emitted when all strokes of the word are shown
+    animation_completed = pyqtSignal()
+
+    def __init__(self, character_loader, config_manager):
+        """Initialize the word renderer.
+
+        Args:
+            character_loader (CharacterLoader): Shared geometry cache.
+            config_manager: The configuration manager.
+        """
+        super().__init__()
+        self.character_loader = character_loader
+        self.config_manager = config_manager
+        self.word = ""
+        self.glyphs = []  # (paths, bounds, background path) per character
+        self.visible_strokes = 0
+        self.total_strokes = 0
+        self._geometry = {}  # character -> stroke paths of the current word
+        self._pending = set()  # characters still loading in the background
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.animate_next_stroke)
+
+        character_loader.geometry_cached.connect(self.on_geometry_cached)
+
+    @property
+    def is_writing(self):
+        """Whether the word is still loading or being written."""
+        return bool(self._pending) or self.timer.isActive()
+
+    def set_word(self, word):
+        """Show a word and start animating it.
+
+        Cached characters are used at once; the others are prefetched and
+        the animation starts when the last of them has arrived.
+
+        Args:
+            word (str): Two to four characters; characters without stroke
+                data are written in one go with their font glyph.
+        """
+        self.clear()
+        self.word = word
+        for char in word:
+            paths = self.character_loader.cached(char)
+            if paths is None:
+                self._pending.add(char)
+            else:
+                self._geometry[char] = paths
+        if self._pending:
+            self.character_loader.prefetch(self._pending)
+        else:
+            self._start()
+        self.animation_updated.emit()
+
+    def on_geometry_cached(self, character, paths):
+        """Start the word once the last of its characters has been loaded.
+
+        Args:
+            character (str): The loaded character.
+            paths (list): Its stroke paths.
+        """
+        if character not in self._pending:
+            return
+        self._pending.discard(character)
+        self._geometry[character] = paths
+        if not self._pending:
+            self._start()
+            self.animation_updated.emit()
+
+    def _start(self):
+        """Lay out the glyphs of the word and start writing it."""
+        self.glyphs = []
+        for char in self.word:
+            paths = self._geometry.get(char)
+            if not paths:
+                glyph = font_glyph_path(self.config_manager.get("font_family", "SimHei"), char)
+                if glyph.isEmpty():
+                    continue
+                paths = [glyph]
+            background = QPainterPath()
+            for path in paths:
+                background.addPath(path)
+            background.setFillRule(Qt.WindingFill)
+            self.glyphs.append((paths, glyph_bounds(paths), background))
+
+        self.total_strokes = sum(len(paths) for paths, _, _ in self.glyphs)
+        self.visible_strokes = 0
+        if self.glyphs:
+            self.timer.start(self.config_manager.get("animation_interval", 1000))
+
+    def clear(self):
+        """Stop and forget the current word."""
+        self.timer.stop()
+        self.word = ""
+        self.glyphs = []
+        self.total_strokes = self.visible_strokes = 0
+        self._geometry = {}
+        self._pending = set()
+
+    def animate_next_stroke(self):
+        """Show the next stroke of the word."""
+        if self.visible_strokes >= self.total_strokes:
+            self.timer.stop()
+            self.animation_completed.emit()
+            return
+        self.visible_strokes += 1
+        self.animation_updated.emit()
+
+    def layout(self, rect):
+        """Compute where each character is drawn.
+
+        Args:
+            rect (QRectF): Area available for the word.
+
+        Returns:
+            list: QTransform per character, glyph to device coordinates.
+        """
+        if not self.glyphs:
+            return []
+        slot = rect.width() / len(self.glyphs)
+        # 统一缩放：以最宽/最高的字为准，并留出字间距
+        extent = max(max(bounds.width(), bounds.height()) for _, bounds, _ in self.glyphs)
+        scale = min(slot * 0.85, rect.height() * 0.8) / max(extent, 1.0)
+
+        transforms = []
+        for number, (_, bounds, _) in enumerate(self.glyphs):
+            center = bounds.center()
+            transform = QTransform()
+            transform.translate(rect.left() + slot * (number + 0.5), rect.center().y())
+            transform.scale(scale, -scale)  # Y轴翻转
+            transform.translate(-center.x(), -center.y())
+            transforms.append(transform)
+        return transforms
+
+    def render(self, painter, rect):
+        """Render the word.
+
+        Args:
+            painter (QPainter): The painter to render with.
+            rect (QRect): The rectangle to render in.
+        """
+        if not self.glyphs:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        palette = stroke_palette(self.config_manager)
+
+        base = painter.worldTransform()
+        remaining = self.visible_strokes
+        for (paths, _, outline), transform in zip(self.glyphs, self.layout(QRectF(rect))):
+            painter.setWorldTransform(transform * base)
+            painter.fillPath(outline, OUTLINE_BRUSH)
+            for number, path in enumerate(paths[:max(remaining, 0)]):
+                painter.fillPath(path, palette[number % len(palette)])
+            remaining -= len(paths)
+        painter.restore()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Practice worksheet generator for the Chinese Character Reading Application.
+Lays out characters with their stroke order and 描红 tracing grids and
+writes them to a PDF.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import Qt, QRectF, QMarginsF
+from PyQt5.QtGui import (
+    QPdfWriter, QPainter, QPicture, QPageSize, QPageLayout, QPen, QColor, QFont
+)
+
+from core.animation_engine import glyph_transform
+from core.character_loader import load_stroke_paths
+
+SEQUENCE_CELLS = 14  # 笔顺行每行格数
+TRACING_CELLS = 8    # 描红行格数
+TRACE_COPIES = 3     # 描红行中浅灰字的个数（其后为空格）
+RESOLUTION = 300     # PDF 分辨率（dpi）
+
+
+def _draw_grid(painter, rect):
+    """Draw a 田字格 cell."""
+    painter.setBrush(Qt.NoBrush)
+    painter.setPen(QPen(QColor(120, 120, 120), rect.width() / 60))
+    painter.drawRect(rect)
+    painter.setPen(QPen(QColor(190, 190, 190), rect.width() / 120, Qt.DashLine))
+    center = rect.center()
+    painter.drawLine(int(rect.left()), int(center.y()), int(rect.right()), int(center.y()))
+    painter.drawLine(int(center.x()), int(rect.top()), int(center.x()), int(rect.bottom()))
+
+
+def _draw_glyph(painter, rect, paths, count, color, rest_color=None):
+    """Fill the first count strokes in color, the others in rest_color.
+
+    Args:
+        painter (QPainter): The painter.
+        rect (QRectF): Cell to draw into.
+        paths (list): QPainterPath per stroke, shared by all cells.
+        count (int): Number of strokes in color.
+        color (QColor): Colour of the first strokes.
+        rest_color (QColor, optional): Colour of the other strokes, None to skip them.
+    """
+    painter.save()
+    painter.translate(rect.topLeft())
+    painter.setWorldTransform(glyph_transform(rect.width(), rect.height()), True)
+    painter.setPen(Qt.NoPen)
+    for number, path in enumerate(paths):
+        if number < count:
+            painter.fillPath(path, color)
+        elif rest_color is not None:
+            painter.fillPath(path, rest_color)
+    painter.restore()
+
+
+class Worksheet:
+    """A printable 描红 practice booklet.
+
+    Every character gets a block with its stroke order (one cell per
+    cumulative stroke) and a tracing row: a model character, light copies
+    to trace and empty cells. Stroke geometry is parsed once per character
+    and shared by all of its cells, and pages are recorded as vector
+    QPictures on a thread pool before being replayed into the PDF.
+    """
+
+    def __init__(self, hanzi_data, stroke_color="#FF0000", max_workers=4):
+        """Initialize the worksheet generator.
+
+        Args:
+            hanzi_data (HanziDataStore): Stroke data source.
+            stroke_color (str): Colour of the model character and the
+                stroke order strokes.
+            max_workers (int): Threads loading geometry and recording pages.
+        """
+        self.hanzi_data = hanzi_data
+        self.stroke_color = QColor(stroke_color)
+        self.max_workers = max_workers
+
+    def _layout(self, characters, geometry, width, height):
+        """Split the character blocks into pages.
+
+        A block taller than the page (many strokes on a short page) is
+        scaled down to the page height.
+
+        Returns:
+            list: Per page, a list of (character, top y, scale) triples.
+        """
+        small = width / SEQUENCE_CELLS
+        big = width / TRACING_CELLS
+        pages, page, y = [], [], 0.0
+        for char in characters:
+            rows = max(1, -(-len(geometry[char]) // SEQUENCE_CELLS))
+            block = rows * small + big + big * 0.3
+            scale = min(1.0, height / block)
+            block *= scale
+            if page and y + block > height:
+                pages.append(page)
+                page, y = [], 0.0
+            page.append((char, y, scale))
+            y += block
+        if page:
+            pages.append(page)
+        return pages
+
+    def _record_page(self, page, geometry, width):
+        """Record the glyphs and grids of one page (runs on a pool thread)."""
+        small = width / SEQUENCE_CELLS
+        big = width / TRACING_CELLS
+        grey = QColor(200, 200, 200)
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        for char, top, scale in page:
+            paths = geometry[char]
+            painter.save()
+            painter.translate(0, top)
+            painter.scale(scale, scale)
+            # 笔顺：第 k 格显示前 k 笔
+            for number in range(len(paths)):
+                row, column = divmod(number, SEQUENCE_CELLS)
+                cell = QRectF(column * small, row * small, small, small)
+                _draw_grid(painter, cell)
+                _draw_glyph(painter, cell, paths, number + 1, self.stroke_color, grey)
+
+            # 描红：范字、浅灰字、空格
+            rows = max(1, -(-len(paths) // SEQUENCE_CELLS))
+            y = rows * small + big * 0.1
+            for column in range(TRACING_CELLS):
+                cell = QRectF(column * big, y, big, big)
+                _draw_grid(painter, cell)
+                if column == 0:
+                    _draw_glyph(painter, cell, paths, len(paths), self.stroke_color)
+                elif column <= TRACE_COPIES:
+                    _draw_glyph(painter, cell, paths, len(paths), grey)
+            painter.restore()
+
+        painter.end()
+        return picture
+
+    def write(self, characters, path, title=""):
+        """Write the worksheet PDF.
+
+        Args:
+            characters (iterable): Characters to practise; those without
+                stroke data are left out.
+            path (str): Output PDF file.
+            title (str): Heading printed on every page.
+
+        Returns:
+            int: Number of pages written; 0 and no file when none of the
+                characters has stroke data.
+        """
+        characters = list(dict.fromkeys(characters))
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            loaded = pool.map(lambda char: load_stroke_paths(self.hanzi_data, char), characters)
+            geometry = {char: paths for char, paths in zip(characters, loaded) if paths}
+        characters = [char for char in characters if char in geometry]
+        if not characters:
+            return 0
+
+        writer = QPdfWriter(path)
+        writer.setResolution(RESOLUTION)
+        writer.setPageLayout(QPageLayout(QPageSize(QPageSize.A4), QPageLayout.Portrait,
+                                         QMarginsF(15, 15, 15, 15), QPageLayout.Millimeter))
+        writer.setTitle(title)
+        width = writer.width()
+        header = RESOLUTION * 0.4  # 标题栏高度
+        pages = self._layout(characters, geometry, width, writer.height() - header * 2)
+
+        # 各页在线程中录制为矢量图，再依次写入 PDF
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            pictures = list(pool.map(lambda page: self._record_page(page, geometry, width), pages))
+
+        painter = QPainter(writer)
+        font = QFont()
+        font.setPointSizeF(12)
+        painter.setFont(font)
+        for number, picture in enumerate(pictures):
+            if number:
+                writer.newPage()
+            painter.setPen(Qt.black)
+            painter.drawText(QRectF(0, 0, width, header), Qt.AlignLeft | Qt.AlignVCenter, title)
+            painter.drawText(QRectF(0, 0, width, header), Qt.AlignRight | Qt.AlignVCenter,
+                             f"{number + 1} / {len(pictures)}")
+            painter.drawPicture(0, int(header * 1.5), picture)
+        painter.end()
+        return len(pictures)
@@ -6,27 +6,251 @@ Main entry point for the Chinese Character Reading Application.
 """
 
 import sys
-import main
+import argparse
 
-from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
-from core.config_manager import ConfigManager
+from core.startup_profiler import profiler
+
+
+def parse_args(argv):
+    """Parse the application's own command line options.
+
+    Args:
+        argv (list): Command line arguments without the program name.
+
+    Returns:
+        tuple: (parsed options, remaining arguments for Qt).
+    """
+    parser = argparse.ArgumentParser(description="小丕拾字")
+    parser.add_argument("--import-list", metavar="PATH",
+                        help="import a .txt or .yaml character list and exit")
+    parser.add_argument("--group", default="基础汉字",
+                        help="group for imported characters (default: 基础汉字)")
+    parser.add_argument("--allow-missing-strokes", action="store_true",
+                        help="also import characters without stroke data")
+    parser.add_argument("--export-animations", metavar="DIR",
+                        help="export stroke-order animations to DIR and exit "
+                             "(interrupted exports resume where they stopped)")
+    parser.add_argument("--export-format", choices=("gif", "apng", "png"), default="gif",
+                        help="gif, apng or png (a folder of frames per character)")
+    parser.add_argument("--export-size", type=int, default=256, metavar="PX",
+                        help="frame size in pixels (default: 256)")
+    parser.add_argument("--export-chars", metavar="TEXT",
+                        help="characters to export (default: all with stroke data)")
+    parser.add_argument("--jobs", type=int, metavar="N",
+                        help="export processes (default: one per CPU)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="re-export characters that were exported before")
+    parser.add_argument("--build-stroke-types", action="store_true",
+                        help="classify all strokes of graphics.txt into the stroke type "
+                             "index (stroke_types_path in config.json) and exit")
+    parser.add_argument("--build-handwriting-index", action="store_true",
+                        help="compute the draw-to-search index of graphics.txt "
+                             "(handwriting_index_path in config.json) and exit")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print an import and construction timeline")
+    parser.add_argument("--trace", metavar="PATH", nargs="?", const="trace.json",
+                        help="record navigation timing spans and write them to PATH "
+                             "(.json for Chrome/Perfetto, .jsonl for JSON lines) on exit")
+    parser.add_argument("--leak-check", type=int, metavar="N",
+                        help="snapshot memory and Qt object counts every N characters "
+                             "(report in logs/leak.log)")
+    parser.add_argument("--watchdog", nargs="?", type=int, const=0, metavar="MS",
+                        help="log main-thread stalls longer than MS milliseconds "
+                             "(default: stall_threshold_ms from config.json)")
+    return parser.parse_known_args(argv)
+
+
+def import_list(args, config_manager):
+    """Import a character list without starting the GUI.
+
+    Args:
+        args: Parsed command line options.
+        config_manager: The configuration manager.
+
+    Returns:
+        int: Process exit code.
+    """
+    import yaml
+    from core.hanzi_data import HanziDataStore
+    from core.character_manager import CharacterManager
+    from core.bulk_importer import import_characters
+
+    hanzi_data = HanziDataStore(
+        config_manager.get("graphics_path", "assets/graphics.txt"),
+        config_manager.get("dictionary_path", "assets/dictionary.txt")
+    )
+    character_manager = CharacterManager(hanzi_data=hanzi_data)
+
+    try:
+        result = import_characters(character_manager, args.import_list, args.group,
+                                   require_strokes=not args.allow_missing_strokes)
+    except (IOError, UnicodeDecodeError, ValueError, yaml.YAMLError) as e:
+        print(f"Error importing character list: {e}")
+        return 1
+
+    print(result.summary())
+    if result.missing_strokes:
+        print(f"No stroke data: {''.join(result.missing_strokes)}")
+    return 0
+
+
+def export_animations(args, config_manager):
+    """Export stroke-order animations without starting the GUI.
+
+    Args:
+        args: Parsed command line options.
+        config_manager: The configuration manager.
+
+    Returns:
+        int: Process exit code.
+    """
+    from core.hanzi_data import HanziDataStore
+    from core.stroke_exporter import export_animations as export
+
+    graphics_path = config_manager.get("graphics_path", "assets/graphics.txt")
+    if args.export_chars:
+        characters = [char for char in args.export_chars if not char.isspace()]
+    else:
+        characters = HanziDataStore(graphics_path).stroke_characters()
+
+    try:
+        exported, skipped, errors = export(
+            characters, args.export_animations, graphics_path,
+            fmt=args.export_format, size=args.export_size,
+            stroke_color=config_manager.get("stroke_color", "#FF0000"),
+            interval=config_manager.get("animation_interval", 1000),
+            hold=config_manager.get("display_time", 3000),
+            jobs=args.jobs, overwrite=args.overwrite)
+    except ImportError:
+        print("GIF and APNG export needs Pillow (pip install Pillow), "
+              "or use --export-format png")
+        return 1
+
+    print(f"Exported {exported} characters, skipped {skipped}, failed {len(errors)}")
+    for character, error in errors.items():
+        print(f"  {character}: {error}")
+    return 0 if not errors else 1
+
+
+def build_stroke_types(config_manager):
+    """Build the stroke type index without starting the GUI.
+
+    Args:
+        config_manager: The configuration manager.
+
+    Returns:
+        int: Process exit code.
+    """
+    import time
+    from core.stroke_types import StrokeTypeIndex
+
+    graphics_path = config_manager.get("graphics_path", "assets/graphics.txt")
+    path = config_manager.get("stroke_types_path", "assets/stroke_types.npz")
+    started = time.perf_counter()
+    try:
+        index = StrokeTypeIndex.build(graphics_path)
+    except IOError as e:
+        print(f"Error reading {graphics_path}: {e}")
+        return 1
+    index.save(path)
+    print(f"Classified {len(index.codes)} strokes of {len(index)} characters "
+          f"in {time.perf_counter() - started:.1f} s, written to {path}")
+    return 0
+
+
+def build_handwriting_index(config_manager):
+    """Build the handwriting lookup index without starting the GUI.
+
+    Args:
+        config_manager: The configuration manager.
+
+    Returns:
+        int: Process exit code.
+    """
+    import time
+    from core.handwriting import HandwritingIndex
+
+    graphics_path = config_manager.get("graphics_path", "assets/graphics.txt")
+    path = config_manager.get("handwriting_index_path", "assets/handwriting.npz")
+    started = time.perf_counter()
+    try:
+        index = HandwritingIndex.build(graphics_path)
+    except IOError as e:
+        print(f"Error reading {graphics_path}: {e}")
+        return 1
+    index.save(path)
+    print(f"Indexed {len(index)} characters in {len(index.buckets)} stroke-count buckets "
+          f"in {time.perf_counter() - started:.1f} s, written to {path}")
+    return 0
 
 
 def main():
     """Initialize and run the application."""
+    # 导出动画使用多进程；PyInstaller 打包后的子进程需要在这里接管，
+    # 未打包时不必在启动时导入 multiprocessing
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.profile_startup:
+        profiler.enable()
+    if args.trace:
+        from core.trace_recorder import tracer
+        tracer.set_enabled(True)
+
+    with profiler.span("import Qt and core"):
+        from PyQt5.QtWidgets import QApplication
+        from core.config_manager import ConfigManager
+
+    if args.import_list:
+        sys.exit(import_list(args, ConfigManager()))
+    if args.export_animations:
+        sys.exit(export_animations(args, ConfigManager()))
+    if args.build_stroke_types:
+        sys.exit(build_stroke_types(ConfigManager()))
+    if args.build_handwriting_index:
+        sys.exit(build_handwriting_index(ConfigManager()))
+
     # Create the application
-    app = QApplication(sys.argv)
-    
+    with profiler.span("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+
     # Initialize configuration
-    config_manager = ConfigManager()
-    
+    with profiler.span("ConfigManager"):
+        config_manager = ConfigManager()
+
+    # 主线程卡顿监视（可选）
+    watchdog = None
+    if args.watchdog is not None or config_manager.get("stall_watchdog", False):
+        from core.stall_watchdog import StallWatchdog
+        watchdog = StallWatchdog(
+            args.watchdog or config_manager.get("stall_threshold_ms", 50),
+            config_manager.get("stall_log", "logs/stall.log")
+        )
+        watchdog.start()
+
+    with profiler.span("import ui.main_window"):
+        from ui.main_window import MainWindow
+
     # Create and show the main window
-    main_window = MainWindow(config_manager)
-    main_window.showMaximized()
-    
+    with profiler.span("MainWindow"):
+        main_window = MainWindow(config_manager)
+    with profiler.span("show"):
+        main_window.showMaximized()
+
+    # 内存泄漏检测（可选）
+    if args.leak_check:
+        from core.leak_detector import LeakDetector
+        leak_detector = LeakDetector(every=args.leak_check)
+        leak_detector.start()
+        main_window.character_changed.connect(lambda _char: leak_detector.on_navigation())
+
     # Execute the application
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if args.trace:
+        tracer.export(args.trace)
+        print(f"Trace written to {args.trace}")
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
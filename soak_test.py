@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Soak test driver for the Chinese Character Reading Application.
+Cycles through the whole character library headlessly for hours with leak
+detection on, to check that long kiosk sessions do not accumulate memory.
+
+    python soak_test.py --hours 8 --every 200
+"""
+
+import os
+import sys
+import time
+import argparse
+
+
+def parse_args(argv):
+    """Parse command line options.
+
+    Args:
+        argv (list): Command line arguments without the program name.
+
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(description="小丕拾字 soak test")
+    parser.add_argument("--hours", type=float, default=1.0,
+                        help="how long to run (default: 1)")
+    parser.add_argument("--interval", type=int, default=50,
+                        help="milliseconds between characters (default: 50)")
+    parser.add_argument("--every", type=int, default=200,
+                        help="characters between memory snapshots (default: 200)")
+    parser.add_argument("--log", default="logs/leak.log",
+                        help="report file (default: logs/leak.log)")
+    parser.add_argument("--show", action="store_true",
+                        help="show the window instead of running offscreen")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Run the soak test."""
+    args = parse_args(sys.argv[1:])
+    if not args.show:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from core.config_manager import ConfigManager
+    from core.leak_detector import LeakDetector
+    from ui.main_window import MainWindow
+
+    app = QApplication(sys.argv[:1])
+
+    # 临时配置：不写回 config.json，不发音
+    config_manager = ConfigManager()
+    config_manager.set("auto_pronounce", False, temporary=True)
+    config_manager.set("watch_library", False, temporary=True)
+
+    window = MainWindow(config_manager)
+    window.finish_startup()
+
+    detector = LeakDetector(every=args.every, log_file=args.log)
+    detector.start()
+    window.character_changed.connect(lambda _char: detector.on_navigation())
+
+    deadline = time.monotonic() + args.hours * 3600
+    character_manager = window.character_manager
+
+    def step():
+        if time.monotonic() >= deadline:
+            app.quit()
+            return
+        # 到达末尾后回到第一个字，循环整个字库
+        if character_manager.get_current_index() >= character_manager.get_character_count() - 1:
+            character_manager.current_index = -1
+        window.show_next_character()
+        # 离屏渲染一帧，覆盖绘制路径
+        window.character_widget.grab()
+
+    timer = QTimer()
+    timer.timeout.connect(step)
+    timer.start(args.interval)
+
+    print(f"Soak test: {character_manager.get_character_count()} characters, "
+          f"{args.hours} h, snapshot every {args.every} characters")
+    app.exec_()
+
+    detector.check()
+    detector.stop()
+    if len(detector.reports) >= 2:
+        first_nav, first_bytes, _ = detector.reports[0]
+        last_nav, last_bytes, _ = detector.reports[-1]
+        growth = (last_bytes - first_bytes) / max(last_nav - first_nav, 1)
+        print(f"Traced memory {first_bytes / 1024:.0f} KiB -> {last_bytes / 1024:.0f} KiB "
+              f"({growth:.1f} bytes per character)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
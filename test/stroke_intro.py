@@ -1,4 +1,21 @@
+import os
+import sys
+import logging
 import tkinter as tk
+from tkinter import messagebox
+from tkinter.ttk import *
+from PIL import Image, ImageTk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from core.hanzi_data import HanziDataStore
+from core.stroke_tiles import StrokeTileCache
+
+# 笔顺图由 graphics.txt 本地生成，按内容哈希缓存在磁盘上，无需联网
+hanzi_data = HanziDataStore()
+tile_cache = StrokeTileCache(hanzi_data, cache_dir=os.path.join('assets', 'stroke_tiles'),
+                             tile_size=122)
+
+
 class WinGUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -206,95 +223,25 @@ class WinGUI(tk.Tk):
             messagebox.showerror("提示", message="搜索汉字不能超过1个")
             return
 
-        assets = './assets'
-        if not os.path.exists(assets):
-            os.mkdir(assets)
-
-        chinese_dir = os.path.join(assets, chinese)
-        if not os.path.exists(chinese_dir):
-            # 创建目录
-            os.mkdir(chinese_dir)
-            # 假设chinese是单个汉字字符，chinese_ord是其Unicode编码
-            chinese_ord = ord(chinese)
-
-            # 构造汉字笔顺动画图片和笔顺规范图片的URL
-            hanzi_url = f'https://bishun.net/hanzi/{chinese_ord}'
-            donghua_url = f'https://bishun.net/assets/bishun/donghua/bishundonghua-{chinese_ord}.gif'
-            fenbu_url = f'https://bishun.net/assets/bishun/fenbu/bishun-{chinese_ord}.png'
-
-            try:
-                # 请求汉字信息页面
-                response = requests.get(hanzi_url)
-                if response.status_code == 200:
-                    # 解析网页内容
-                    soup = BeautifulSoup(response.content, 'html.parser')
-
-                    # 这里需要根据网页结构来定位笔画数和读音的元素
-                    # 例如，如果它们位于具有特定class的元素内，可以使用soup.find()或soup.select()
-                    # 以下代码仅为示例，需要根据实际网页结构进行调整
-                    bi_shu = soup.select('.bishun-hanzi-info-right')[1].text
-                    du_yin = soup.select('.bishun-hanzi-info-right')[2].text
-                    print(f"笔画数：{bi_shu}，读音：{du_yin}")
-                    with open(os.path.join(chinese_dir, f'{chinese}.txt'), 'w', encoding='utf-8') as f:
-                        f.write(f"{bi_shu}\n{du_yin}")
-
-                    # 请求并下载笔顺动画图片
-                    donghua_response = requests.get(donghua_url)
-                    if donghua_response.status_code == 200:
-                        with open(os.path.join(chinese_dir, f'{chinese}.gif'), 'wb') as f:
-                            f.write(donghua_response.content)
-
-                    # 请求并下载笔顺规范图片
-                    fenbu_response = requests.get(fenbu_url)
-                    if fenbu_response.status_code == 200:
-                        with open(os.path.join(chinese_dir, f'{chinese}.png'), 'wb') as f:
-                            f.write(fenbu_response.content)
-
-            except requests.exceptions.RequestException as e:
-                logging.error(f"请求失败：{e}")
-
-        # 读取汉字信息文件
-        with open(os.path.join(chinese_dir, f'{chinese}.txt'), 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            bi_shu = lines[0].strip()
-            self.tk_text_bihua_num.insert(tk.END, f'笔画: {bi_shu}')
-            self.tk_text_bihua_num.config(state='disabled')
-
-            du_yin = lines[1].strip()
-            self.tk_text_pinyin.insert(tk.END, f'读音: {du_yin}')
-            self.tk_text_pinyin.config(state='disabled')
-
-            self.bihua_num = int(bi_shu)
-
-        # 显示完整字图片gif self.tk_label_bishun_img
-        global img1  # 使用全局变量来保持对图片对象的引用
-        # 打开图片文件
-        img1 = Image.open(os.path.join(chinese_dir, f'{chinese}.gif'))
-        # 获取Label的宽度和高度
-        label_width = 137
-        label_height = 138
-
-        # 计算图片的原始宽高比
-        original_ratio = img1.size[0] / img1.size[1]
-
-        # 根据Label的尺寸和图片的宽高比计算新的图片尺寸
-        if original_ratio >= 1:  # 宽度大于高度
-            new_width = label_width
-            new_height = int(new_width / original_ratio)
-        else:  # 高度大于宽度
-            new_height = label_height
-            new_width = int(new_height * original_ratio)
-
-        # 调整图片尺寸以适应Label的尺寸，同时保持宽高比
-        img1 = img1.resize((new_width - 15, new_height - 15), )
-
-        # 将PIL图片对象转换为Tkinter的PhotoImage对象
-        img1 = ImageTk.PhotoImage(img1)
-        self.tk_label_bishun_img.config(image=img1)
-
-        # 提前加载笔顺规范
+        strip_path = tile_cache.strip_path(chinese)
+        if strip_path is None:
+            messagebox.showerror("提示", message=f"没有“{chinese}”的笔顺数据")
+            return
+
+        # 笔画数和读音
+        self.bihua_num = hanzi_data.stroke_count(chinese)
+        self.tk_text_bihua_num.insert(tk.END, f'笔画: {self.bihua_num}')
+        self.tk_text_bihua_num.config(state='disabled')
+
+        dictionary = hanzi_data.get_dictionary(chinese) or {}
+        du_yin = '，'.join(dictionary.get('pinyin', []))
+        self.tk_text_pinyin.insert(tk.END, f'读音: {du_yin}')
+        self.tk_text_pinyin.config(state='disabled')
+
+        # 加载笔顺图，先显示完整的字
         global tiles
-        tiles = self.load_and_split_image(os.path.join(chinese_dir, f'{chinese}.png'), self.bihua_num)
+        tiles = self.load_and_split_image(strip_path)
+        self.tk_label_bishun_img.config(image=tiles[-1])
 
     def __tk_text_bihua_num(self, parent):
         ipt = Entry(parent, justify="left", font=("微软雅黑", 16))
@@ -337,18 +284,13 @@ class WinGUI(tk.Tk):
             self.current_tile += 1
         self.tk_label_bishun_img.config(image=tiles[self.current_tile])
 
-    # 加载图片并分割成多个部分
-    def load_and_split_image(self, image_path, bi_shu):
+    # 加载笔顺图并分割成每一笔一张（单行，每张为正方形）
+    def load_and_split_image(self, image_path):
         img = Image.open(image_path)
         width, height = img.size
-        const_per_row = 5  # 每一行最多5笔
-        total_row = math.ceil(bi_shu / const_per_row)  # 向上取整,不能四舍五入
-        tile_width, tile_height = (width // const_per_row, height // total_row)
         tiles = []
-        for y in range(0, height, tile_height):
-            for x in range(0, width, tile_width):
-                tile = img.crop((x, y, x + tile_width, y + tile_height))
-                tile = tile.resize((tile_width - 35, tile_height - 35), )
-                tiles.append(ImageTk.PhotoImage(tile))
+        for x in range(0, width, height):
+            tile = img.crop((x, 0, x + height, height))
+            tiles.append(ImageTk.PhotoImage(tile))
         return tiles
 
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Character board for the Chinese Character Reading Application.
+Shows ten characters at once (小丕拾字), all animated by one timer.
+"""
+
+from PyQt5.QtCore import Qt, QTimer, QRectF, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+
+from core.animation_engine import glyph_transform, stroke_palette, OUTLINE_BRUSH
+from core.font_glyphs import font_glyph_path
+
+BOARD_SIZE = 10
+BOARD_COLUMNS = 5
+
+
+class _BoardCell:
+    """Geometry of one board character (no strokes until it is loaded)."""
+
+    def __init__(self, character, paths=None):
+        self.character = character
+        self.paths = []
+        self.background_path = QPainterPath()
+        self.loaded = False
+        if paths is not None:
+            self.set_paths(paths)
+
+    def set_paths(self, paths):
+        """Fill in the stroke geometry once it is available."""
+        self.paths = paths
+        self.background_path = QPainterPath()
+        for path in paths:
+            self.background_path.addPath(path)
+        self.background_path.setFillRule(Qt.WindingFill)
+        self.loaded = True
+
+
+class CharacterBoard(QWidget):
+    """Grid of ten animated characters.
+
+    One shared clock advances every cell by one stroke per tick, and all
+    cells are drawn in a single paint pass. A cell with n strokes runs
+    through n ticks of drawing and then holds the finished character for
+    display_time before starting again.
+    """
+
+    # Emitted with the character when a cell is clicked
+    character_clicked = pyqtSignal(str)
+
+    def __init__(self, character_loader, config_manager, parent=None):
+        """Initialize the board.
+
+        Args:
+            character_loader (CharacterLoader): Shared geometry cache.
+            config_manager: The configuration manager.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.character_loader = character_loader
+        self.config_manager = config_manager
+        self.cells = []
+        self.tick = 0
+
+        self.clock = QTimer(self)
+        self.clock.timeout.connect(self.advance)
+
+        character_loader.geometry_cached.connect(self.on_geometry_cached)
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def set_characters(self, characters):
+        """Show up to ten characters and restart the animation.
+
+        Cached geometry is shown at once; the other cells are loaded in the
+        background and filled in by on_geometry_cached().
+
+        Args:
+            characters (list): Characters to show.
+        """
+        self.cells = []
+        missing = []
+        for char in characters[:BOARD_SIZE]:
+            paths = self.character_loader.cached(char)
+            cell = _BoardCell(char)
+            if paths is None:
+                missing.append(char)
+            else:
+                self._fill_cell(cell, paths)
+            self.cells.append(cell)
+        self.character_loader.prefetch(missing)
+        self.tick = 0
+        if self.isVisible():
+            self.clock.start(self.config_manager.get("animation_interval", 1000))
+        self.update()
+
+    def _fill_cell(self, cell, paths):
+        """Set a cell's strokes; characters without stroke data use the font."""
+        if not paths:
+            # 无笔画数据的字用字体字形，作为一笔显示
+            font_family = self.config_manager.get("font_family", "SimHei")
+            paths = [font_glyph_path(font_family, cell.character)]
+        cell.set_paths(paths)
+
+    def on_geometry_cached(self, character, paths):
+        """Fill the cells waiting for a character's geometry.
+
+        Args:
+            character (str): The loaded character.
+            paths (list): Its stroke paths.
+        """
+        filled = False
+        for cell in self.cells:
+            if cell.character == character and not cell.loaded:
+                self._fill_cell(cell, paths)
+                filled = True
+        if filled:
+            self.update()
+
+    def advance(self):
+        """Advance the shared clock by one stroke."""
+        self.tick += 1
+        self.update()
+
+    def visible_strokes(self, cell):
+        """Get the number of strokes a cell shows at the current tick."""
+        interval = max(1, self.config_manager.get("animation_interval", 1000))
+        hold = self.config_manager.get("display_time", 3000) // interval
+        return min(self.tick % (len(cell.paths) + hold + 1), len(cell.paths))
+
+    def cell_rect(self, number):
+        """Get the square of a cell in widget coordinates.
+
+        Args:
+            number (int): Cell index.
+
+        Returns:
+            QRectF: The cell.
+        """
+        rows = -(-BOARD_SIZE // BOARD_COLUMNS)
+        size = min(self.width() / BOARD_COLUMNS, self.height() / rows)
+        left = (self.width() - size * BOARD_COLUMNS) / 2
+        top = (self.height() - size * rows) / 2
+        row, column = divmod(number, BOARD_COLUMNS)
+        return QRectF(left + column * size, top + row * size, size, size)
+
+    def paintEvent(self, event):
+        """Draw all cells in one pass."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self.palette().window())
+
+        grid_pen = QPen(QColor(190, 190, 190))
+        palette = stroke_palette(self.config_manager)
+
+        for number, cell in enumerate(self.cells):
+            rect = self.cell_rect(number)
+            painter.setPen(grid_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(rect.adjusted(2, 2, -2, -2))
+
+            painter.save()
+            painter.translate(rect.topLeft())
+            painter.setWorldTransform(glyph_transform(rect.width(), rect.height()), True)
+            painter.setPen(Qt.NoPen)
+            painter.fillPath(cell.background_path, OUTLINE_BRUSH)
+            for stroke_number, path in enumerate(cell.paths[:self.visible_strokes(cell)]):
+                painter.fillPath(path, palette[stroke_number % len(palette)])
+            painter.restore()
+
+    def mouseReleaseEvent(self, event):
+        """Report the clicked character."""
+        if event.button() == Qt.LeftButton:
+            for number, cell in enumerate(self.cells):
+                if self.cell_rect(number).contains(event.pos()):
+                    self.character_clicked.emit(cell.character)
+                    break
+
+    def showEvent(self, event):
+        """Start the clock while the board is shown."""
+        super().showEvent(event)
+        if self.cells:
+            self.clock.start(self.config_manager.get("animation_interval", 1000))
+
+    def hideEvent(self, event):
+        """Stop the clock while the board is hidden."""
+        super().hideEvent(event)
+        self.clock.stop()
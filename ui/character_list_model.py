@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Character list model for the Chinese Character Reading Application.
+A lazily populated, incrementally filtered list model backed directly by
+the CharacterManager.
+"""
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
+from PyQt5.QtGui import QPixmap, QPixmapCache, QPainter, QColor
+
+from core.animation_engine import parse_svg_path
+
+
+class CharacterListModel(QAbstractListModel):
+    """List model exposing CharacterManager characters to a QListView.
+
+    Rows are handed to the view in batches through canFetchMore/fetchMore,
+    so only the part of the list that has been scrolled into view ever
+    exists on the Qt side. Stroke thumbnails are rendered on first request
+    and kept in QPixmapCache.
+    """
+
+    BATCH_SIZE = 200
+    THUMBNAIL_SIZE = 48
+
+    def __init__(self, character_manager, parent=None):
+        """Initialize the model.
+
+        Args:
+            character_manager: The character manager.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+        self.character_manager = character_manager
+        self.show_thumbnails = False
+
+        self._filter_text = ""
+        self._rows = list(character_manager.original_characters)
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows handed to the view so far."""
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """Whether more filtered rows are waiting to be loaded."""
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Hand the next batch of rows to the view."""
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the data of a row.
+
+        Args:
+            index (QModelIndex): The row.
+            role (int): The item data role.
+        """
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        char = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return char
+        if role == Qt.ToolTipRole:
+            info = self.character_manager.character_data.get(char, {})
+            pinyin = ", ".join(self.character_manager.index.get_pinyin(char))
+            return f"{char}  {pinyin}  ({info.get('group', '')})"
+        if role == Qt.DecorationRole and self.show_thumbnails:
+            return self._thumbnail(char)
+        if role == Qt.SizeHintRole and self.show_thumbnails:
+            return QSize(self.THUMBNAIL_SIZE * 2, self.THUMBNAIL_SIZE + 4)
+        return None
+
+    def character_at(self, row):
+        """Get the character shown at a row.
+
+        Args:
+            row (int): Row number.
+
+        Returns:
+            str: The character, or empty string if out of range.
+        """
+        if 0 <= row < self._loaded:
+            return self._rows[row]
+        return ""
+
+    def _matches(self, char, text, pinyin_hits):
+        """Check whether a character matches the filter text."""
+        if char in text or char in pinyin_hits:
+            return True
+        group = self.character_manager.character_data.get(char, {}).get('group', '')
+        return text in group
+
+    def set_filter(self, text):
+        """Narrow the list to characters matching the text.
+
+        Pinyin prefixes only apply when the whole text is ASCII. When new
+        pinyin extends the previous pinyin, only the currently visible rows
+        are re-checked instead of the whole library.
+
+        Args:
+            text (str): Character(s), pinyin prefix or part of a group name.
+        """
+        text = text.strip()
+        if text == self._filter_text:
+            return
+
+        if not text:
+            candidates = list(self.character_manager.original_characters)
+        else:
+            # 只有纯拼音输入才按拼音匹配（normalize_pinyin 会丢掉汉字，
+            # “一a” 不能当作拼音 “a”）；拼音后追加字母只会缩小结果，
+            # 可在当前结果上继续筛选，其余情况需要从全部汉字重新筛选
+            is_pinyin = text.isascii()
+            if (is_pinyin and self._filter_text and self._filter_text.isascii()
+                    and text.startswith(self._filter_text)):
+                candidates = self._rows
+            else:
+                candidates = self.character_manager.original_characters
+            pinyin_hits = (set(self.character_manager.index.by_pinyin_prefix(text))
+                           if is_pinyin else set())
+            candidates = [c for c in candidates
+                          if self._matches(c, text, pinyin_hits)]
+
+        self.beginResetModel()
+        self._filter_text = text
+        self._rows = candidates
+        self._loaded = 0
+        self.endResetModel()
+
+    def refresh(self):
+        """Reload rows after the character library changed."""
+        text = self._filter_text
+        self._filter_text = None
+        self.set_filter(text)
+
+    def set_show_thumbnails(self, enabled):
+        """Enable or disable stroke thumbnails.
+
+        Args:
+            enabled (bool): Whether thumbnails are shown.
+        """
+        self.beginResetModel()
+        self.show_thumbnails = enabled
+        self.endResetModel()
+
+    def _thumbnail(self, char):
+        """Get the stroke thumbnail of a character, rendering it on first use."""
+        key = f"char_thumb:{self.THUMBNAIL_SIZE}:{char}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        pixmap.fill(Qt.transparent)
+
+        hanzi_data = self.character_manager.index.hanzi_data
+        record = hanzi_data.get_graphics(char) if hanzi_data else None
+        if record:
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            scale = self.THUMBNAIL_SIZE / 1024
+            painter.scale(scale, -scale)      # Y轴翻转
+            painter.translate(0, -900)       # Make Me A Hanzi 坐标系
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(60, 60, 60))
+            for stroke in record.get('strokes', []):
+                painter.drawPath(parse_svg_path(stroke))
+            painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
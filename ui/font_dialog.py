@@ -6,25 +6,38 @@ Font dialog for the Chinese Character Reading Application.
 Allows adding new characters to the character set.
 """
 
+import time
+
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QPushButton, QLineEdit, QListWidget,
-    QMessageBox
+    QLabel, QPushButton, QLineEdit, QListView,
+    QMessageBox, QCheckBox, QWidget
 )
 
+from core.character_manager import is_chinese_character
+from ui.character_list_model import CharacterListModel
+from ui.handwriting_pad import HandwritingPad
+
+# 手写查字显示的候选字数
+CANDIDATE_COUNT = 8
+
 class FontDialog(QDialog):
     """Dialog for managing Chinese characters."""
     
-    def __init__(self, character_manager, parent=None):
+    def __init__(self, character_manager, parent=None, handwriting_index=None):
         """Initialize the font dialog.
         
         Args:
             character_manager: The character manager.
             parent: The parent widget.
+            handwriting_index (HandwritingIndex, optional): Enables the
+                draw-to-search pad.
         """
         super().__init__(parent)
         self.character_manager = character_manager
+        self.handwriting_index = handwriting_index
         
         self.setWindowTitle("Character Management")
         self.resize(400, 500)
@@ -51,13 +64,71 @@ class FontDialog(QDialog):
         
         layout.addLayout(add_layout)
         
+        # 手写查字：不会拼音输入时画出汉字，点候选字填入输入框
+        self.draw_checkbox = QCheckBox("Draw to search")
+        if self.handwriting_index is None:
+            self.draw_checkbox.setEnabled(False)
+            self.draw_checkbox.setToolTip("Run main.py --build-handwriting-index first")
+        layout.addWidget(self.draw_checkbox)
+        
+        self.draw_panel = QWidget()
+        draw_layout = QVBoxLayout(self.draw_panel)
+        draw_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.pad = HandwritingPad()
+        self.pad.strokes_changed.connect(self.search_handwriting)
+        draw_layout.addWidget(self.pad)
+        
+        candidate_layout = QHBoxLayout()
+        candidate_font = QFont()
+        candidate_font.setPointSize(18)
+        self.candidate_buttons = []
+        for _ in range(CANDIDATE_COUNT):
+            button = QPushButton()
+            button.setFont(candidate_font)
+            button.setVisible(False)
+            button.clicked.connect(lambda checked, b=button: self.char_input.setText(b.text()))
+            candidate_layout.addWidget(button)
+            self.candidate_buttons.append(button)
+        candidate_layout.addStretch()
+        draw_layout.addLayout(candidate_layout)
+        
+        pad_buttons = QHBoxLayout()
+        self.search_label = QLabel("Draw the strokes in order")
+        undo_button = QPushButton("Undo")
+        undo_button.clicked.connect(self.pad.undo)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.pad.clear)
+        pad_buttons.addWidget(self.search_label)
+        pad_buttons.addStretch()
+        pad_buttons.addWidget(undo_button)
+        pad_buttons.addWidget(clear_button)
+        draw_layout.addLayout(pad_buttons)
+        
+        self.draw_panel.setVisible(False)
+        self.draw_checkbox.toggled.connect(self.draw_panel.setVisible)
+        layout.addWidget(self.draw_panel)
+        
         # Character list
         list_label = QLabel("Current Characters:")
         layout.addWidget(list_label)
         
-        self.char_list = QListWidget()
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by character, pinyin or group")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(self.filter_characters)
+        layout.addWidget(self.filter_input)
+        
+        self.char_model = CharacterListModel(self.character_manager, self)
+        self.char_list = QListView()
+        self.char_list.setUniformItemSizes(True)  # 统一行高，滚动时无需逐项测量
+        self.char_list.setModel(self.char_model)
         layout.addWidget(self.char_list)
         
+        self.thumbnail_checkbox = QCheckBox("Show stroke thumbnails")
+        self.thumbnail_checkbox.toggled.connect(self.char_model.set_show_thumbnails)
+        layout.addWidget(self.thumbnail_checkbox)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
@@ -75,9 +146,38 @@ class FontDialog(QDialog):
     
     def load_characters(self):
         """Load current characters into the list."""
-        self.char_list.clear()
-        for char in self.character_manager.characters:
-            self.char_list.addItem(char)
+        self.char_model.refresh()
+    
+    def search_handwriting(self, strokes):
+        """Show the characters closest to the drawing.
+        
+        Args:
+            strokes (list): Drawn point lists from the pad.
+        """
+        if self.handwriting_index is None:
+            return
+        started = time.perf_counter()
+        candidates = self.handwriting_index.search(strokes, CANDIDATE_COUNT) if strokes else []
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        for number, button in enumerate(self.candidate_buttons):
+            button.setVisible(number < len(candidates))
+            if number < len(candidates):
+                button.setText(candidates[number])
+        
+        if not strokes:
+            self.search_label.setText("Draw the strokes in order")
+        else:
+            self.search_label.setText(
+                f"{len(strokes)} strokes, {len(candidates)} matches ({elapsed:.1f} ms)")
+    
+    def filter_characters(self, text):
+        """Narrow the list as the filter text changes.
+        
+        Args:
+            text (str): The filter text.
+        """
+        self.char_model.set_filter(text)
     
     def add_character(self):
         """Add a new character to the list."""
@@ -92,7 +192,7 @@ class FontDialog(QDialog):
             QMessageBox.warning(self, "Warning", "Please enter a valid Chinese character.")
             return
             
-        if character in self.character_manager.characters:
+        if character in self.character_manager.character_data:
             QMessageBox.information(self, "Information", 
                                   f"Character '{character}' already exists.")
             return
@@ -108,13 +208,13 @@ class FontDialog(QDialog):
     
     def remove_character(self):
         """Remove the selected character from the list."""
-        selected_items = self.char_list.selectedItems()
+        selected = self.char_list.selectionModel().selectedIndexes()
         
-        if not selected_items:
+        if not selected:
             QMessageBox.warning(self, "Warning", "Please select a character to remove.")
             return
             
-        character = selected_items[0].text()
+        character = self.char_model.character_at(selected[0].row())
         
         # Confirm removal
         confirm = QMessageBox.question(
@@ -125,8 +225,7 @@ class FontDialog(QDialog):
         
         if confirm == QMessageBox.Yes:
             # Remove the character
-            self.character_manager.characters.remove(character)
-            self.character_manager.save_characters()
+            self.character_manager.remove_character(character)
             
             # Refresh the list
             self.load_characters()
@@ -140,34 +239,4 @@ class FontDialog(QDialog):
         Returns:
             bool: True if it's a Chinese character.
         """
-        if not char or len(char) != 1:
-            return False
-            
-        # Unicode ranges for Chinese characters
-        code_point = ord(char)
-        
-        # CJK Unified Ideographs (Basic)
-        if 0x4E00 <= code_point <= 0x9FFF:
-            return True
-            
-        # CJK Unified Ideographs Extension A
-        if 0x3400 <= code_point <= 0x4DBF:
-            return True
-            
-        # CJK Unified Ideographs Extension B
-        if 0x20000 <= code_point <= 0x2A6DF:
-            return True
-            
-        # CJK Unified Ideographs Extension C
-        if 0x2A700 <= code_point <= 0x2B73F:
-            return True
-            
-        # CJK Unified Ideographs Extension D
-        if 0x2B740 <= code_point <= 0x2B81F:
-            return True
-            
-        # CJK Unified Ideographs Extension E
-        if 0x2B820 <= code_point <= 0x2CEAF:
-            return True
-            
-        return False
+        return is_chinese_character(char)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Handwriting pad for the Chinese Character Reading Application.
+A small square canvas for drawing a character to look it up.
+"""
+
+from PyQt5.QtCore import Qt, QPointF, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+
+
+class HandwritingPad(QWidget):
+    """Canvas that records drawn strokes."""
+
+    # Emitted with the strokes after each finished stroke, undo or clear
+    strokes_changed = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        """Initialize the pad.
+
+        Args:
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.strokes = []  # 已完成的笔画，窗口坐标
+        self.current = []
+        self.setMinimumSize(200, 200)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def glyph_strokes(self):
+        """Get the strokes with Y pointing up, as in graphics.txt.
+
+        Returns:
+            list: (x, y) point lists in stroke order.
+        """
+        return [[(point.x(), -point.y()) for point in stroke] for stroke in self.strokes]
+
+    def clear(self):
+        """Remove all strokes."""
+        self.strokes = []
+        self.current = []
+        self.update()
+        self.strokes_changed.emit(self.glyph_strokes())
+
+    def undo(self):
+        """Remove the last stroke."""
+        if self.strokes:
+            self.strokes.pop()
+            self.update()
+            self.strokes_changed.emit(self.glyph_strokes())
+
+    def paintEvent(self, event):
+        """Draw the 田字格 guide lines and the strokes."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+
+        guide_pen = QPen(QColor(225, 180, 180), 1, Qt.DashLine)
+        painter.setPen(guide_pen)
+        painter.drawLine(QPointF(self.width() / 2, 0), QPointF(self.width() / 2, self.height()))
+        painter.drawLine(QPointF(0, self.height() / 2), QPointF(self.width(), self.height() / 2))
+
+        pen = QPen(Qt.black, max(3.0, min(self.width(), self.height()) / 40))
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        painter.setPen(pen)
+        for stroke in self.strokes + [self.current]:
+            if len(stroke) > 1:
+                painter.drawPolyline(QPolygonF(stroke))
+
+    def mousePressEvent(self, event):
+        """Start a stroke."""
+        if event.button() == Qt.LeftButton:
+            self.current = [QPointF(event.pos())]
+
+    def mouseMoveEvent(self, event):
+        """Extend the current stroke."""
+        if self.current:
+            self.current.append(QPointF(event.pos()))
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        """Finish the current stroke."""
+        if event.button() == Qt.LeftButton and self.current:
+            # 单击也算一笔（点）
+            self.strokes.append(self.current)
+            self.current = []
+            self.update()
+            self.strokes_changed.emit(self.glyph_strokes())
@@ -5,36 +5,64 @@
 Main window for the Chinese Character Reading Application.
 """
 
+import os
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QAction, QMenu, 
-    QMessageBox, QLabel, QSizePolicy, QActionGroup
+    QMessageBox, QLabel, QSizePolicy, QActionGroup,
+    QFileDialog, QInputDialog
+)
+from PyQt5.QtCore import Qt, pyqtSlot, pyqtSignal, QTimer, QPointF
+from PyQt5.QtGui import (
+    QPainter, QFont, QKeyEvent, QColor, QPalette, QIcon, QPen, QPolygonF
 )
-from PyQt5.QtCore import Qt, pyqtSlot, QTimer
-from PyQt5.QtGui import QPainter, QFont, QKeyEvent, QColor, QPalette, QIcon
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QEvent
 
 from core.character_manager import CharacterManager
-from core.animation_engine import AnimationEngine
+from core.hanzi_data import HanziDataStore
+from core.image_cache import ImageCache
+from core.library_watcher import LibraryWatcher
+from core.autoplay import AutoPlayer
+from core.animation_engine import AnimationEngine, glyph_transform, OUTLINE_BRUSH
+from core.font_glyphs import font_glyph_path
+from core.character_loader import CharacterLoader
+from core.word_renderer import WordRenderer
 from core.speech_engine import SpeechEngine
-from ui.settings_dialog import SettingsDialog
-from ui.about_dialog import AboutDialog
-from ui.font_dialog import FontDialog
+from core.startup_profiler import profiler
+from core.trace_recorder import tracer
+from ui.timeline_bar import TimelineBar
+from ui.word_panel import WordPanel
+from ui.character_board import CharacterBoard, BOARD_SIZE
 
 
 class CharacterWidget(QWidget):
     """Widget for displaying animated Chinese characters."""
     
-    def __init__(self, animation_engine, parent=None):
+    def __init__(self, animation_engine, word_renderer=None, parent=None):
         """Initialize the character widget.
         
         Args:
             animation_engine: The animation engine.
+            word_renderer (WordRenderer, optional): Draws 组词 entries.
             parent: Parent widget.
         """
         super().__init__(parent)
         self.animation_engine = animation_engine
         self.animation_engine.animation_updated.connect(self.update)
+        self.word_renderer = word_renderer
+        if word_renderer is not None:
+            word_renderer.animation_updated.connect(self.update)
+        self.preview_character = ""  # 连续翻页时只显示字形预览
+        
+        # 描红练习：轨迹用窗口坐标记录，提交时用缓存的逆变换换算到字框坐标
+        self.tracing_session = None
+        self.trace_points = []
+        self.trace_on_track = True
+        self.update_glyph_transform()
+        self.miss_timer = QTimer(self)
+        self.miss_timer.setSingleShot(True)
+        self.miss_timer.timeout.connect(self.clear_trace)
         
         # Set focus policy to receive key events
         self.setFocusPolicy(Qt.NoFocus)  # 禁止获取焦点
@@ -54,8 +82,131 @@ class CharacterWidget(QWidget):
         # Clear background
         painter.fillRect(self.rect(), self.palette().window())
         
+        # 连续翻页或笔画数据尚在加载时显示字形占位
+        if self.preview_character:
+            self.render_preview(painter, self.preview_character)
+            return
+        if self.word_renderer is not None and self.word_renderer.word:
+            self.word_renderer.render(painter, self.rect())
+            return
+        if self.animation_engine.is_loading:
+            self.render_preview(painter, self.animation_engine.current_character)
+            return
+        
         # Render character animation
-        self.animation_engine.render(painter, self.rect())
+        if tracer.first_paint_pending:
+            tracer.first_paint_pending = False
+            with tracer.span("first paint"):
+                self.animation_engine.render(painter, self.rect())
+        else:
+            self.animation_engine.render(painter, self.rect())
+        
+        if self.tracing_active():
+            self.render_trace(painter)
+    
+    def render_trace(self, painter):
+        """绘制描红提示（下一笔起点）和正在书写的轨迹
+        
+        Args:
+            painter (QPainter): 绘制用的画笔
+        """
+        start = self.tracing_session.expected_start()
+        if start is not None and not self.trace_points:
+            point = self.glyph_forward.map(QPointF(*start))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(60, 180, 90, 160))
+            radius = max(6.0, min(self.width(), self.height()) / 40)
+            painter.drawEllipse(point, radius, radius)
+        
+        if len(self.trace_points) > 1:
+            if self.miss_timer.isActive():
+                color = QColor(220, 60, 60, 200)
+            elif self.trace_on_track:
+                color = QColor(40, 120, 220, 200)
+            else:
+                color = QColor(230, 150, 40, 200)
+            pen = QPen(color, max(4.0, min(self.width(), self.height()) / 60))
+            pen.setCapStyle(Qt.RoundCap)
+            pen.setJoinStyle(Qt.RoundJoin)
+            painter.setPen(pen)
+            painter.drawPolyline(QPolygonF(self.trace_points))
+    
+    def set_tracing_session(self, session):
+        """开关描红练习
+        
+        Args:
+            session (TracingSession): 练习会话，None 时恢复点击朗读
+        """
+        self.tracing_session = session
+        self.clear_trace()
+    
+    def tracing_active(self):
+        """是否正在描红（显示组词、预览或加载中时不接受描写）"""
+        if self.tracing_session is None or self.preview_character:
+            return False
+        if self.word_renderer is not None and self.word_renderer.word:
+            return False
+        return not self.animation_engine.is_loading
+    
+    def clear_trace(self):
+        """清除当前轨迹"""
+        self.miss_timer.stop()
+        self.trace_points = []
+        self.trace_on_track = True
+        self.update()
+    
+    def update_glyph_transform(self):
+        """缓存字框到窗口的变换及其逆变换"""
+        self.glyph_forward = glyph_transform(self.width(), self.height())
+        self.glyph_inverse = self.glyph_forward.inverted()[0]
+    
+    def resizeEvent(self, event):
+        """窗口大小变化时更新缓存的变换"""
+        super().resizeEvent(event)
+        self.update_glyph_transform()
+    
+    def mousePressEvent(self, event):
+        """描红模式下开始一笔（触屏操作由 Qt 转换为鼠标事件）"""
+        if self.tracing_active() and event.button() == Qt.LeftButton:
+            self.miss_timer.stop()
+            self.trace_points = [QPointF(event.pos())]
+            self.trace_on_track = True
+            self.update()
+    
+    def mouseMoveEvent(self, event):
+        """描红模式下记录轨迹，并实时判断是否偏离下一笔"""
+        if not self.tracing_active() or not self.trace_points:
+            return
+        point = QPointF(event.pos())
+        self.trace_points.append(point)
+        glyph_point = self.glyph_inverse.map(point)
+        self.trace_on_track = self.tracing_session.on_track((glyph_point.x(), glyph_point.y()))
+        self.update()
+    
+    def set_preview(self, character):
+        """显示轻量预览（字体字形），为空时恢复笔画动画
+        
+        Args:
+            character (str): 预览的汉字
+        """
+        if character != self.preview_character:
+            self.preview_character = character
+            self.update()
+    
+    def render_preview(self, painter, character):
+        """用字体字形绘制预览汉字，不读取笔画数据
+        
+        Args:
+            painter (QPainter): 绘制用的画笔
+            character (str): 预览的汉字
+        """
+        if not character:
+            return
+        font_family = self.animation_engine.config_manager.get("font_family", "SimHei")
+        painter.save()
+        painter.setWorldTransform(self.glyph_forward, True)
+        painter.fillPath(font_glyph_path(font_family, character), OUTLINE_BRUSH)
+        painter.restore()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events.
@@ -63,9 +214,32 @@ class CharacterWidget(QWidget):
         Args:
             event (QMouseEvent): Mouse event.
         """
+        if event.button() == Qt.LeftButton and self.tracing_active():
+            if len(self.trace_points) < 2:
+                self.clear_trace()
+                return
+            points = [self.glyph_inverse.map(point) for point in self.trace_points]
+            if self.tracing_session.submit([(point.x(), point.y()) for point in points]):
+                self.clear_trace()
+            else:
+                # 写错的一笔标红停留片刻
+                self.miss_timer.start(500)
+                self.update()
+            return
+        
         if event.button() == Qt.LeftButton:
             main_window = self.window()  # 获取主窗口实例
             
+            # 点中笔画时重播该笔，点在空白处朗读汉字
+            showing_character = not (self.preview_character or self.animation_engine.is_loading
+                                     or (self.word_renderer is not None and self.word_renderer.word))
+            if showing_character and hasattr(main_window, 'show_stroke'):
+                point = self.glyph_inverse.map(QPointF(event.pos()))
+                stroke = self.animation_engine.stroke_at(point.x(), point.y())
+                if stroke >= 0:
+                    main_window.show_stroke(stroke)
+                    return
+            
             if hasattr(main_window, 're_pronounce_character'):
                 main_window.re_pronounce_character()
 
@@ -73,6 +247,9 @@ class CharacterWidget(QWidget):
 class MainWindow(QMainWindow):
     """Main window of the application."""
     
+    # Signal emitted after a character has been loaded for display
+    character_changed = pyqtSignal(str)
+    
     def __init__(self, config_manager):
         """Initialize the main window.
         
@@ -84,20 +261,56 @@ class MainWindow(QMainWindow):
         self.config_manager.config_updated.connect(self.update_background)
         
         # Initialize core components
-        self.character_manager = CharacterManager()
-        self.animation_engine = AnimationEngine(config_manager)
+        self.hanzi_data = HanziDataStore(
+            config_manager.get("graphics_path", "assets/graphics.txt"),
+            config_manager.get("dictionary_path", "assets/dictionary.txt")
+        )
+        # 字库在首次绘制之后才加载，见 finish_startup()
+        self.character_manager = CharacterManager(hanzi_data=self.hanzi_data, autoload=False)
+        self.character_loader = CharacterLoader(self.hanzi_data)
+        self.animation_engine = AnimationEngine(config_manager, self.character_loader)
+        self.word_renderer = WordRenderer(self.character_loader, config_manager)
         self.speech_engine = SpeechEngine(config_manager)
+        self.image_cache = ImageCache(
+            config_manager.get("image_root", "assets"),
+            config_manager.get("image_cache_mb", 64) * 1024 * 1024
+        )
+        
+        self.library_watcher = None
+        self.stroke_types = None
+        self.handwriting_index = None  # 手写查字索引，首次打开字库管理时加载
+        
+        # 按住方向键时合并自动重复的翻页，停下后才完整加载
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(config_manager.get("navigation_settle_ms", 150))
+        self.settle_timer.timeout.connect(self.settle_navigation)
+        tracer.set_capacity(config_manager.get("trace_buffer_size", 10000))
+        
+        # 描红练习：首次进入时创建（需要 NumPy）
+        self.tracing_mode = False
+        self.tracing_session = None
+        self.tracing_restart_timer = QTimer(self)
+        self.tracing_restart_timer.setSingleShot(True)
+        self.tracing_restart_timer.timeout.connect(self.restart_tracing)
+        
+        # 自动播放：按当前顺序循环，并预先准备后面几个字
+        self.autoplayer = AutoPlayer(self.character_manager, self.character_loader,
+                                     self.speech_engine, config_manager.get("prefetch_count", 3))
+        self.character_changed.connect(lambda character: self.autoplayer.refill())
+        # 自动播放中组词写完后停留片刻，再回到当前汉字继续播放
+        self.word_hold_timer = QTimer(self)
+        self.word_hold_timer.setSingleShot(True)
+        self.word_hold_timer.timeout.connect(self.resume_after_word)
         
         # Connect animation engine signals
         self.animation_engine.animation_completed.connect(self.on_animation_completed)
         self.animation_engine.stroke_added.connect(self.on_stroke_added)
+        self.word_renderer.animation_completed.connect(self.on_word_completed)
         
         # Set up the UI
         self.setup_ui()
         
-        # Load initial character
-        self.load_current_character()
-        
         self.study_mode = True  # 默认为学习模式
         
         # 初始化背景色
@@ -107,6 +320,42 @@ class MainWindow(QMainWindow):
         self.init_window_state()
         self.setFocusPolicy(Qt.StrongFocus)
         QTimer.singleShot(100, self.force_focus)  # 延迟确保焦点设置
+        
+        # 数据加载推迟到窗口首次绘制之后，窗口一直未绘制时由定时器兜底
+        self._startup_pending = True
+        self._startup_scheduled = False
+        QTimer.singleShot(1000, self.finish_startup)
+    
+    def finish_startup(self):
+        """首次绘制后加载字库并显示第一个汉字"""
+        if not self._startup_pending:
+            return
+        self._startup_pending = False
+        
+        with profiler.span("load characters"):
+            self.character_manager.load_characters()
+        
+        # 外部编辑字库文件时增量更新
+        if self.config_manager.get("watch_library", True):
+            self.library_watcher = LibraryWatcher(self.character_manager)
+            self.library_watcher.library_changed.connect(self.on_library_changed)
+        
+        # 笔画类型索引（由 --build-stroke-types 生成，可选）
+        stroke_types_path = self.config_manager.get("stroke_types_path", "assets/stroke_types.npz")
+        if os.path.exists(stroke_types_path):
+            with profiler.span("load stroke types"):
+                from core.stroke_types import StrokeTypeIndex
+                self.stroke_types = StrokeTypeIndex.load(stroke_types_path)
+                self.animation_engine.stroke_types = self.stroke_types
+        
+        # Load initial character
+        with profiler.span("load first character"):
+            self.load_current_character()
+        
+        if self.config_manager.get("autoplay", False):
+            self.autoplay_action.setChecked(True)
+        
+        profiler.report()
     
     def init_window_state(self):
         """初始化窗口状态"""
@@ -116,6 +365,11 @@ class MainWindow(QMainWindow):
         # 初始为最大化状态
         self.showMaximized()
     
+    def closeEvent(self, event):
+        """关闭窗口前停止后台加载"""
+        self.character_loader.shutdown()
+        super().closeEvent(event)
+    
     def toggle_fullscreen(self):
         """切换全屏/正常模式"""
         if self._is_fullscreen:
@@ -135,12 +389,29 @@ class MainWindow(QMainWindow):
         if not self.hasFocus():
             self.setFocus()
         
-        # 处理方向键
-        if event.key() == Qt.Key_Up:
-            self.show_previous_character()
+        # 十字板模式下方向键整页翻动
+        if self.board_mode and event.key() in (Qt.Key_Up, Qt.Key_Down):
+            self.show_board_page(-1 if event.key() == Qt.Key_Up else 1)
+            event.accept()
+        # 处理方向键，自动重复的按键只预览不加载
+        elif event.key() == Qt.Key_Up:
+            if event.isAutoRepeat():
+                self.skim_characters(-1)
+            else:
+                self.show_previous_character()
             event.accept()
         elif event.key() == Qt.Key_Down:
-            self.show_next_character()
+            if event.isAutoRepeat():
+                self.skim_characters(1)
+            else:
+                self.show_next_character()
+            event.accept()
+        # 空格暂停/继续动画，左右键逐笔后退/前进
+        elif event.key() == Qt.Key_Space and self.animation_controls_active():
+            self.animation_engine.toggle_pause()
+            event.accept()
+        elif event.key() in (Qt.Key_Left, Qt.Key_Right) and self.animation_controls_active():
+            self.animation_engine.step(-1 if event.key() == Qt.Key_Left else 1)
             event.accept()
         elif event.key() == Qt.Key_Escape and self._is_fullscreen:
             self.toggle_fullscreen()
@@ -148,6 +419,15 @@ class MainWindow(QMainWindow):
         else:
             super().keyPressEvent(event)
     
+    def keyReleaseEvent(self, event):
+        """松开方向键时立即加载停留的汉字"""
+        if (event.key() in (Qt.Key_Up, Qt.Key_Down) and not event.isAutoRepeat()
+                and self.settle_timer.isActive()):
+            self.settle_navigation()
+            event.accept()
+        else:
+            super().keyReleaseEvent(event)
+    
     def changeEvent(self, event):
         """处理最大化按钮点击"""
         if event.type() == QEvent.WindowStateChange:
@@ -171,12 +451,37 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         # Create character display widget
-        self.character_widget = CharacterWidget(self.animation_engine, self)
+        self.character_widget = CharacterWidget(self.animation_engine, self.word_renderer, self)
         layout.addWidget(self.character_widget)
         
+        # 动画进度条：暂停/继续和拖动跳转
+        self.timeline_bar = TimelineBar(self.animation_engine, self)
+        layout.addWidget(self.timeline_bar)
+        
+        # 组词及图片
+        self.word_panel = WordPanel(self.image_cache, self)
+        self.word_panel.word_clicked.connect(self.show_word)
+        layout.addWidget(self.word_panel)
+        
+        # 十字板：一次显示十个字（默认隐藏）
+        self.board_mode = False
+        self.character_board = CharacterBoard(self.character_loader, self.config_manager, self)
+        self.character_board.character_clicked.connect(self.speech_engine.pronounce)
+        self.character_board.setVisible(False)
+        layout.addWidget(self.character_board)
+        
         # Create status bar
         self.statusBar().showMessage("Ready")
         
+        # 性能信息（默认隐藏，开启后才安装计时）
+        self.perf_stats = None
+        self.perf_label = QLabel()
+        self.perf_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.perf_label)
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(500)
+        self.perf_timer.timeout.connect(self.update_perf_overlay)
+        
         # Create menus
         self.create_menus()
     
@@ -197,6 +502,14 @@ class MainWindow(QMainWindow):
         add_font_action.triggered.connect(self.show_font_dialog)
         fonts_menu.addAction(add_font_action)
         
+        import_action = QAction("&Bulk Import...", self)
+        import_action.triggered.connect(self.show_bulk_import)
+        fonts_menu.addAction(import_action)
+        
+        worksheet_action = QAction("Print &Worksheet...", self)
+        worksheet_action.triggered.connect(self.show_worksheet_export)
+        fonts_menu.addAction(worksheet_action)
+        
         # Settings menu
         settings_menu = self.menuBar().addMenu("&Settings")
         
@@ -204,6 +517,22 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.show_settings_dialog)
         settings_menu.addAction(settings_action)
         
+        self.perf_action = QAction("Performance &Overlay", self)
+        self.perf_action.setShortcut("F12")
+        self.perf_action.setCheckable(True)
+        self.perf_action.toggled.connect(self.toggle_perf_overlay)
+        settings_menu.addAction(self.perf_action)
+        
+        self.trace_action = QAction("&Record Trace", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(tracer.enabled)
+        self.trace_action.toggled.connect(tracer.set_enabled)
+        settings_menu.addAction(self.trace_action)
+        
+        export_trace_action = QAction("&Export Trace...", self)
+        export_trace_action.triggered.connect(self.export_trace)
+        settings_menu.addAction(export_trace_action)
+        
         # Mode menu
         mode_menu = self.menuBar().addMenu('Mode')
         
@@ -225,6 +554,45 @@ class MainWindow(QMainWindow):
         mode_group.addAction(self.exam_action)
         mode_menu.addAction(self.exam_action)
         
+        mode_menu.addSeparator()
+        
+        self.board_action = QAction('Board (10 Characters)', self)
+        self.board_action.setShortcut("F9")
+        self.board_action.setCheckable(True)
+        self.board_action.toggled.connect(self.toggle_board)
+        mode_menu.addAction(self.board_action)
+        
+        self.tracing_action = QAction('Tracing Practice', self)
+        self.tracing_action.setShortcut("F8")
+        self.tracing_action.setCheckable(True)
+        self.tracing_action.toggled.connect(self.toggle_tracing)
+        mode_menu.addAction(self.tracing_action)
+        
+        self.autoplay_action = QAction('Auto Play', self)
+        self.autoplay_action.setShortcut("F5")
+        self.autoplay_action.setCheckable(True)
+        self.autoplay_action.toggled.connect(self.toggle_autoplay)
+        mode_menu.addAction(self.autoplay_action)
+        
+        # 按索引筛选（打开菜单时根据当前字库生成）
+        mode_menu.addSeparator()
+        
+        all_action = QAction('All Characters', self)
+        all_action.triggered.connect(self.clear_filter)
+        mode_menu.addAction(all_action)
+        
+        self.group_menu = mode_menu.addMenu('By Group')
+        self.group_menu.aboutToShow.connect(self.populate_group_menu)
+        
+        self.stroke_menu = mode_menu.addMenu('By Strokes')
+        self.stroke_menu.aboutToShow.connect(self.populate_stroke_menu)
+        
+        self.radical_menu = mode_menu.addMenu('By Radical')
+        self.radical_menu.aboutToShow.connect(self.populate_radical_menu)
+        
+        self.stroke_type_menu = mode_menu.addMenu('By Stroke Type')
+        self.stroke_type_menu.aboutToShow.connect(self.populate_stroke_type_menu)
+        
         # About menu
         about_menu = self.menuBar().addMenu("&About")
         
@@ -232,21 +600,231 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about_dialog)
         about_menu.addAction(about_action)
     
+    def _populate_filter_menu(self, menu, keys, label, lookup):
+        """用索引的分桶填充筛选子菜单
+        
+        Args:
+            menu (QMenu): 目标子菜单
+            keys (list): 分桶键
+            label (callable): 由键生成菜单文字
+            lookup (callable): 由键取得汉字列表
+        """
+        menu.clear()
+        for key in keys:
+            chars = lookup(key)
+            action = menu.addAction(f"{label(key)} ({len(chars)})")
+            action.triggered.connect(
+                lambda checked, c=chars, k=key: self.apply_filter(c, lambda: lookup(k)))
+        if not keys:
+            menu.addAction("(empty)").setEnabled(False)
+    
+    def populate_group_menu(self):
+        """生成分组筛选菜单"""
+        index = self.character_manager.index
+        self._populate_filter_menu(self.group_menu, index.groups(),
+                                   str, index.by_group)
+    
+    def populate_stroke_menu(self):
+        """生成笔画数筛选菜单"""
+        index = self.character_manager.index
+        self._populate_filter_menu(self.stroke_menu, index.stroke_counts(),
+                                   lambda n: f"{n} 画", index.by_stroke_count)
+    
+    def populate_radical_menu(self):
+        """生成部首筛选菜单"""
+        index = self.character_manager.index
+        self._populate_filter_menu(self.radical_menu, index.radicals(),
+                                   str, index.by_radical)
+    
+    def populate_stroke_type_menu(self):
+        """生成笔画类型筛选菜单（如“竖钩”）"""
+        if self.stroke_types is None:
+            self.stroke_type_menu.clear()
+            self.stroke_type_menu.addAction("(run --build-stroke-types)").setEnabled(False)
+            return
+        from core.stroke_types import STROKE_TYPES
+        
+        library = self.character_manager.index
+        lookup = lambda name: [c for c in self.stroke_types.characters_with(name) if c in library]
+        buckets = {name: lookup(name) for name in STROKE_TYPES}
+        self._populate_filter_menu(self.stroke_type_menu,
+                                   [name for name in STROKE_TYPES if buckets[name]],
+                                   str, lookup)
+    
+    def apply_filter(self, characters, query=None):
+        """只浏览筛选出的汉字
+        
+        Args:
+            characters (list): 索引查询结果
+            query (callable, optional): 重新执行该查询，字库变化时用于筛选新增的字
+        """
+        self.character_manager.filter_characters(characters, query)
+        if not self.study_mode:
+            self.character_manager.shuffle_characters()
+        self.load_current_character()
+    
+    def clear_filter(self):
+        """取消筛选，恢复全部汉字"""
+        self.character_manager.restore_order()
+        if not self.study_mode:
+            self.character_manager.shuffle_characters()
+        self.load_current_character()
+    
     def show_next_character(self):
         """显示下一个汉字"""
-        self.character_manager.next_character()
-        self.load_current_character()
+        with tracer.begin_navigation("show_next_character"):
+            self.character_manager.next_character()
+            self.load_current_character()
         # 调试输出
         print(f"当前汉字：{self.character_manager.get_current_character()}")
     
     def show_previous_character(self):
         """显示上一个汉字"""
-        self.character_manager.previous_character()
-        self.load_current_character()
+        with tracer.begin_navigation("show_previous_character"):
+            self.character_manager.previous_character()
+            self.load_current_character()
+        print(f"当前汉字：{self.character_manager.get_current_character()}")
+    
+    def skim_characters(self, step):
+        """连续翻页：只更新位置和预览，停下后由 settle_navigation 完整加载
+        
+        Args:
+            step (int): 1 为下一个，-1 为上一个
+        """
+        if step > 0:
+            character = self.character_manager.next_character()
+        else:
+            character = self.character_manager.previous_character()
+        if not character:
+            return
+        
+        # 取消正在进行的加载、动画和发音
+        self.word_renderer.clear()
+        self.character_loader.cancel()
+        self.animation_engine.reset_animation()
+        self.speech_engine.stop()
+        
+        tracer.instant("skim", char=character)
+        self.update_status()
+        self.character_widget.set_preview(character)
+        self.settle_timer.start()
+    
+    def settle_navigation(self):
+        """加载连续翻页停留的汉字"""
+        self.settle_timer.stop()
+        with tracer.begin_navigation("settle_navigation"):
+            self.load_current_character()
         print(f"当前汉字：{self.character_manager.get_current_character()}")
     
+    def toggle_board(self, enabled):
+        """切换十字板模式
+        
+        Args:
+            enabled (bool): 是否显示十字板
+        """
+        if enabled:
+            self.tracing_action.setChecked(False)
+        self.board_mode = enabled
+        self.character_widget.setVisible(not enabled)
+        self.update_timeline_bar()
+        self.update_word_panel()
+        self.character_board.setVisible(enabled)
+        if enabled:
+            self.animation_engine.reset_animation()
+            self.speech_engine.stop()
+        self.load_current_character()
+    
+    def animation_controls_active(self):
+        """暂停、逐笔和拖动时间轴是否作用于当前汉字（十字板、描红和组词显示时不作用）"""
+        return not (self.board_mode or self.tracing_mode or self.word_renderer.word)
+    
+    def update_timeline_bar(self):
+        """十字板和描红时隐藏时间轴，显示组词时禁用"""
+        self.timeline_bar.setVisible(not self.board_mode and not self.tracing_mode)
+        self.timeline_bar.setEnabled(self.animation_controls_active())
+    
+    def toggle_tracing(self, enabled):
+        """切换描红练习：孩子按笔顺逐笔描写，写对的笔画着色
+        
+        Args:
+            enabled (bool): 是否进入描红练习
+        """
+        if enabled and self.board_mode:
+            self.board_action.setChecked(False)
+        if enabled and self.tracing_session is None:
+            from core.tracing import StrokeMatcher, TracingSession
+            self.tracing_session = TracingSession(StrokeMatcher(self.hanzi_data))
+            self.tracing_session.stroke_matched.connect(self.on_trace_matched)
+            self.tracing_session.stroke_missed.connect(self.on_trace_missed)
+            self.tracing_session.completed.connect(self.on_tracing_completed)
+        self.tracing_mode = enabled
+        self.clear_word()
+        self.update_timeline_bar()
+        self.animation_engine.set_tracing(enabled)
+        self.character_widget.set_tracing_session(self.tracing_session if enabled else None)
+        self.restart_tracing()
+    
+    def restart_tracing(self):
+        """从第一笔开始描写当前汉字"""
+        self.tracing_restart_timer.stop()
+        if not self.tracing_mode:
+            return
+        self.animation_engine.reset_animation()
+        self.animation_engine.animation_updated.emit()
+        self.tracing_session.begin(self.animation_engine.current_character)
+        self.character_widget.clear_trace()
+    
+    def on_trace_matched(self, index):
+        """写对一笔：显示该笔画
+        
+        Args:
+            index (int): 笔画序号
+        """
+        self.animation_engine.reveal_stroke(index)
+        self.statusBar().showMessage(
+            f"第 {index + 1} 笔写对了（{self.tracing_session.next_stroke}/{self.tracing_session.stroke_total}）")
+    
+    def on_trace_missed(self, index):
+        """写错一笔：提示重写
+        
+        Args:
+            index (int): 笔画序号
+        """
+        self.statusBar().showMessage(f"第 {index + 1} 笔再试一次")
+    
+    def on_tracing_completed(self):
+        """整字写完：朗读汉字，停留后重新开始描写"""
+        character = self.tracing_session.character
+        self.speech_engine.pronounce(character)
+        self.statusBar().showMessage(f"“{character}”写完了！")
+        self.tracing_restart_timer.start(self.config_manager.get("display_time", 3000))
+    
+    def show_board_page(self, step):
+        """十字板翻页
+        
+        Args:
+            step (int): 1 为下一页，-1 为上一页
+        """
+        index = self.character_manager.get_current_index()
+        start = index - index % BOARD_SIZE + step * BOARD_SIZE
+        if 0 <= start < self.character_manager.get_character_count():
+            self.character_manager.current_index = start
+            self.refresh_board()
+    
+    def refresh_board(self):
+        """在十字板上显示当前汉字所在的一页"""
+        index = self.character_manager.get_current_index()
+        start = index - index % BOARD_SIZE
+        self.character_board.set_characters(
+            self.character_manager.characters[start:start + BOARD_SIZE])
+        self.update_status()
+    
     def load_current_character(self):
         """Load the current character."""
+        self.settle_timer.stop()
+        if self.board_mode:
+            self.refresh_board()
+            return
         character = self.character_manager.get_current_character()
         self.update_character(character)
     
@@ -259,16 +837,84 @@ class MainWindow(QMainWindow):
         if not character:
             return
         
-        # Update status bar
+        with tracer.span("update_character", char=character):
+            # Update status bar
+            self.update_status()
+            
+            # Pronounce the character
+            self.speech_engine.pronounce(character)
+            
+            # Set character for animation
+            self.word_renderer.clear()
+            self.update_timeline_bar()
+            self.character_widget.set_preview("")
+            self.animation_engine.set_character(character)
+            self.restart_tracing()
+            
+            # Show words of the character and prefetch pictures of the next ones
+            self.update_words(character)
+        
+        self.character_changed.emit(character)
+    
+    def show_word(self, word):
+        """在画布上依次书写一个组词
+        
+        Args:
+            word (str): 组词，如“太阳”
+        """
+        # 取消仍在加载的汉字，免得数据到达后在组词下面重新开始动画和发音
+        self.word_hold_timer.stop()
+        self.character_loader.cancel()
+        self.animation_engine.reset_animation()
+        self.speech_engine.stop()
+        self.word_renderer.set_word(word)
+        self.update_timeline_bar()
+        self.speech_engine.pronounce(word)
+    
+    def clear_word(self):
+        """收起组词，回到当前汉字（显示组词时被取消的加载重新开始）"""
+        if not self.word_renderer.word:
+            return
+        self.word_renderer.clear()
+        self.update_timeline_bar()
+        engine = self.animation_engine
+        if engine.is_loading:
+            engine.set_character(engine.current_character)
+        else:
+            engine.animation_updated.emit()
+    
+    def update_words(self, character):
+        """显示当前汉字的组词，后台预先解析组词中的字并预解码后续汉字的图片
+        
+        Args:
+            character (str): 当前汉字
+        """
+        data = self.character_manager.character_data
+        words = data.get(character, {}).get('words', [])
+        self.word_panel.set_words(words)
+        self.update_word_panel()
+        # 组词中的字在后台预先解析，点击组词时可立即书写
+        self.character_loader.prefetch(
+            char for word in words for char in word.get('name', '') if char != character)
+        
+        # 自动播放时播到末尾会回到开头，预取也随之回绕
+        upcoming = self.character_manager.get_upcoming_characters(
+            self.config_manager.get("prefetch_count", 3), wrap=self.autoplayer.enabled)
+        self.image_cache.prefetch(
+            word.get('image', '')
+            for char in upcoming
+            for word in data.get(char, {}).get('words', [])
+        )
+    
+    def update_word_panel(self):
+        """有组词且不在十字板模式时才显示组词栏"""
+        self.word_panel.setVisible(bool(self.word_panel.cards) and not self.board_mode)
+    
+    def update_status(self):
+        """Show the current position in the status bar."""
         index = self.character_manager.get_current_index() + 1
         count = self.character_manager.get_character_count()
         self.statusBar().showMessage(f"Character {index} of {count}")
-        
-        # Pronounce the character
-        self.speech_engine.pronounce(character)
-        
-        # Set character for animation
-        self.animation_engine.set_character(character)
     
     def re_pronounce_character(self):
         """Re-pronounce the current character."""
@@ -276,11 +922,82 @@ class MainWindow(QMainWindow):
         if character:
             self.speech_engine.pronounce(character)
     
+    def show_stroke(self, index):
+        """重播被点中的笔画，并在状态栏显示笔顺和笔画名称
+        
+        Args:
+            index (int): 笔画序号
+        """
+        self.animation_engine.replay_stroke(index)
+        total = len(self.animation_engine.strokes)
+        message = f"第 {index + 1} 笔（共 {total} 笔）"
+        if self.stroke_types is not None:
+            names = self.stroke_types.types_of(self.animation_engine.current_character)
+            if len(names) == total:
+                message += f"：{names[index]}"
+        self.statusBar().showMessage(message)
+    
+    def on_library_changed(self, diff):
+        """字库文件被外部修改后，只刷新受影响的部分
+        
+        Args:
+            diff (LibraryDiff): 新增、删除和变化的汉字
+        """
+        self.update_status()
+        
+        character = self.character_manager.get_current_character()
+        if character != self.animation_engine.current_character:
+            # 当前显示的字已被删除
+            self.load_current_character()
+        elif character in diff.changed:
+            self.update_words(character)
+    
     @pyqtSlot()
     def on_animation_completed(self):
         """Handle animation completion."""
-        # Animation sequence is complete
-        pass
+        # 自动播放：写完设定的遍数后切换到下一个字
+        if self.autoplayer.enabled:
+            self.advance_autoplay()
+    
+    def toggle_autoplay(self, enabled):
+        """开关自动播放
+        
+        Args:
+            enabled (bool): 是否自动切换汉字
+        """
+        self.autoplayer.enabled = enabled
+        self.autoplayer.refill()
+        if not enabled:
+            self.word_hold_timer.stop()
+            return
+        # 组词已经写完时回到当前汉字，当前字已经播完时直接开始下一个
+        engine = self.animation_engine
+        if self.word_renderer.word:
+            if not self.word_renderer.is_writing:
+                self.on_word_completed()
+        elif not (engine.is_animating or engine.is_paused or engine.is_loading):
+            self.advance_autoplay()
+    
+    def on_word_completed(self):
+        """组词写完：自动播放时停留 display_time 后回到当前汉字"""
+        if self.autoplayer.enabled:
+            self.word_hold_timer.start(self.config_manager.get("display_time", 3000))
+    
+    def resume_after_word(self):
+        """收起组词，重新播放当前汉字，播完后自动播放照常切换"""
+        if (not self.autoplayer.enabled or not self.word_renderer.word
+                or self.tracing_mode or self.board_mode):
+            return
+        with tracer.begin_navigation("autoplay"):
+            self.load_current_character()
+    
+    def advance_autoplay(self):
+        """播放列表中的下一个字（描红、十字板和组词显示时不切换）"""
+        if self.tracing_mode or self.board_mode or self.word_renderer.word:
+            return
+        if self.autoplayer.advance():
+            with tracer.begin_navigation("autoplay"):
+                self.load_current_character()
     
     @pyqtSlot()
     def on_stroke_added(self):
@@ -290,8 +1007,58 @@ class MainWindow(QMainWindow):
             character = self.character_manager.get_current_character()
             self.speech_engine.pronounce(character)
     
+    def toggle_perf_overlay(self, enabled):
+        """开关性能信息显示
+        
+        Args:
+            enabled (bool): 是否显示
+        """
+        if enabled:
+            from core.perf_stats import PerfStats
+            self.perf_stats = PerfStats()
+            self.perf_stats.cache_sources = {
+                "stroke cache": self.hanzi_data.get_hit_rate,
+                "image cache": self.image_cache.get_hit_rate,
+            }
+            self.perf_stats.attach(self.animation_engine, self.speech_engine)
+            self.perf_timer.start()
+            self.update_perf_overlay()
+        else:
+            self.perf_timer.stop()
+            if self.perf_stats is not None:
+                self.perf_stats.detach()
+                self.perf_stats = None
+        self.perf_label.setVisible(enabled)
+    
+    def update_perf_overlay(self):
+        """刷新性能信息"""
+        if self.perf_stats is not None:
+            self.perf_label.setText(self.perf_stats.summary())
+    
+    def export_trace(self):
+        """导出记录的耗时追踪（Chrome trace JSON 或 JSONL）"""
+        if not tracer.events:
+            QMessageBox.information(self, "Export Trace",
+                                    "No trace recorded. Enable Settings → Record Trace first.")
+            return
+        
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "trace.json",
+            "Chrome trace (*.json);;JSON lines (*.jsonl)"
+        )
+        if not path:
+            return
+        
+        try:
+            tracer.export(path)
+        except IOError as e:
+            QMessageBox.warning(self, "Export Trace", str(e))
+            return
+        self.statusBar().showMessage(f"Exported {len(tracer.events)} trace events to {path}")
+    
     def show_settings_dialog(self):
         """Show the settings dialog."""
+        from ui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self.config_manager, self)
         if dialog.exec_():
             # Reload character with new settings
@@ -299,11 +1066,77 @@ class MainWindow(QMainWindow):
     
     def show_font_dialog(self):
         """Show the font dialog."""
-        dialog = FontDialog(self.character_manager, self)
+        from ui.font_dialog import FontDialog
+        path = self.config_manager.get("handwriting_index_path", "assets/handwriting.npz")
+        if self.handwriting_index is None and os.path.exists(path):
+            from core.handwriting import HandwritingIndex
+            self.handwriting_index = HandwritingIndex.load(path)
+        dialog = FontDialog(self.character_manager, self, self.handwriting_index)
         dialog.exec_()
     
+    def show_bulk_import(self):
+        """从文本或YAML列表批量导入汉字"""
+        import yaml
+        from core.bulk_importer import import_characters
+        
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Character List", "",
+            "Character lists (*.txt *.yaml *.yml);;All files (*)"
+        )
+        if not path:
+            return
+        
+        group_name, ok = QInputDialog.getText(
+            self, "Import Character List", "Group for new characters:",
+            text="基础汉字"
+        )
+        if not ok or not group_name.strip():
+            return
+        
+        try:
+            result = import_characters(self.character_manager, path, group_name.strip())
+        except (IOError, UnicodeDecodeError, ValueError, yaml.YAMLError) as e:
+            QMessageBox.warning(self, "Import Failed", str(e))
+            return
+        
+        QMessageBox.information(self, "Import Finished", result.summary())
+        self.update_status()
+    
+    def show_worksheet_export(self):
+        """把一个分组的汉字生成描红练习 PDF"""
+        from core.worksheet import Worksheet
+        
+        groups = self.character_manager.index.groups()
+        if not groups:
+            return
+        group_name, ok = QInputDialog.getItem(
+            self, "Print Worksheet", "Group:", groups, 0, False
+        )
+        if not ok:
+            return
+        
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Print Worksheet", f"{group_name}.pdf", "PDF files (*.pdf)"
+        )
+        if not path:
+            return
+        
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            worksheet = Worksheet(self.hanzi_data, self.config_manager.get_stroke_color())
+            pages = worksheet.write(self.character_manager.index.by_group(group_name),
+                                    path, group_name)
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not pages:
+            QMessageBox.information(self, "Print Worksheet",
+                                    f"No characters in {group_name} have stroke data.")
+            return
+        self.statusBar().showMessage(f"Worksheet written to {path} ({pages} pages)", 5000)
+    
     def show_about_dialog(self):
         """Show the about dialog."""
+        from ui.about_dialog import AboutDialog
         dialog = AboutDialog(self)
         dialog.exec_()
     
@@ -329,12 +1162,25 @@ class MainWindow(QMainWindow):
             self.speech_engine.stop()
             self.speech_engine.mute()
         
+        if self.board_mode:
+            self.refresh_board()
+            return
+        
         # 更新显示当前字符
         self.current_character = self.character_manager.get_current_character()
         self.animation_engine.set_character(self.current_character)
+        self.restart_tracing()
+        self.update_status()
+        self.update_words(self.current_character)
 
     def paintEvent(self, event):
         """重写绘制事件，用于渲染汉字"""
+        if getattr(self, '_startup_pending', False) and not self._startup_scheduled:
+            # 首次绘制：窗口已可见，开始加载数据
+            self._startup_scheduled = True
+            profiler.mark("first paint")
+            QTimer.singleShot(0, self.finish_startup)
+        
         if hasattr(self, 'animation_engine'):
             painter = QPainter(self)
             self.animation_engine.render(painter, self.rect())
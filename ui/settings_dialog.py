@@ -6,13 +6,51 @@ Settings dialog for the Chinese Character Reading Application.
 """
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFontDatabase
+from PyQt5.QtGui import QColor, QFontDatabase, QPainter
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QCheckBox, QComboBox,
-    QSpinBox, QColorDialog, QGroupBox, QFontComboBox, QSlider
+    QSpinBox, QColorDialog, QGroupBox, QFontComboBox, QSlider, QWidget
 )
 
+from core.animation_engine import glyph_transform
+from core.font_glyphs import font_glyph_path
+
+
+class FontPreview(QWidget):
+    """Shows a character in the selected font, using the cached glyph outlines."""
+    
+    def __init__(self, character, parent=None):
+        """Initialize the preview.
+        
+        Args:
+            character (str): Character to show.
+            parent: The parent widget.
+        """
+        super().__init__(parent)
+        self.character = character
+        self.font_family = ""
+        self.setFixedSize(96, 96)
+    
+    def set_font_family(self, font_family):
+        """Show the character in another font.
+        
+        Args:
+            font_family (str): Font family name.
+        """
+        self.font_family = font_family
+        self.update()
+    
+    def paintEvent(self, event):
+        """Draw the glyph outline."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+        if self.font_family:
+            painter.setWorldTransform(glyph_transform(self.width(), self.height()))
+            painter.fillPath(font_glyph_path(self.font_family, self.character), Qt.black)
+
+
 class SettingsDialog(QDialog):
     """Dialog for configuring application settings."""
     
@@ -89,6 +127,13 @@ class SettingsDialog(QDialog):
         font_layout.addWidget(QLabel("Font Size:"), 1, 0)
         font_layout.addLayout(font_size_layout, 1, 1)
         
+        # 字体预览：切换字体时立即显示当前汉字的字形
+        engine = getattr(self.preview_window, 'animation_engine', None)
+        self.font_preview = FontPreview(getattr(engine, 'current_character', '') or "字")
+        self.font_combo.currentTextChanged.connect(self.font_preview.set_font_family)
+        font_layout.addWidget(QLabel("Preview:"), 2, 0)
+        font_layout.addWidget(self.font_preview, 2, 1)
+        
         font_group.setLayout(font_layout)
         layout.addWidget(font_group)
         
@@ -187,6 +232,7 @@ class SettingsDialog(QDialog):
         index = self.font_combo.findText(font_family)
         if index >= 0:
             self.font_combo.setCurrentIndex(index)
+        self.font_preview.set_font_family(self.font_combo.currentText())
         
         # Font size
         font_size = self.config_manager.get("font_size", 400)
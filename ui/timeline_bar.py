@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Timeline bar for the Chinese Character Reading Application.
+Play/pause button and scrubber for the stroke animation.
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QToolButton, QSlider
+
+
+class TimelineBar(QWidget):
+    """Pause, resume and scrub the animation of the current character."""
+
+    def __init__(self, animation_engine, parent=None):
+        """Initialize the bar.
+
+        Args:
+            animation_engine (AnimationEngine): The animation to control.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.animation_engine = animation_engine
+        self.resume_after_drag = False
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.play_button = QToolButton()
+        self.play_button.setFocusPolicy(Qt.NoFocus)
+        self.play_button.setToolTip("Pause / continue (Space), step strokes with Left / Right")
+        self.play_button.clicked.connect(animation_engine.toggle_pause)
+        layout.addWidget(self.play_button)
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setFocusPolicy(Qt.NoFocus)  # 方向键留给翻页
+        self.slider.sliderPressed.connect(self.on_slider_pressed)
+        # 拖动和点击滑槽都会触发 actionTriggered，此时 sliderPosition() 已是新位置
+        self.slider.actionTriggered.connect(
+            lambda action: animation_engine.seek(self.slider.sliderPosition()))
+        self.slider.sliderReleased.connect(self.on_slider_released)
+        layout.addWidget(self.slider)
+
+        animation_engine.position_changed.connect(self.on_position_changed)
+        self.on_position_changed(0, 0)
+
+    def on_position_changed(self, elapsed, duration):
+        """Follow the animation position.
+
+        Args:
+            elapsed (int): Milliseconds played.
+            duration (int): Length of the timeline in milliseconds.
+        """
+        self.play_button.setText("⏸" if self.animation_engine.is_animating else "▶")
+        if self.slider.isSliderDown():
+            return
+        self.slider.setMaximum(duration)
+        self.slider.setValue(elapsed)
+
+    def on_slider_pressed(self):
+        """Hold the animation while the scrubber is dragged."""
+        self.resume_after_drag = self.animation_engine.is_animating
+        self.animation_engine.pause()
+
+    def on_slider_released(self):
+        """Continue playing after a drag if the animation was playing before."""
+        if self.resume_after_drag:
+            self.animation_engine.resume()
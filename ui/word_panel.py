@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Word panel for the Chinese Character Reading Application.
+Shows the 组词 entries of the current character with their pictures.
+"""
+
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
+
+
+class WordCard(QWidget):
+    """A single word with its picture, Chinese name and English meaning."""
+
+    # Emitted with the word when the card is clicked
+    clicked = pyqtSignal(str)
+
+    def __init__(self, word, image_size, parent=None):
+        """Initialize the word card.
+
+        Args:
+            word (dict): Word entry from characters.yaml (name, en, image).
+            image_size (QSize): Size reserved for the picture.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.image_path = word.get('image', '')
+        self.name = word.get('name', '')
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        self.image_label = QLabel()
+        self.image_label.setFixedSize(image_size)
+        self.image_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.image_label, 0, Qt.AlignCenter)
+
+        name_label = QLabel(self.name)
+        name_font = QFont()
+        name_font.setPointSize(20)
+        name_label.setFont(name_font)
+        name_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(name_label)
+
+        en_label = QLabel(word.get('en', ''))
+        en_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(en_label)
+
+    def set_image(self, image):
+        """Show a decoded picture.
+
+        Args:
+            image (QImage): Image already scaled to the display size.
+        """
+        self.image_label.setPixmap(QPixmap.fromImage(image))
+
+    def mouseReleaseEvent(self, event):
+        """Report a click on the card."""
+        if event.button() == Qt.LeftButton and self.name:
+            self.clicked.emit(self.name)
+
+
+class WordPanel(QWidget):
+    """Row of word cards below the character display."""
+
+    # Emitted with the word when one of the cards is clicked
+    word_clicked = pyqtSignal(str)
+
+    def __init__(self, image_cache, parent=None):
+        """Initialize the word panel.
+
+        Args:
+            image_cache (ImageCache): Source of decoded word pictures.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.image_cache = image_cache
+        self.image_cache.image_ready.connect(self.on_image_ready)
+        self.cards = []
+
+        self.card_layout = QHBoxLayout(self)
+        self.card_layout.setContentsMargins(0, 0, 0, 0)
+        self.setVisible(False)
+
+    def set_words(self, words):
+        """Show the words of a character.
+
+        Pictures already in the cache are shown immediately; the others
+        appear when their background decode finishes.
+
+        Args:
+            words (list): Word entries from characters.yaml.
+        """
+        while self.card_layout.count():
+            widget = self.card_layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self.cards = []
+
+        self.card_layout.addStretch()
+        for word in words or []:
+            card = WordCard(word, self.image_cache.display_size, self)
+            card.clicked.connect(self.word_clicked)
+            image = self.image_cache.get(card.image_path)
+            if image is not None:
+                card.set_image(image)
+            self.card_layout.addWidget(card)
+            self.cards.append(card)
+        self.card_layout.addStretch()
+
+    def on_image_ready(self, path):
+        """Show a picture that finished decoding.
+
+        Args:
+            path (str): The image path.
+        """
+        for card in self.cards:
+            if card.image_path == path:
+                image = self.image_cache.get(path)
+                if image is not None:
+                    card.set_image(image)